@@ -32,6 +32,7 @@ setup(
     include_package_data=True,
     zip_safe=False,
     install_requires=[],
+    extras_require={"stats": ["numpy"], "lxml": ["lxml"]},
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Environment :: Console",
@@ -46,5 +47,7 @@ setup(
         "Programming Language :: Python :: 3.8",
     ],
     keywords="",
-    # entry_points={"console_scripts": ["battle_scribe_reader=battle_scribe_reader.__main__:main"]},
+    entry_points={
+        "console_scripts": ["battle_scribe_reader=battle_scribe_reader.__main__:main"]
+    },
 )
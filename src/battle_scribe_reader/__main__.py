@@ -1,24 +1,204 @@
+"""The command line tool.
+
+Only the standard library modules the argument parser needs are imported at
+start up, each command imports what it uses, so scripts calling the tool
+many times only pay for what they run. ``bench startup`` measures this.
+"""
 from __future__ import annotations
 
-import xml.etree.ElementTree
+import argparse
+import os
+import sys
+from typing import TYPE_CHECKING, Any, List, Optional
+
+if TYPE_CHECKING:
+    from .stats import StatTable
+
+_COMPARISONS = (">=", "<=", "!=", "==", "=", ">", "<")
+
+
+def _dump(args: argparse.Namespace) -> None:
+    from .render import render
+    from .tree import Root
+
+    root = Root.load(args.path)
+    render(root, sys.stdout, args.depth, args.types)
+
+
+def _where(table: StatTable, condition: str) -> Any:
+    import operator
+
+    for symbol in _COMPARISONS:
+        column, found, value = condition.partition(symbol)
+        if found:
+            break
+    else:
+        raise SystemExit(f"bad condition {condition!r}, expected e.g. 'T>=4'")
+    column, value = column.strip(), value.strip()
+    if column not in table.columns:
+        columns = ", ".join(table.columns)
+        raise SystemExit(f"no column {column!r} in {table.name}, have: {columns}")
+    compare = {
+        ">=": operator.ge,
+        "<=": operator.le,
+        "!=": operator.ne,
+        "==": operator.eq,
+        "=": operator.eq,
+        ">": operator.gt,
+        "<": operator.lt,
+    }[symbol]
+    try:
+        number = float(value)
+    except ValueError:
+        return compare(table.text[column], value)
+    return compare(table[column], number)
+
+
+def _stats(args: argparse.Namespace) -> None:
+    try:
+        import numpy
+
+        from .stats import load_stats
+    except ImportError as e:
+        raise SystemExit(f"stats needs NumPy, see battle_scribe_reader[stats]: {e}")
+
+    tables = load_stats(args.paths)
+    if args.type is None:
+        for name, table in sorted(tables.items()):
+            print(f"{name}\t{len(table)}\t{', '.join(table.columns)}")
+        return
+    table = tables.get(args.type)
+    if table is None:
+        raise SystemExit(f"no {args.type!r} profiles, have: {', '.join(tables)}")
+    where = numpy.ones(len(table), bool)
+    for condition in args.where:
+        where = where & _where(table, condition)
+    for owner, id, name in table.select(where):
+        print(f"{owner or ''}\t{id}\t{name}")
+
+
+def _query(args: argparse.Namespace) -> None:
+    from .tree import Root
+
+    root = Root.load(args.path)
+    nodes = root.query(args.selector)
+    if args.json:
+        import json
+
+        from .fields import field_values
+
+        json.dump([field_values(node) for node in nodes], sys.stdout, indent=2)
+        print()
+        return
+    for node in nodes:
+        id = getattr(node, "id", None) or ""
+        name = getattr(node, "name", None) or ""
+        print(f"{type(node).__name__}\t{id}\t{name}")
+
+
+def _resolve(args: argparse.Namespace) -> None:
+    from .render import render
+    from .tree import Root
+
+    if args.library:
+        from .library import Library
+
+        library = Library.open(args.library)
+        name = args.path
+        if os.path.isfile(name):
+            name = os.path.splitext(os.path.basename(name))[0]
+        root = library.get(name) or library.find(name)
+        if root is None:
+            raise SystemExit(f"{args.path!r} not found in {args.library}")
+    else:
+        root = Root.load(args.path)
+    node = root.resolve(args.id)
+    if node is None:
+        raise SystemExit(f"{args.id!r} not found")
+    render(node, sys.stdout, args.depth)
+    target_id = getattr(node, "target_id", None)
+    if target_id is not None:
+        target = root.resolve(target_id)
+        if target is None:
+            print(f"-> {target_id!r} not found")
+        else:
+            print(f"-> {target._header()}")
+
+
+def _serve(args: argparse.Namespace) -> None:
+    from .serve import serve
+
+    serve(args.paths, args.host, args.port, args.size)
+
+
+def _bench(args: argparse.Namespace) -> None:
+    from .bench.__main__ import main as bench
+
+    bench(args.args)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="battle_scribe_reader")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    command = commands.add_parser("dump", help="print a catalogue's tree")
+    command.add_argument("path")
+    command.add_argument("--depth", type=int, help="how many levels to print")
+    command.add_argument(
+        "--type", dest="types", action="append", help="only print these node types"
+    )
+    command.set_defaults(func=_dump)
+
+    command = commands.add_parser("stats", help="find profiles by characteristic")
+    command.add_argument("paths", nargs="+")
+    command.add_argument("--type", help="the profile type, lists them if not given")
+    command.add_argument(
+        "--where",
+        action="append",
+        default=[],
+        help="a condition on a characteristic, like 'T>=4' or 'Save=3+'",
+    )
+    command.set_defaults(func=_stats)
+
+    command = commands.add_parser("query", help="print the nodes matching a selector")
+    command.add_argument("path")
+    command.add_argument("selector", help="for example 'selectionEntry[type=unit]'")
+    command.add_argument("--json", action="store_true", help="print fields as JSON")
+    command.set_defaults(func=_query)
+
+    command = commands.add_parser("resolve", help="print the node with an id")
+    command.add_argument("path", help="a file, or an id or name with --library")
+    command.add_argument("id")
+    command.add_argument("--depth", type=int, default=1)
+    command.add_argument(
+        "--library", help="a directory to resolve ids in other catalogues from"
+    )
+    command.set_defaults(func=_resolve)
+
+    command = commands.add_parser("serve", help="answer JSON queries over HTTP")
+    command.add_argument("paths", nargs="+", help="catalogues, or directories")
+    command.add_argument("--host", default="127.0.0.1")
+    command.add_argument("--port", type=int, default=8080)
+    command.add_argument(
+        "--size", type=int, default=8, help="how many catalogues to keep loaded"
+    )
+    command.set_defaults(func=_serve)
 
-from .tree import Root
+    command = commands.add_parser(
+        "bench", help="run the benchmarks", add_help=False, prefix_chars="\0"
+    )
+    command.add_argument("args", nargs=argparse.REMAINDER)
+    command.set_defaults(func=_bench)
 
-e = xml.etree.ElementTree.parse("Chaos - Chaos Space Marines.cat").getroot()
-r = Root(e)
-SPACE = "  "
+    args = parser.parse_args(argv)
+    try:
+        args.func(args)
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # The reader went away, as with ``| head``, so drop the rest quietly.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(1)
 
 
 if __name__ == "__main__":
-    attrs = (
-        "profiles rules info_links cost_types profile_types category_entries force_entries selection_entries "
-        "entry_links shared_selection_entries shared_selection_entries_groups shared_rules shared_profiles"
-    ).split()
-    for a in attrs:
-        obj = getattr(r, a)
-        print(a, len(obj))
-        if obj:
-            for i in obj[0].xml:
-                print("", i)
-
-    print(r)
+    main()
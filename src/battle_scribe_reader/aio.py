@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import asyncio
+import os
+from concurrent.futures import Executor
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from .tree import Root
+
+__all__ = ["AsyncLoader", "load_indexed"]
+
+
+def load_indexed(path: str) -> Root:
+    """Load a document and build its index, so neither blocks later."""
+    root = Root.load(path)
+    root.index
+    return root
+
+
+class AsyncLoader:
+    """Load documents in an executor, without blocking the event loop.
+
+    At most ``limit`` loads run at once. Requests for a path that's already
+    being loaded wait on that load, rather than starting another. A waiter
+    being cancelled doesn't affect the others, and the load itself is
+    cancelled once nobody's waiting on it. Loads already running in the
+    executor can't be interrupted, their results are discarded.
+    """
+
+    executor: Optional[Executor]
+    loader: Callable[[str], Any]
+    _pending: Dict[str, asyncio.Task]
+    _waiters: Dict[str, int]
+
+    def __init__(
+        self,
+        executor: Optional[Executor] = None,
+        limit: int = 4,
+        loader: Callable[[str], Any] = load_indexed,
+    ) -> None:
+        self.executor = executor
+        self.loader = loader
+        self.limit = limit
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._pending = {}
+        self._waiters = {}
+
+    @property
+    def pending(self) -> List[str]:
+        """The paths being loaded, or waiting to be."""
+        return list(self._pending)
+
+    async def _load(self, path: str) -> Any:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.limit)
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, self.loader, path)
+
+    def _done(self, path: str, task: asyncio.Task) -> None:
+        if self._pending.get(path) is task:
+            del self._pending[path]
+            del self._waiters[path]
+
+    async def load(self, path: str) -> Any:
+        """Load ``path``, sharing the load with any other requests for it."""
+        path = os.path.abspath(path)
+        task = self._pending.get(path)
+        if task is None:
+            task = self._pending[path] = asyncio.ensure_future(self._load(path))
+            self._waiters[path] = 0
+            task.add_done_callback(lambda task: self._done(path, task))
+        self._waiters[path] += 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            self._release(path, task)
+
+    def _release(self, path: str, task: asyncio.Task) -> None:
+        if self._pending.get(path) is not task:
+            return
+        self._waiters[path] -= 1
+        if not self._waiters[path] and not task.done():
+            task.cancel()
+
+    async def load_many(self, paths: Iterable[str]) -> List[Any]:
+        """Load every path, with the results in the order of ``paths``."""
+        return await asyncio.gather(*(self.load(path) for path in paths))
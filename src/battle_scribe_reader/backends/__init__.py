@@ -0,0 +1,4 @@
+from .backends import BACKENDS, Backend, available, get_backend
+from .expat import Node
+
+__all__ = ["BACKENDS", "Backend", "Node", "available", "get_backend"]
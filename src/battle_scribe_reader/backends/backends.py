@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import importlib.util
+from typing import IO, Any, Callable, Dict, List
+
+__all__ = ["BACKENDS", "Backend", "available", "get_backend"]
+
+Backend = Callable[[IO[bytes]], Any]
+"""Parse a file into its root element, or something that reads like one.
+
+The tree reads ``tag``, ``text``, ``get``, ``find``, ``findall`` and
+``iterfind`` with child tag paths, and ``iter`` to move game system tags
+into the catalogue namespace.
+"""
+
+
+def _etree(source: IO[bytes]) -> Any:
+    import xml.etree.ElementTree
+
+    return xml.etree.ElementTree.parse(source).getroot()
+
+
+def _expat(source: IO[bytes]) -> Any:
+    from .expat import parse
+
+    return parse(source)
+
+
+def _lxml(source: IO[bytes]) -> Any:
+    from lxml import etree
+
+    parser = etree.XMLParser(
+        remove_blank_text=True, remove_comments=True, remove_pis=True
+    )
+    return etree.parse(source, parser).getroot()
+
+
+BACKENDS: Dict[str, Backend] = {"etree": _etree, "expat": _expat, "lxml": _lxml}
+
+_REQUIRES = {"lxml": "lxml"}
+
+
+def get_backend(name: str) -> Backend:
+    """Get a backend by name. Raises ``ImportError`` if it isn't installed."""
+    backend = BACKENDS.get(name)
+    if backend is None:
+        raise ValueError(f"unknown backend {name!r}, have: {', '.join(BACKENDS)}")
+    module = _REQUIRES.get(name)
+    if module is not None and importlib.util.find_spec(module) is None:
+        raise ImportError(f"the {name} backend needs {module}, install it first")
+    return backend
+
+
+def available() -> List[str]:
+    """Get the names of the backends that can be used here."""
+    return [
+        name
+        for name in BACKENDS
+        if name not in _REQUIRES or importlib.util.find_spec(_REQUIRES[name])
+    ]
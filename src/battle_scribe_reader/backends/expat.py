@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import re
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple
+from xml.parsers.expat import ParserCreate
+
+__all__ = ["Node", "parse"]
+
+_PATH_SEP = re.compile(r"/(?![^{]*})")
+_STEPS: Dict[str, Tuple[str, ...]] = {}
+
+
+def _steps(path: str) -> Tuple[str, ...]:
+    steps = _STEPS.get(path)
+    if steps is None:
+        steps = tuple(step for step in _PATH_SEP.split(path) if step != ".")
+        for step in steps:
+            if not step or step[0] in "[@/" or step == "..":
+                raise SyntaxError(f"unsupported path {path!r}")
+        steps = _STEPS[path] = steps
+    return steps
+
+
+class Node(list):
+    """A compact element, with the part of the ``Element`` API the tree uses.
+
+    The node is the list of its children. Whitespace only text is dropped,
+    and so are tails, comments and processing instructions. Paths are child
+    tags separated by ``/``, with ``*`` for any tag.
+    """
+
+    __slots__ = ("tag", "attrib", "text")
+
+    # Nodes are compared by identity, like elements, not by their children.
+    __eq__ = object.__eq__
+    __ne__ = object.__ne__
+    __hash__ = object.__hash__
+
+    tail = None
+
+    def __init__(self, tag: str, attrib: Dict[str, str]) -> None:
+        self.tag = tag
+        self.attrib = attrib
+        self.text: Optional[str] = None
+
+    def __repr__(self) -> str:
+        return f"<Node {self.tag!r} at {id(self):#x}>"
+
+    def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        return self.attrib.get(key, default)
+
+    def keys(self) -> List[str]:
+        return list(self.attrib)
+
+    def items(self) -> List[Tuple[str, str]]:
+        return list(self.attrib.items())
+
+    def iterfind(self, path: str) -> Iterator[Node]:
+        nodes: List[Node] = [self]
+        for tag in _steps(path):
+            if tag == "*":
+                nodes = [child for node in nodes for child in node]
+            else:
+                nodes = [child for node in nodes for child in node if child.tag == tag]
+        return iter(nodes)
+
+    def findall(self, path: str) -> List[Node]:
+        return list(self.iterfind(path))
+
+    def find(self, path: str) -> Optional[Node]:
+        return next(self.iterfind(path), None)
+
+    def findtext(self, path: str, default: Optional[str] = None) -> Optional[str]:
+        node = self.find(path)
+        if node is None:
+            return default
+        return node.text or ""
+
+    def iter(self, tag: Optional[str] = None) -> Iterator[Node]:
+        """Iterate over this node and its descendants, in document order."""
+        if tag == "*":
+            tag = None
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if tag is None or node.tag == tag:
+                yield node
+            stack.extend(reversed(node))
+
+
+def _qualify(name: str) -> str:
+    # Expat separates namespaces with "}", ElementTree wraps them in "{}".
+    return "{" + name if "}" in name else name
+
+
+def parse(source: IO[bytes]) -> Node:
+    """Parse a document into :class:`Node`\\s with a single expat pass.
+
+    Expat already shares tags and attribute names between nodes, only the
+    ones in a namespace are rewritten, once each. Attribute values that
+    repeat, like ``false`` or a type's id, are shared too.
+    """
+    parser = ParserCreate(namespace_separator="}")
+    parser.buffer_text = True
+    parser.buffer_size = 1 << 16
+    tags: Dict[str, str] = {}
+    plain = set()
+    share = {}.setdefault
+    top: List[Node] = []
+    stack: List[Any] = [top]
+    text: List[str] = []
+
+    def flush() -> None:
+        # Text before a node's first child is its text, later text a tail.
+        node = stack[-1]
+        if not node:
+            value = "".join(text)
+            if value.strip():
+                node.text = value
+        text.clear()
+
+    def start(tag: str, attrib: Dict[str, str]) -> None:
+        if text:
+            flush()
+        if not plain.issuperset(attrib):
+            names = {key: _qualify(key) for key in attrib}
+            plain.update(key for key, name in names.items() if key == name)
+            attrib = {names[key]: value for key, value in attrib.items()}
+        values = attrib.values()
+        attrib = dict(zip(attrib, map(share, values, values)))
+        node = Node(tags.get(tag) or tags.setdefault(tag, _qualify(tag)), attrib)
+        stack[-1].append(node)
+        stack.append(node)
+
+    def end(tag: str) -> None:
+        if text:
+            flush()
+        stack.pop()
+
+    parser.StartElementHandler = start
+    parser.EndElementHandler = end
+    parser.CharacterDataHandler = text.append
+    parser.ParseFile(source)
+    return top[0]
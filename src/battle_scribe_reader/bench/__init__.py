@@ -0,0 +1,5 @@
+from .generate import generate
+from .linkable import bench_linkable
+from .suite import STAGES, run
+
+__all__ = ["STAGES", "bench_linkable", "generate", "run"]
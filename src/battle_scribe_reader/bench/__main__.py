@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+from typing import List, Optional
+
+from . import linkable
+from .backends import bench_backends
+from .generate import generate
+from .startup import startup
+from .suite import run
+
+
+def _run(args: argparse.Namespace) -> None:
+    results = [run(path, args.repeat, args.backend) for path in args.paths]
+    if args.generate is not None:
+        with tempfile.NamedTemporaryFile("w", suffix=".cat", delete=False) as temp:
+            generate(temp, entries=args.generate, depth=args.depth)
+        try:
+            result = run(temp.name, args.repeat, args.backend)
+        finally:
+            os.remove(temp.name)
+        # Name generated files by their shape so runs can be compared.
+        result["path"] = f"generated:{args.generate}x{args.depth}"
+        results.append(result)
+    json.dump(results, args.output, indent=2)
+    args.output.write("\n")
+
+
+def _generate(args: argparse.Namespace) -> None:
+    with open(args.path, "w", encoding="utf-8") as f:
+        generate(
+            f,
+            entries=args.entries,
+            depth=args.depth,
+            children=args.children,
+            seed=args.seed,
+        )
+
+
+def _compare(args: argparse.Namespace) -> None:
+    with open(args.before) as f:
+        before = {r["path"]: r for r in json.load(f)}
+    with open(args.after) as f:
+        after = json.load(f)
+    for result in after:
+        old = before.get(result["path"])
+        if old is None:
+            continue
+        print(result["path"])
+        for name, times in result["stages"].items():
+            if name in old["stages"]:
+                ratio = old["stages"][name]["min"] / times["min"]
+                print(f"  {name:<10} {times['min']:10.4f}s {ratio:6.2f}x")
+
+
+def _linkable(args: argparse.Namespace) -> None:
+    linkable.main(args.paths)
+
+
+def _backends(args: argparse.Namespace) -> None:
+    for path in args.paths:
+        print(path)
+        results = bench_backends(path, args.repeat, args.backends or None)
+        for backend, result in results.items():
+            print(
+                f"  {backend:<6} parse {result['parse']:8.4f}s"
+                f"  walk {result['walk']:8.4f}s"
+                f"  memory {result['memory'] / 2 ** 20:8.1f}MiB"
+            )
+
+
+def _startup(args: argparse.Namespace) -> None:
+    result = startup(args.repeat, args.args or None)
+    for name, seconds in result.items():
+        print(f"  {name:<10} {seconds * 1000:8.1f}ms")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="battle_scribe_reader.bench")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    command = commands.add_parser("run", help="time every stage, output JSON")
+    command.add_argument("paths", nargs="*")
+    command.add_argument("--generate", type=int, metavar="ENTRIES")
+    command.add_argument("--depth", type=int, default=2)
+    command.add_argument("--repeat", type=int, default=5)
+    command.add_argument("--backend", default="etree", help="the parser to use")
+    command.add_argument(
+        "--output", type=argparse.FileType("w"), default=sys.stdout
+    )
+    command.set_defaults(func=_run)
+
+    command = commands.add_parser("generate", help="write a synthetic catalogue")
+    command.add_argument("path")
+    command.add_argument("--entries", type=int, default=100)
+    command.add_argument("--depth", type=int, default=2)
+    command.add_argument("--children", type=int, default=3)
+    command.add_argument("--seed", type=int, default=0)
+    command.set_defaults(func=_generate)
+
+    command = commands.add_parser("compare", help="compare two run outputs")
+    command.add_argument("before")
+    command.add_argument("after")
+    command.set_defaults(func=_compare)
+
+    command = commands.add_parser("linkable", help="per node wrapper costs")
+    command.add_argument("paths", nargs="+")
+    command.set_defaults(func=_linkable)
+
+    command = commands.add_parser("backends", help="compare the parsers")
+    command.add_argument("paths", nargs="+")
+    command.add_argument("--repeat", type=int, default=3)
+    command.add_argument(
+        "--backend", dest="backends", action="append", help="only time these"
+    )
+    command.set_defaults(func=_backends)
+
+    command = commands.add_parser("startup", help="command line start up time")
+    command.add_argument("--repeat", type=int, default=10)
+    command.add_argument("args", nargs=argparse.REMAINDER)
+    command.set_defaults(func=_startup)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
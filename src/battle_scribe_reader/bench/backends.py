@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import gc
+import time
+import tracemalloc
+from typing import Dict, Iterable, Optional
+
+from ..backends import available
+from ..linkable import walk
+from ..source import parse
+from ..tree import Root
+
+__all__ = ["bench_backends"]
+
+
+def bench_backends(
+    path: str, repeat: int = 3, backends: Optional[Iterable[str]] = None
+) -> Dict[str, Dict[str, float]]:
+    """Compare the parser backends on the catalogue at ``path``.
+
+    ``parse`` is the best time to parse the file, ``walk`` the best time to
+    wrap every node and read its links, and ``memory`` the bytes the parsed
+    document holds on to, measured in a separate run.
+    """
+    results = {}
+    for backend in backends if backends is not None else available():
+        best_parse = best_walk = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            element = parse(path, backend)
+            middle = time.perf_counter()
+            sum(1 for _ in walk(Root(element)))
+            end = time.perf_counter()
+            best_parse = min(best_parse, middle - start)
+            best_walk = min(best_walk, end - middle)
+            del element
+        gc.collect()
+        tracemalloc.start()
+        try:
+            element = parse(path, backend)
+            gc.collect()
+            memory = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+        del element
+        results[backend] = {"parse": best_parse, "walk": best_walk, "memory": memory}
+    return results
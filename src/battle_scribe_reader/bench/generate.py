@@ -0,0 +1,296 @@
+from __future__ import annotations
+
+import random
+from typing import IO, Dict, List, Optional
+from xml.sax.saxutils import escape, quoteattr
+
+__all__ = ["generate"]
+
+NAMESPACE = "http://www.battlescribe.net/schema/catalogueSchema"
+_CHARACTERISTICS = ["M", "WS", "BS", "S", "T", "W", "A", "Ld", "Save"]
+_VALUES = ['6"', "3+", "4", "5", "2", "D6", "-", "8", "1"]
+_WORDS = (
+    "the a unit model weapon attack hit wound roll re-roll within range each "
+    "friendly enemy charge phase fight shoot psychic aura objective"
+).split()
+
+
+class _Writer:
+    def __init__(self, stream: IO[str]) -> None:
+        self.stream = stream
+        self.level = 0
+
+    def start(self, tag: str, attrs: Optional[Dict[str, str]] = None) -> None:
+        self._open(tag, attrs, "")
+        self.level += 1
+
+    def end(self, tag: str) -> None:
+        self.level -= 1
+        self.stream.write(f"{'  ' * self.level}</{tag}>\n")
+
+    def empty(self, tag: str, attrs: Optional[Dict[str, str]] = None) -> None:
+        self._open(tag, attrs, "/")
+
+    def text(self, tag: str, text: str) -> None:
+        self.stream.write(f"{'  ' * self.level}<{tag}>{escape(text)}</{tag}>\n")
+
+    def _open(self, tag: str, attrs: Optional[Dict[str, str]], close: str) -> None:
+        attributes = "".join(
+            f" {k}={quoteattr(v)}" for k, v in (attrs or {}).items()
+        )
+        self.stream.write(f"{'  ' * self.level}<{tag}{attributes}{close}>\n")
+
+
+class _Generator:
+    def __init__(self, stream: IO[str], depth: int, children: int, seed: int):
+        self.out = _Writer(stream)
+        self.depth = depth
+        self.children = children
+        self.random = random.Random(seed)
+        self.count = 0
+        self.shared_ids: List[str] = []
+        self.rule_ids: List[str] = []
+
+    def id(self, kind: str) -> str:
+        self.count += 1
+        return f"{kind}-{self.count:x}"
+
+    def flags(self, **extra: str) -> Dict[str, str]:
+        return {"hidden": "false", **extra}
+
+    def scoped(self, **extra: str) -> Dict[str, str]:
+        return {
+            "field": "selections",
+            "scope": self.random.choice(["parent", "force", "roster"]),
+            "value": f"{self.random.randint(0, 5)}.0",
+            "percentValue": "false",
+            "shared": "true",
+            "includeChildSelections": "false",
+            "includeChildForces": "false",
+            **extra,
+        }
+
+    def sentence(self, words: int) -> str:
+        return " ".join(self.random.choice(_WORDS) for _ in range(words))
+
+    def profiles(self) -> None:
+        self.out.start("profiles")
+        self.profile()
+        self.out.end("profiles")
+
+    def profile(self) -> None:
+        id = self.id("profile")
+        self.out.start(
+            "profile",
+            self.flags(
+                id=id,
+                name=f"Profile {id}",
+                profileTypeId="pt-unit",
+                profileTypeName="Unit",
+            ),
+        )
+        self.out.start("characteristics")
+        for i, name in enumerate(_CHARACTERISTICS):
+            self.out.empty(
+                "characteristic",
+                {
+                    "name": name,
+                    "characteristicTypeId": f"ct-{i}",
+                    "value": self.random.choice(_VALUES),
+                },
+            )
+        self.out.end("characteristics")
+        self.out.end("profile")
+
+    def rules(self) -> None:
+        self.out.start("rules")
+        id = self.id("rule")
+        self.rule_ids.append(id)
+        self.out.start("rule", self.flags(id=id, name=f"Rule {id}"))
+        self.out.text("description", self.sentence(30))
+        self.out.end("rule")
+        self.out.end("rules")
+
+    def info_links(self) -> None:
+        if not self.rule_ids:
+            return
+        self.out.start("infoLinks")
+        id = self.id("info")
+        target = self.random.choice(self.rule_ids)
+        self.out.empty(
+            "infoLink",
+            self.flags(id=id, name=f"Info {id}", targetId=target, type="rule"),
+        )
+        self.out.end("infoLinks")
+
+    def modifiers(self, child: str) -> None:
+        self.out.start("modifiers")
+        self.out.start("modifier", {"type": "increment", "field": "pts", "value": "1"})
+        self.out.start("repeats")
+        repeat = self.scoped(childId=child, repeats="1", roundUp="false")
+        self.out.empty("repeat", repeat)
+        self.out.end("repeats")
+        self.out.start("conditions")
+        self.out.empty("condition", self.scoped(childId=child, type="atLeast"))
+        self.out.end("conditions")
+        self.out.start("conditionGroups")
+        self.out.start("conditionGroup", {"type": "or"})
+        self.out.start("conditions")
+        for type in ("lessThan", "equalTo"):
+            self.out.empty("condition", self.scoped(childId=child, type=type))
+        self.out.end("conditions")
+        self.out.end("conditionGroup")
+        self.out.end("conditionGroups")
+        self.out.end("modifier")
+        self.out.end("modifiers")
+
+    def constraints(self) -> None:
+        self.out.start("constraints")
+        for type in ("min", "max"):
+            self.out.empty("constraint", self.scoped(id=self.id("con"), type=type))
+        self.out.end("constraints")
+
+    def category_links(self) -> None:
+        self.out.start("categoryLinks")
+        id = self.id("catlink")
+        self.out.empty(
+            "categoryLink",
+            self.flags(id=id, name="Troops", targetId="cat-troops", primary="true"),
+        )
+        self.out.end("categoryLinks")
+
+    def entry_links(self) -> None:
+        if not self.shared_ids:
+            return
+        self.out.start("entryLinks")
+        for _ in range(self.children):
+            id = self.id("link")
+            self.out.empty(
+                "entryLink",
+                self.flags(
+                    id=id,
+                    name=f"Link {id}",
+                    collective="false",
+                    targetId=self.random.choice(self.shared_ids),
+                    type="selectionEntry",
+                ),
+            )
+        self.out.end("entryLinks")
+
+    def costs(self) -> None:
+        self.out.start("costs")
+        value = f"{self.random.randint(0, 200)}.0"
+        self.out.empty("cost", {"name": "pts", "costTypeId": "pts", "value": value})
+        self.out.end("costs")
+
+    def entry(self, level: int) -> str:
+        id = self.id("entry")
+        type = "unit" if level == 0 else self.random.choice(["model", "upgrade"])
+        self.out.start(
+            "selectionEntry",
+            self.flags(
+                id=id,
+                name=f"Entry {id}",
+                page=str(self.random.randint(1, 200)),
+                collective="false",
+                type=type,
+            ),
+        )
+        self.profiles()
+        self.rules()
+        self.info_links()
+        self.modifiers(self.random.choice(self.shared_ids or [id]))
+        self.constraints()
+        self.category_links()
+        if level < self.depth:
+            self.out.start("selectionEntries")
+            for _ in range(self.children):
+                self.entry(level + 1)
+            self.out.end("selectionEntries")
+            self.out.start("selectionEntryGroups")
+            group = self.id("group")
+            self.out.start(
+                "selectionEntryGroup",
+                self.flags(id=group, name=f"Group {group}", collective="false"),
+            )
+            self.entry_links()
+            self.out.end("selectionEntryGroup")
+            self.out.end("selectionEntryGroups")
+        self.entry_links()
+        self.costs()
+        self.out.end("selectionEntry")
+        return id
+
+    def catalogue(self, entries: int) -> None:
+        self.out.stream.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        self.out.start(
+            "catalogue",
+            {
+                "id": "synthetic",
+                "name": f"Synthetic {entries}x{self.depth}x{self.children}",
+                "revision": "1",
+                "battleScribeVersion": "2.01",
+                "authorName": "battle_scribe_reader",
+                "authorUrl": "",
+                "book": "",
+                "gameSystemId": "synthetic-system",
+                "gameSystemRevision": "1",
+                "xmlns": NAMESPACE,
+            },
+        )
+        self.out.start("profileTypes")
+        self.out.start("profileType", {"id": "pt-unit", "name": "Unit"})
+        self.out.start("characteristicTypes")
+        for i, name in enumerate(_CHARACTERISTICS):
+            self.out.empty("characteristicType", {"id": f"ct-{i}", "name": name})
+        self.out.end("characteristicTypes")
+        self.out.end("profileType")
+        self.out.end("profileTypes")
+        self.out.start("categoryEntries")
+        for name in ("HQ", "Troops"):
+            self.out.empty("categoryEntry", {"id": f"cat-{name.lower()}", "name": name})
+        self.out.end("categoryEntries")
+        self.out.start("forceEntries")
+        self.out.start("forceEntry", self.flags(id="force", name="Detachment"))
+        self.category_links()
+        self.out.end("forceEntry")
+        self.out.end("forceEntries")
+
+        shared = max(1, entries // 2)
+        self.out.start("sharedSelectionEntries")
+        for _ in range(shared):
+            self.shared_ids.append(self.entry(self.depth))
+        self.out.end("sharedSelectionEntries")
+        self.out.start("sharedSelectionEntryGroups")
+        group = self.id("group")
+        self.out.start("selectionEntryGroup", self.flags(id=group, name="Shared"))
+        self.entry_links()
+        self.out.end("selectionEntryGroup")
+        self.out.end("sharedSelectionEntryGroups")
+        self.out.start("sharedProfiles")
+        for _ in range(shared):
+            self.profile()
+        self.out.end("sharedProfiles")
+        self.out.start("selectionEntries")
+        for _ in range(entries - shared):
+            self.entry(0)
+        self.out.end("selectionEntries")
+        self.entry_links()
+        self.out.end("catalogue")
+
+
+def generate(
+    stream: IO[str],
+    entries: int = 100,
+    depth: int = 2,
+    children: int = 3,
+    seed: int = 0,
+) -> None:
+    """Write a valid synthetic catalogue to ``stream``.
+
+    ``entries`` top level selection entries are written, half of them shared,
+    each with ``children`` child entries per level down to ``depth``. Every
+    entry has profiles, rules, modifiers, constraints and links, and links
+    only target ids in the catalogue. The output is the same for a ``seed``.
+    """
+    _Generator(stream, depth, children, seed).catalogue(entries)
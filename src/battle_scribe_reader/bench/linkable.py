@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import sys
+import time
+import xml.etree.ElementTree
+from typing import Dict, List, Optional
+
+from ..linkable import walk
+from ..tree import Root
+
+__all__ = ["bench_linkable"]
+
+
+def bench_linkable(path: str, repeat: int = 5) -> Dict[str, float]:
+    """Time building every wrapper in a catalogue and accessing its links.
+
+    ``build`` is the per-node cost of constructing a wrapper and its first
+    link access, ``cached`` is the per-node cost of a second walk.
+    """
+    element = xml.etree.ElementTree.parse(path).getroot()
+    build = cached = float("inf")
+    nodes = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        root = Root(element)
+        nodes = sum(1 for _ in walk(root))
+        middle = time.perf_counter()
+        sum(1 for _ in walk(root))
+        end = time.perf_counter()
+        build = min(build, middle - start)
+        cached = min(cached, end - middle)
+    return {
+        "nodes": nodes,
+        "build_ns": build / nodes * 1e9,
+        "cached_ns": cached / nodes * 1e9,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    for path in argv if argv is not None else sys.argv[1:]:
+        results = bench_linkable(path)
+        print(
+            f"{path}: {results['nodes']} nodes, "
+            f"build {results['build_ns']:.0f}ns/node, "
+            f"cached {results['cached_ns']:.0f}ns/node"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional, Sequence
+
+__all__ = ["startup"]
+
+
+def _time(argv: Sequence[str], repeat: int) -> List[float]:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(argv, check=True, stdout=subprocess.DEVNULL)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def startup(repeat: int = 10, args: Optional[Sequence[str]] = None) -> Dict[str, float]:
+    """Time starting the command line tool, against starting Python alone.
+
+    ``args`` are passed to the tool, ``--help`` by default, so only the
+    argument parser and the modules it imports are measured.
+    """
+    args = ["--help"] if args is None else list(args)
+    baseline = min(_time([sys.executable, "-c", "pass"], repeat))
+    command = _time([sys.executable, "-m", "battle_scribe_reader", *args], repeat)
+    return {
+        "baseline": baseline,
+        "min": min(command),
+        "mean": sum(command) / len(command),
+        "overhead": min(command) - baseline,
+    }
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import io
+import platform
+import statistics
+import time
+from typing import Any, Callable, Dict, List
+
+from ..linkable import walk
+from ..render import render
+from ..source import parse
+from ..tree import Root
+
+__all__ = ["STAGES", "run"]
+
+
+def _parse(path: str, state: Dict[str, Any]) -> None:
+    state["element"] = parse(path, state["backend"])
+
+
+def _construct(path: str, state: Dict[str, Any]) -> None:
+    state["root"] = root = Root(state["element"])
+    state["nodes"] = sum(1 for _ in walk(root))
+
+
+def _traverse(path: str, state: Dict[str, Any]) -> None:
+    for _ in walk(state["root"]):
+        pass
+
+
+def _render(path: str, state: Dict[str, Any]) -> None:
+    render(state["root"], io.StringIO())
+
+
+def _resolve(path: str, state: Dict[str, Any]) -> None:
+    root = state["root"]
+    root.__dict__.pop("_index", None)
+    for node in walk(root):
+        id = getattr(node, "target_id", None) or getattr(node, "child_id", None)
+        if id is not None:
+            root.resolve(id)
+
+
+# In order, as each stage uses the state left by the ones before it.
+STAGES: Dict[str, Callable[[str, Dict[str, Any]], None]] = {
+    "parse": _parse,
+    "construct": _construct,
+    "traverse": _traverse,
+    "render": _render,
+    "resolve": _resolve,
+}
+
+
+def _summary(times: List[float]) -> Dict[str, float]:
+    return {
+        "min": min(times),
+        "mean": statistics.mean(times),
+        "max": max(times),
+    }
+
+
+def run(path: str, repeat: int = 5, backend: str = "etree") -> Dict[str, Any]:
+    """Time each of :data:`STAGES` on the catalogue at ``path``.
+
+    The result is plain JSON serializable data, with the best, mean and worst
+    time in seconds of each stage over ``repeat`` runs. ``backend`` names
+    the parser, see :mod:`.backends`.
+    """
+    times: Dict[str, List[float]] = {name: [] for name in STAGES}
+    state: Dict[str, Any] = {}
+    for _ in range(repeat):
+        state.clear()
+        state["backend"] = backend
+        for name, stage in STAGES.items():
+            start = time.perf_counter()
+            stage(path, state)
+            times[name].append(time.perf_counter() - start)
+    return {
+        "path": path,
+        "nodes": state["nodes"],
+        "repeat": repeat,
+        "backend": backend,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "stages": {name: _summary(values) for name, values in times.items()},
+    }
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import contextlib
+import functools
+import hashlib
+import marshal
+import mmap
+import os
+from typing import Any, Dict, Optional, Tuple, Type
+
+from . import tree
+from .frozen import Frozen, FrozenRoot, frozen_type
+from .source import file_digest, read_header, write_atomic
+
+__all__ = ["Cache", "dumps", "loads"]
+
+MAGIC = b"BSRC\x01"
+SUFFIX = ".bsc"
+_TYPES: Dict[str, Type[Frozen]] = {}
+
+
+def _frozen_type(name: str) -> Type[Frozen]:
+    frozen = _TYPES.get(name)
+    if frozen is None:
+        cls = getattr(tree, name)
+        if not (isinstance(cls, type) and issubclass(cls, tree.XMLLinkable)):
+            raise ValueError(f"unknown node type {name!r}")
+        frozen = _TYPES[name] = frozen_type(cls)
+    return frozen
+
+
+@functools.lru_cache()
+def _layout() -> str:
+    """Fingerprint the fields and links of every node type's record.
+
+    Entries are decoded positionally, so a renamed, added or reordered field
+    or node type has to key new entries rather than misread old ones.
+    """
+    digest = hashlib.sha256()
+    for name, cls in sorted(vars(tree).items()):
+        if (
+            isinstance(cls, type)
+            and issubclass(cls, tree.XMLLinkable)
+            and cls.__module__ == tree.__name__
+        ):
+            frozen = _frozen_type(name)
+            digest.update(repr((name, frozen._fields, frozen._links)).encode())
+    return digest.hexdigest()
+
+
+def _encode(node: Frozen) -> Tuple[Any, ...]:
+    return (
+        type(node).__name__,
+        tuple(getattr(node, name) for name in node._fields),
+        tuple(tuple(map(_encode, getattr(node, name))) for name in node._links),
+    )
+
+
+def _decode(data: Tuple[Any, ...]) -> Frozen:
+    name, fields, links = data
+    return _frozen_type(name)(
+        *fields, *[tuple(map(_decode, children)) for children in links]
+    )
+
+
+def dumps(root: Frozen) -> bytes:
+    """Serialize a frozen tree into the compact cache format."""
+    return MAGIC + marshal.dumps(_encode(root))
+
+
+def loads(data: bytes) -> Frozen:
+    """Rebuild a frozen tree from :func:`dumps` output."""
+    view = memoryview(data)
+    try:
+        if view[: len(MAGIC)] != MAGIC:
+            raise ValueError("not a compiled catalogue")
+        return _decode(marshal.loads(view[len(MAGIC) :]))
+    finally:
+        view.release()
+
+
+def _remove(path: str) -> None:
+    # Entries are shared between processes, another may have removed it.
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(path)
+
+
+class Cache:
+    """Compiled catalogues stored in ``directory``.
+
+    Entries are keyed on the source's content hash, ``revision``,
+    ``battleScribeVersion`` and the layout of the node types. Loading a
+    source removes any entries for its older contents, and the least
+    recently used entries are removed once the directory grows over
+    ``max_size`` bytes.
+    """
+
+    directory: str
+    max_size: int
+
+    def __init__(self, directory: str, max_size: int = 256 * 2 ** 20) -> None:
+        self.directory = directory
+        self.max_size = max_size
+        os.makedirs(directory, exist_ok=True)
+
+    def key(self, path: str) -> str:
+        header = read_header(path)
+        revision = header.get("revision", "")
+        version = header.get("battleScribeVersion", "")
+        parts = (file_digest(path), revision, version, _layout())
+        key = hashlib.sha256("\0".join(parts).encode("utf-8") + MAGIC)
+        return key.hexdigest()[:32]
+
+    def _prefix(self, path: str) -> str:
+        source = os.path.abspath(path).encode("utf-8")
+        return hashlib.sha256(source).hexdigest()[:16] + "-"
+
+    def _path(self, path: str, key: Optional[str] = None) -> str:
+        if key is None:
+            key = self.key(path)
+        return os.path.join(self.directory, self._prefix(path) + key + SUFFIX)
+
+    def load(self, path: str) -> FrozenRoot:
+        """Load ``path`` from the cache, compiling and storing it on a miss."""
+        cached = self._path(path)
+        root = self._read(cached)
+        if root is None:
+            root = tree.Root.load(path).freeze()
+            self._invalidate(path)
+            write_atomic(cached, dumps(root))
+            self.evict()
+        return root
+
+    def _read(self, cached: str) -> Optional[FrozenRoot]:
+        try:
+            with open(cached, "rb") as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    root = loads(data)
+        except FileNotFoundError:
+            return None
+        except (ValueError, EOFError, TypeError, AttributeError):
+            # Corrupt, or written for node types that no longer exist.
+            _remove(cached)
+            return None
+        # Other processes sharing the directory may have removed it since.
+        with contextlib.suppress(FileNotFoundError):
+            os.utime(cached)
+        return root
+
+    def _entries(self):
+        with os.scandir(self.directory) as entries:
+            return [
+                entry
+                for entry in entries
+                if entry.name.endswith(SUFFIX) and entry.is_file()
+            ]
+
+    def _invalidate(self, path: str) -> None:
+        prefix = self._prefix(path)
+        for entry in self._entries():
+            if entry.name.startswith(prefix):
+                _remove(entry.path)
+
+    def evict(self) -> None:
+        """Remove the least recently used entries until under ``max_size``."""
+        entries = []
+        for entry in self._entries():
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+        entries.sort(reverse=True)
+        total = 0
+        for _, size, path in entries:
+            total += size
+            if total > self.max_size:
+                _remove(path)
+
+    def clear(self) -> None:
+        for entry in self._entries():
+            _remove(entry.path)
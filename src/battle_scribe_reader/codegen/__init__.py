@@ -0,0 +1,17 @@
+from .coverage import missing
+from .emit import Class, attribute_name, classes, generate
+from .schema import SCHEMA, Attr, Child, Schema, Type, read_schema
+
+__all__ = [
+    "SCHEMA",
+    "Attr",
+    "Child",
+    "Class",
+    "Schema",
+    "Type",
+    "attribute_name",
+    "classes",
+    "generate",
+    "missing",
+    "read_schema",
+]
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from typing import List, Optional
+
+from .. import tree
+from .coverage import missing
+from .emit import generate
+from .schema import SCHEMA, read_schema
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="battle_scribe_reader.codegen",
+        description="Generate tree classes from a BattleScribe XSD.",
+    )
+    parser.add_argument("schema", nargs="?", default=SCHEMA)
+    parser.add_argument(
+        "-o", "--output", type=argparse.FileType("w"), default=sys.stdout
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="list what the tree is missing from the schema, instead",
+    )
+    args = parser.parse_args(argv)
+    schema = read_schema(args.schema)
+    if not args.check:
+        args.output.write(generate(schema, os.path.basename(args.schema)))
+        return
+    roots = {element: tree.Root for element in schema.roots}
+    problems = missing(schema, tree, roots)
+    for problem in problems:
+        args.output.write(problem + "\n")
+    if problems:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+from ..fields import Attribute, Field, Text, boolean, field_names
+from ..linkable import Linkable
+from ..tree import split_path
+from .emit import attribute_name, classes, converter
+from .schema import Schema
+
+__all__ = ["missing"]
+
+
+def _local(path: str) -> Tuple[str, ...]:
+    return tuple(tag.rpartition("}")[2] for tag in split_path(path))
+
+
+_CONVERTERS: Dict[str, Callable[[str], Any]] = {
+    "boolean": boolean,
+    "int": int,
+    "float": float,
+}
+
+
+def _fields(cls: Type) -> Dict[str, Tuple[str, Field]]:
+    fields = {}
+    for name in field_names(cls):
+        field = getattr(cls, name)
+        if isinstance(field, Attribute):
+            fields[field.key] = name, field
+        elif isinstance(field, Text):
+            fields[_local(field.path)[-1]] = name, field
+    return fields
+
+
+def _name(convert: Optional[Callable[[str], Any]]) -> str:
+    return "text" if convert is None else convert.__name__
+
+
+def _links(cls: Type[Linkable]) -> Dict[Tuple[str, ...], str]:
+    return {
+        _local(cls._link_schema()[name][2].PATH): name for name in cls._link_names()
+    }
+
+
+def missing(schema: Schema, module: ModuleType, roots: Dict[str, Type]) -> List[str]:
+    """List what ``schema`` has that the classes in ``module`` don't.
+
+    Classes are matched to elements by their ``PATH``, and document elements
+    to the classes in ``roots``. Fields and lists named other than the
+    generated classes would name them are listed too, and so are attributes
+    converted to a different type.
+
+    Only names, paths and converters are compared. What a class adds on
+    top, like :class:`.Root`'s resolving or a ``_header``, isn't checked,
+    and the result is only as complete as ``schema`` itself.
+    """
+    by_path = {}
+    for value in vars(module).values():
+        if isinstance(value, type) and isinstance(getattr(value, "PATH", None), str):
+            by_path.setdefault(_local(value.PATH), value)
+    problems = []
+    for generated in classes(schema):
+        if generated.path:
+            cls = by_path.get(generated.path)
+        else:
+            cls = roots.get(generated.element)
+        where = "/".join(generated.path) or generated.element
+        if cls is None:
+            problems.append(f"{where}: no class")
+            continue
+        fields = _fields(cls)
+        expected = list(generated.type.attributes) + list(generated.type.texts)
+        for item in expected:
+            xml = item if isinstance(item, str) else item.name
+            found = fields.get(xml)
+            if found is None:
+                problems.append(f"{cls.__name__}: no field for {xml!r}")
+                continue
+            name, field = found
+            if name != attribute_name(xml):
+                problems.append(f"{cls.__name__}.{name}: named {attribute_name(xml)}")
+            if isinstance(item, str) or not isinstance(field, Attribute):
+                continue
+            convert = _CONVERTERS.get(converter(item.type) or "")
+            if field.convert is not convert:
+                problems.append(
+                    f"{cls.__name__}.{name}: converts to {_name(field.convert)},"
+                    f" not {_name(convert)}"
+                )
+        links = _links(cls)
+        for child in generated.type.children:
+            name = links.get(child.path)
+            expected_name = attribute_name(child.container or child.element)
+            if name is None:
+                problems.append(f"{cls.__name__}: no list of {'/'.join(child.path)}")
+            elif name != expected_name:
+                problems.append(f"{cls.__name__}.{name}: named {expected_name}")
+    return problems
+
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import keyword
+import re
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from .schema import Schema, Type
+
+__all__ = ["Class", "attribute_name", "classes", "converter", "generate"]
+
+_UPPER = re.compile(r"(?<!^)(?=[A-Z])")
+_RESERVED = {"xml", "root", "PATH"}
+_CONVERT = {
+    "boolean": "boolean",
+    "byte": "int",
+    "int": "int",
+    "integer": "int",
+    "long": "int",
+    "nonNegativeInteger": "int",
+    "positiveInteger": "int",
+    "short": "int",
+    "decimal": "float",
+    "double": "float",
+    "float": "float",
+}
+
+
+def attribute_name(name: str) -> str:
+    """Get the Python name of an XML name, ``targetId`` is ``target_id``."""
+    name = _UPPER.sub("_", name).lower()
+    if keyword.iskeyword(name) or name in _RESERVED:
+        name += "_"
+    return name
+
+
+def converter(type: str) -> Optional[str]:
+    """Get the name of the function converting values of an XSD type."""
+    return _CONVERT.get(type)
+
+
+def _class_name(name: str) -> str:
+    return name[:1].upper() + name[1:]
+
+
+def _singular(name: str) -> str:
+    if name.endswith("ies"):
+        return name[:-3] + "y"
+    if name.endswith("s"):
+        return name[:-1]
+    return name
+
+
+class Class(NamedTuple):
+    """A class to generate, for ``element`` elements of ``type``.
+
+    ``path`` is the container and element names below the parent, and empty
+    for document elements.
+    """
+
+    name: str
+    element: str
+    path: Tuple[str, ...]
+    type: Type
+
+
+def classes(schema: Schema) -> List[Class]:
+    """Name a class per element path and type, document elements first.
+
+    Elements are named after their tag, unless their container is named
+    otherwise, so ``sharedRules/rule`` is ``SharedRule`` and ``rules/rule``
+    is ``Rule``.
+    """
+    found: Dict[Tuple[Tuple[str, ...], str], Class] = {}
+    names = set()
+
+    def add(
+        name: str, element: str, path: Tuple[str, ...], type: Type
+    ) -> Optional[Class]:
+        if (path, type.name) in found:
+            return None
+        unique, number = name, 2
+        while unique in names:
+            unique, number = f"{name}{number}", number + 1
+        names.add(unique)
+        cls = found[path, type.name] = Class(unique, element, path, type)
+        return cls
+
+    queue = []
+    for element, type in schema.roots.items():
+        queue.append(add(_class_name(element), element, (), schema.types[type]))
+    for cls in queue:
+        for child in cls.type.children:
+            name = child.element
+            if child.container and _singular(child.container) != child.element:
+                name = _singular(child.container)
+            type = schema.types[child.type]
+            added = add(_class_name(name), child.element, child.path, type)
+            if added is not None:
+                queue.append(added)
+    return list(found.values())
+
+
+def _path(path: Tuple[str, ...]) -> str:
+    return "/".join(f"{{NS}}{tag}" for tag in path)
+
+
+def generate(
+    schema: Schema,
+    source: str = "the schema",
+    base: str = "battle_scribe_reader.xml_linkable",
+) -> str:
+    """Write a module of :class:`.XMLLinkable` classes for ``schema``.
+
+    Each class has its ``PATH``, an :class:`.Attribute` per attribute,
+    converted to ``bool``, ``int`` or ``float`` by its XSD type, a
+    :class:`.Text` per text child and a list per child element.
+    ``XMLLinkable`` is imported from ``base``.
+
+    Document elements get plain classes too: they have none of
+    :class:`.Root`'s loading, indexing or resolving, and their nodes'
+    ``root`` is unset.
+    """
+    generated = classes(schema)
+    by_path = {(cls.path, cls.type.name): cls.name for cls in generated}
+    used = set()
+    body_lines: List[str] = []
+    for cls in generated:
+        body_lines += ["", "", f"class {cls.name}(XMLLinkable):"]
+        body = []
+        if cls.path:
+            body += [f'PATH = f"{_path(cls.path)}"', ""]
+        links = [
+            f"{attribute_name(child.container or child.element)}: "
+            f"List[{by_path[child.path, child.type]}]"
+            for child in cls.type.children
+        ]
+        if links:
+            used.add("List")
+            body += links + [""]
+        for attribute in cls.type.attributes:
+            used.add("Attribute")
+            convert = converter(attribute.type)
+            if convert == "boolean":
+                used.add("boolean")
+            arguments = f'"{attribute.name}"' + (f", {convert}" if convert else "")
+            body.append(f"{attribute_name(attribute.name)} = Attribute({arguments})")
+        for text in cls.type.texts:
+            used.add("Text")
+            body.append(f'{attribute_name(text)} = Text(f"{_path((text,))}")')
+        while body and not body[-1]:
+            body.pop()
+        body_lines += [f"    {line}" if line else "" for line in body or ["pass"]]
+
+    lines = [
+        f'"""Generated from {source} by battle_scribe_reader.codegen."""',
+        "from __future__ import annotations",
+        "",
+    ]
+    if "List" in used:
+        lines += ["from typing import List", ""]
+    fields = [name for name in ("Attribute", "Text", "boolean") if name in used]
+    if fields:
+        lines.append(f"from battle_scribe_reader.fields import {', '.join(fields)}")
+    lines += [f"from {base} import XMLLinkable", "", f'NS = "{schema.namespace}"']
+    return "\n".join(lines + body_lines) + "\n"
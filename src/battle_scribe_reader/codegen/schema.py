@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import os
+from typing import IO, Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
+from xml.etree.ElementTree import Element, parse
+
+__all__ = ["SCHEMA", "Attr", "Child", "Schema", "Type", "read_schema"]
+
+XS = "{http://www.w3.org/2001/XMLSchema}"
+# The schema :mod:`battle_scribe_reader.generated` is generated from.
+SCHEMA = os.path.join(os.path.dirname(__file__), "catalogue.xsd")
+
+
+class Attr(NamedTuple):
+    """An XML attribute, with the XSD type its value reduces to."""
+
+    name: str
+    type: str
+
+
+class Child(NamedTuple):
+    """A list of child elements, ``element`` in ``container`` if given."""
+
+    container: Optional[str]
+    element: str
+    type: str
+
+    @property
+    def path(self) -> Tuple[str, ...]:
+        if self.container is None:
+            return (self.element,)
+        return (self.container, self.element)
+
+
+class Type(NamedTuple):
+    """An element type: its attributes, text children and lists of children."""
+
+    name: str
+    attributes: Tuple[Attr, ...]
+    texts: Tuple[str, ...]
+    children: Tuple[Child, ...]
+
+
+class Schema(NamedTuple):
+    """The element types of a schema, and the document elements' types."""
+
+    namespace: str
+    roots: Dict[str, str]
+    types: Dict[str, Type]
+
+
+def _local(name: str) -> str:
+    return name.rpartition(":")[2]
+
+
+def _declared(element: Element) -> Iterator[Element]:
+    """Yield the elements, attributes and groups declared directly in a type."""
+    for child in element:
+        if child.tag in (f"{XS}element", f"{XS}attribute", f"{XS}attributeGroup"):
+            yield child
+        elif child.tag != f"{XS}annotation":
+            yield from _declared(child)
+
+
+class _Reader:
+    def __init__(self, xml: Element) -> None:
+        self.complex: Dict[str, Element] = {}
+        self.simple: Dict[str, Element] = {}
+        self.groups: Dict[str, Element] = {}
+        for child in xml:
+            name = child.get("name")
+            if child.tag == f"{XS}complexType":
+                self.complex[name] = child
+            elif child.tag == f"{XS}simpleType":
+                self.simple[name] = child
+            elif child.tag == f"{XS}attributeGroup":
+                self.groups[name] = child
+        self.types: Dict[str, Type] = {}
+        self._reading: List[str] = []
+
+    def simple_type(self, name: Optional[str]) -> str:
+        """Reduce a type to the XSD built in type it restricts."""
+        seen = set()
+        while name is not None and not name.startswith("xs:"):
+            element = self.simple.get(_local(name))
+            if element is None or name in seen:
+                break
+            seen.add(name)
+            restriction = element.find(f"{XS}restriction")
+            name = None if restriction is None else restriction.get("base")
+        return _local(name) if name else "string"
+
+    def complex_type(self, element: Element) -> Optional[Element]:
+        """Get an element declaration's complex type, if it has one."""
+        inline = element.find(f"{XS}complexType")
+        if inline is not None:
+            return inline
+        type = element.get("type")
+        return None if type is None else self.complex.get(_local(type))
+
+    def container(self, complex: Element) -> Optional[Element]:
+        """Get the repeated element if ``complex`` only wraps a list of it."""
+        members = list(_declared(complex))
+        if len(members) != 1 or members[0].tag != f"{XS}element":
+            return None
+        if members[0].get("maxOccurs") != "unbounded":
+            return None
+        return members[0]
+
+    def read(self, name: str, complex: Element) -> str:
+        """Read the complex type ``complex``, as ``name`` if it's anonymous."""
+        name = complex.get("name") or name
+        if name in self.types or name in self._reading:
+            return name
+        self._reading.append(name)
+        attributes: Dict[str, Attr] = {}
+        texts: List[str] = []
+        children: Dict[Tuple[str, ...], Child] = {}
+        self._members(complex, attributes, texts, children)
+        self._reading.pop()
+        self.types[name] = Type(
+            name, tuple(attributes.values()), tuple(texts), tuple(children.values())
+        )
+        return name
+
+    def _members(
+        self,
+        element: Element,
+        attributes: Dict[str, Attr],
+        texts: List[str],
+        children: Dict[Tuple[str, ...], Child],
+    ) -> None:
+        for child in element:
+            tag = child.tag
+            if tag in (f"{XS}sequence", f"{XS}choice", f"{XS}all"):
+                self._members(child, attributes, texts, children)
+            elif tag in (f"{XS}complexContent", f"{XS}simpleContent"):
+                self._members(child, attributes, texts, children)
+            elif tag in (f"{XS}extension", f"{XS}restriction"):
+                base = self.complex.get(_local(child.get("base", "")))
+                if base is not None:
+                    self._members(base, attributes, texts, children)
+                self._members(child, attributes, texts, children)
+            elif tag == f"{XS}attributeGroup":
+                group = self.groups.get(_local(child.get("ref", "")))
+                if group is not None:
+                    self._members(group, attributes, texts, children)
+            elif tag == f"{XS}attribute" and child.get("name"):
+                type = self.simple_type(child.get("type"))
+                attributes[child.get("name")] = Attr(child.get("name"), type)
+            elif tag == f"{XS}element":
+                self._element(child, texts, children)
+
+    def _element(
+        self,
+        element: Element,
+        texts: List[str],
+        children: Dict[Tuple[str, ...], Child],
+    ) -> None:
+        name = element.get("name") or _local(element.get("ref", ""))
+        complex = self.complex_type(element)
+        if complex is None:
+            texts.append(name)
+            return
+        item = self.container(complex)
+        if item is None:
+            child = Child(None, name, self.read(name, complex))
+        else:
+            item_name = item.get("name")
+            item_complex = self.complex_type(item)
+            if item_complex is None:
+                texts.append(name)
+                return
+            child = Child(name, item_name, self.read(item_name, item_complex))
+        children.setdefault(child.path, child)
+
+
+def read_schema(source: Union[str, IO[bytes]]) -> Schema:
+    """Read the element types of an XSD.
+
+    Only what the tree needs is read: named and anonymous complex types,
+    extensions of them, attribute groups and simple types restricting the
+    built in types. An element wrapping a repeated element, like
+    ``<rules><rule/>...</rules>``, is a list of that element.
+    """
+    xml = parse(source).getroot()
+    reader = _Reader(xml)
+    roots = {}
+    for element in xml.iterfind(f"{XS}element"):
+        complex = reader.complex_type(element)
+        if complex is not None:
+            roots[element.get("name")] = reader.read(element.get("name"), complex)
+    namespace = xml.get("targetNamespace")
+    return Schema(f"{{{namespace}}}" if namespace else "", roots, reader.types)
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+__all__ = ["Effective", "Expander"]
+
+_MERGED = ("profiles", "rules", "info_links", "modifiers", "constraints")
+_CHILDREN = ("selection_entries", "selection_entry_groups", "entry_links")
+
+
+def _list(node: Any, name: str) -> Tuple[Any, ...]:
+    return tuple(getattr(node, name, None) or ())
+
+
+class Effective(NamedTuple):
+    """An entry with its links followed, as it is offered for selection.
+
+    ``entry`` is the selection entry, or group, that was linked to, and
+    ``link`` the entry link followed to it, if any. The link's modifiers,
+    constraints and other children come after the entry's own. ``children``
+    are shared between every link to the same entry.
+    """
+
+    entry: Any
+    link: Any
+    profiles: Tuple[Any, ...]
+    rules: Tuple[Any, ...]
+    info_links: Tuple[Any, ...]
+    modifiers: Tuple[Any, ...]
+    constraints: Tuple[Any, ...]
+    category_links: Tuple[Any, ...]
+    children: Tuple[Effective, ...]
+
+    @property
+    def id(self) -> Optional[str]:
+        """The id selections use for this step: the link's, if linked."""
+        return (self.link if self.link is not None else self.entry).id
+
+    @property
+    def name(self) -> Optional[str]:
+        return self.entry.name
+
+    @property
+    def hidden(self) -> bool:
+        return bool(self.entry.hidden or getattr(self.link, "hidden", False))
+
+    def walk(self) -> Iterator[Tuple[Tuple[str, ...], Effective]]:
+        """Iterate over ``(path, entry)`` below and including this entry.
+
+        Paths are the ids of each step, as in a selection's ``entryId``.
+        """
+        stack: List[Tuple[Tuple[str, ...], Effective]] = [((self.id,), self)]
+        while stack:
+            path, node = stack.pop()
+            yield path, node
+            stack.extend((path + (c.id,), c) for c in reversed(node.children))
+
+
+class Expander:
+    """Expand entry links into :class:`Effective` entries.
+
+    Each entry is expanded once, the first time it is reached, and reused
+    by every link to it. ``root`` is anything with a ``resolve(id)`` method,
+    so both wrapped and frozen trees can be expanded. Links that lead back
+    to an entry being expanded raise ``ValueError``.
+    """
+
+    root: Any
+    _expanded: Dict[str, Effective]
+    _active: List[str]
+
+    def __init__(self, root: Any) -> None:
+        self.root = root
+        self._expanded = {}
+        self._active = []
+
+    def __len__(self) -> int:
+        return len(self._expanded)
+
+    def entries(self) -> List[Effective]:
+        """Expand the root's selection entries and entry links."""
+        return [self.expand(node) for node in self._children(self.root)]
+
+    def get(self, id: str) -> Optional[Effective]:
+        """Expand the entry, or follow the link, with ``id``."""
+        node = self.root.resolve(id)
+        return None if node is None else self.expand(node)
+
+    def expand(self, node: Any) -> Effective:
+        target_id = getattr(node, "target_id", None)
+        if target_id is None:
+            return self._entry(node)
+        target = self.root.resolve(target_id)
+        if target is None:
+            raise ValueError(f"{node.id} links to unknown id {target_id}")
+        entry = self._entry(target)
+        merged = [getattr(entry, name) + _list(node, name) for name in _MERGED]
+        categories = entry.category_links + _list(node, "category_links")
+        return Effective(target, node, *merged, categories, entry.children)
+
+    def _entry(self, node: Any) -> Effective:
+        id = node.id
+        cached = self._expanded.get(id)
+        if cached is not None:
+            return cached
+        if id in self._active:
+            cycle = " -> ".join(self._active[self._active.index(id) :] + [id])
+            raise ValueError(f"entry link cycle: {cycle}")
+        self._active.append(id)
+        try:
+            children = tuple(self.expand(c) for c in self._children(node))
+        finally:
+            self._active.pop()
+        merged = [_list(node, name) for name in _MERGED]
+        categories = _list(node, "category_links")
+        effective = Effective(node, None, *merged, categories, children)
+        self._expanded[id] = effective
+        return effective
+
+    @staticmethod
+    def _children(node: Any) -> Iterator[Any]:
+        for name in _CHILDREN:
+            yield from _list(node, name)
@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import csv
+import marshal
+import os
+import re
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from xml.etree.ElementTree import Element
+
+from .source import write_atomic
+from .tree import ProfileType, Root
+
+__all__ = [
+    "ColumnarWriter",
+    "DelimitedWriter",
+    "Table",
+    "export",
+    "read_columnar",
+    "rows",
+]
+
+MAGIC = b"BSRT\x01"
+FIXED = ("id", "name", "owner")
+_UNSAFE = re.compile(r"[^\w.-]+")
+
+Row = List[Optional[str]]
+
+
+def _local(tag: str) -> str:
+    return tag.rpartition("}")[2]
+
+
+def _value(characteristic: Element) -> Optional[str]:
+    value = characteristic.get("value")
+    return characteristic.text if value is None else value
+
+
+class Table:
+    """The columns of one profile type.
+
+    Characteristic type ids are mapped to column positions once, so rows
+    are filled in without looking names up.
+    """
+
+    id: str
+    name: str
+    columns: List[str]
+    positions: Dict[str, int]
+
+    def __init__(self, id: str, name: Optional[str]) -> None:
+        self.id = id
+        self.name = name or id
+        self.columns = list(FIXED)
+        self.positions = {}
+
+    def add(self, id: Optional[str], name: Optional[str]) -> None:
+        key = id or name or ""
+        if key not in self.positions:
+            self.positions[key] = len(self.columns)
+            self.columns.append(name or key)
+
+    @classmethod
+    def from_xml(cls, xml: Element) -> Table:
+        table = cls(xml.get("id"), xml.get("name"))
+        for child in xml.iter():
+            if _local(child.tag) == "characteristicType":
+                table.add(child.get("id"), child.get("name"))
+        return table
+
+    def row(self, profile: Element, owner: Optional[str]) -> Row:
+        row: Row = [None] * len(self.columns)
+        row[0], row[1], row[2] = profile.get("id"), profile.get("name"), owner
+        positions = self.positions
+        for characteristics in profile:
+            if _local(characteristics.tag) != "characteristics":
+                continue
+            for characteristic in characteristics:
+                key = characteristic.get("characteristicTypeId")
+                position = positions.get(key or characteristic.get("name", ""))
+                if position is not None:
+                    row[position] = _value(characteristic)
+        return row
+
+
+def _profiles(xml: Element) -> Iterator[Tuple[Element, Optional[str]]]:
+    stack: List[Tuple[Element, Optional[str]]] = [(xml, None)]
+    while stack:
+        element, owner = stack.pop()
+        tag = _local(element.tag)
+        if tag == "profile":
+            yield element, owner
+            continue
+        if tag == "selectionEntry":
+            owner = element.get("id")
+        stack.extend((child, owner) for child in reversed(element))
+
+
+def _guess(profile: Element) -> Table:
+    table = Table(profile.get("profileTypeId"), profile.get("profileTypeName"))
+    for child in profile.iter():
+        if _local(child.tag) == "characteristic":
+            table.add(child.get("characteristicTypeId"), child.get("name"))
+    return table
+
+
+def rows(
+    source: Union[str, IO[bytes]], profile_types: Iterable[ProfileType] = ()
+) -> Iterator[Tuple[Table, Row]]:
+    """Stream the profiles of a document as rows of their profile type.
+
+    Rows are ``id``, ``name`` and ``owner``, the id of the nearest selection
+    entry, then one column per characteristic type. ``profile_types`` adds
+    types defined elsewhere, such as in the game system. A profile of an
+    unknown type makes a table from its own characteristics.
+    """
+    tables = {t.id: Table.from_xml(t.xml) for t in profile_types}
+    for node in Root.stream(source):
+        if isinstance(node, ProfileType):
+            tables[node.xml.get("id")] = Table.from_xml(node.xml)
+            continue
+        for profile, owner in _profiles(node.xml):
+            type_id = profile.get("profileTypeId")
+            table = tables.get(type_id)
+            if table is None:
+                table = tables[type_id] = _guess(profile)
+            yield table, table.row(profile, owner)
+
+
+class DelimitedWriter:
+    """Write each table to its own CSV, or TSV, file in ``directory``."""
+
+    def __init__(self, directory: str, delimiter: str = ",") -> None:
+        self.directory = directory
+        self.delimiter = delimiter
+        self.suffix = ".tsv" if delimiter == "\t" else ".csv"
+        self.paths: Dict[str, str] = {}
+        self._files: Dict[str, IO[str]] = {}
+        self._writers: Dict[str, Any] = {}
+        os.makedirs(directory, exist_ok=True)
+
+    def write(self, table: Table, row: Row) -> None:
+        writer = self._writers.get(table.id)
+        if writer is None:
+            name = _UNSAFE.sub("_", table.name) + self.suffix
+            path = self.paths[table.id] = os.path.join(self.directory, name)
+            f = self._files[table.id] = open(path, "w", newline="", encoding="utf-8")
+            writer = self._writers[table.id] = csv.writer(f, delimiter=self.delimiter)
+            writer.writerow(table.columns)
+        writer.writerow(row)
+
+    def close(self) -> None:
+        for f in self._files.values():
+            f.close()
+        self._files.clear()
+        self._writers.clear()
+
+
+class ColumnarWriter:
+    """Write every table to one file, stored column by column.
+
+    Columns are gathered as rows arrive and written with marshal on
+    :meth:`close`, so they load without parsing any text.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._tables: Dict[str, Tuple[Table, List[List[Optional[str]]]]] = {}
+
+    def write(self, table: Table, row: Row) -> None:
+        entry = self._tables.get(table.id)
+        if entry is None:
+            entry = self._tables[table.id] = table, [[] for _ in table.columns]
+        for column, value in zip(entry[1], row):
+            column.append(value)
+
+    def close(self) -> None:
+        data = {
+            table.name: dict(zip(table.columns, map(tuple, columns)))
+            for table, columns in self._tables.values()
+        }
+        write_atomic(self.path, MAGIC + marshal.dumps(data))
+
+
+def read_columnar(path: str) -> Dict[str, Dict[str, Tuple[Optional[str], ...]]]:
+    """Load the tables written by :class:`ColumnarWriter`, by name."""
+    with open(path, "rb") as f:
+        data = f.read()
+    if data[: len(MAGIC)] != MAGIC:
+        raise ValueError("not a columnar export")
+    return marshal.loads(data[len(MAGIC) :])
+
+
+def export(
+    source: Union[str, IO[bytes]],
+    writer: Union[DelimitedWriter, ColumnarWriter],
+    profile_types: Iterable[ProfileType] = (),
+) -> int:
+    """Write the profiles of ``source`` with ``writer`` in a single pass.
+
+    Returns the number of rows written.
+    """
+    count = 0
+    for table, row in rows(source, profile_types):
+        writer.write(table, row)
+        count += 1
+    writer.close()
+    return count
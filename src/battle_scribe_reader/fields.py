@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional, Type
+from xml.etree.ElementTree import Element
+
+__all__ = ["Field", "Attribute", "Text", "boolean", "field_names", "field_values"]
+
+_BOOL: Dict[str, bool] = {"true": True, "false": False}
+
+
+def boolean(value: str) -> bool:
+    return _BOOL[value]
+
+
+class Field(ABC):
+    """Read a value from a node's element on first access.
+
+    The value is cached in the instance's ``__dict__``, which shadows this
+    non-data descriptor, so later accesses are plain attribute lookups.
+    """
+
+    name: str
+
+    def __set_name__(self, owner: Type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: Any, owner: Type) -> Any:
+        if instance is None:
+            return self
+        value = instance.__dict__[self.name] = self.read(instance.xml)
+        return value
+
+    @abstractmethod
+    def read(self, xml: Element) -> Any:
+        """Read the value from ``xml``."""
+        raise NotImplementedError
+
+
+def field_names(cls: Type) -> List[str]:
+    """Get the names of the fields of ``cls`` and its bases, bases first."""
+    names: List[str] = []
+    for base in reversed(cls.__mro__):
+        for name, value in vars(base).items():
+            if isinstance(value, Field) and name not in names:
+                names.append(name)
+    return names
+
+
+def field_values(node: Any) -> Dict[str, Any]:
+    """Get ``node``'s class name, as ``type``, and the values of its fields.
+
+    A field named ``type`` replaces the class name.
+    """
+    values: Dict[str, Any] = {"type": type(node).__name__}
+    for name in field_names(type(node)):
+        values[name] = getattr(node, name)
+    return values
+
+
+class Attribute(Field):
+    """An XML attribute, passed through ``convert`` when given.
+
+    Missing attributes, and empty ones that need converting, are ``default``.
+    """
+
+    key: str
+    convert: Optional[Callable[[str], Any]]
+    default: Any
+
+    def __init__(
+        self,
+        key: str,
+        convert: Optional[Callable[[str], Any]] = None,
+        default: Any = None,
+    ) -> None:
+        self.key = key
+        self.convert = convert
+        self.default = default
+
+    def read(self, xml: Element) -> Any:
+        value = xml.get(self.key)
+        if value is None or (not value and self.convert is not None):
+            return self.default
+        if self.convert is None:
+            return value
+        return self.convert(value)
+
+    def __repr__(self) -> str:
+        return f"Attribute({self.key!r})"
+
+
+class Text(Field):
+    """The text of the child element at ``path``, or ``default`` if missing."""
+
+    path: str
+    default: Any
+
+    def __init__(self, path: str, default: Any = None) -> None:
+        self.path = path
+        self.default = default
+
+    def read(self, xml: Element) -> Any:
+        element = xml.find(self.path)
+        if element is None:
+            return self.default
+        return element.text
+
+    def __repr__(self) -> str:
+        return f"Text({self.path!r})"
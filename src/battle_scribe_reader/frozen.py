@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import io
+from typing import Any, Callable, Dict, Optional, Tuple, Type
+
+from .fields import field_names
+from .index import Index
+from .linkable import Linkable
+from .render import render
+
+__all__ = ["Frozen", "FrozenRoot", "freeze", "frozen_type"]
+
+_TYPES: Dict[Type[Linkable], Type[Frozen]] = {}
+
+
+class Frozen:
+    """An immutable ``__slots__`` record of a node's converted fields.
+
+    Records keep the attribute names of the node they were made from, with
+    linked lists stored as tuples of records.
+    """
+
+    __slots__ = ()
+    _fields: Tuple[str, ...] = ()
+    _links: Tuple[str, ...] = ()
+    _source: Optional[Type[Linkable]] = None
+
+    def __init__(self, *values: Any) -> None:
+        set_ = object.__setattr__
+        for name, value in zip(self._fields + self._links, values):
+            set_(self, name, value)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is frozen")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is frozen")
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{k}={getattr(self, k)!r}" for k in self._fields)
+        return f"{type(self).__name__}({fields})"
+
+    def __str__(self) -> str:
+        stream = io.StringIO()
+        render(self, stream)
+        return stream.getvalue()[:-1]
+
+    def _header(self) -> str:
+        return ""
+
+    def get_lists(self) -> Dict[str, Tuple[Frozen, ...]]:
+        return {key: getattr(self, key) for key in self._links}
+
+
+class FrozenRoot(Frozen):
+    __slots__ = ("_index",)
+
+    @property
+    def index(self) -> Index:
+        try:
+            return self._index
+        except AttributeError:
+            index = Index(self, key=lambda node: getattr(node, "id", None))
+            object.__setattr__(self, "_index", index)
+            return index
+
+    def resolve(self, id: str) -> Optional[Frozen]:
+        return self.index.resolve(id)
+
+
+def _init(names: Tuple[str, ...]) -> Callable[..., None]:
+    # Unrolled, like dataclasses, as records are built in bulk when loading.
+    lines = [f"    set_(self, {name!r}, {name})" for name in names] or ["    pass"]
+    source = f"def __init__(self, {', '.join(names)}):\n" + "\n".join(lines)
+    namespace = {"set_": object.__setattr__}
+    exec(source, namespace)
+    return namespace["__init__"]
+
+
+def frozen_type(cls: Type[Linkable]) -> Type[Frozen]:
+    """Get the record type for the node type ``cls``."""
+    frozen = _TYPES.get(cls)
+    if frozen is None:
+        fields = tuple(field_names(cls))
+        links = cls._link_names()
+        base = FrozenRoot if hasattr(cls, "resolve") else Frozen
+        frozen = _TYPES[cls] = type(
+            cls.__name__,
+            (base,),
+            {
+                "__slots__": fields + links,
+                "__module__": __name__,
+                "__init__": _init(fields + links),
+                "_fields": fields,
+                "_links": links,
+                "_source": cls,
+                "_header": cls._header,
+            },
+        )
+    return frozen
+
+
+def freeze(node: Linkable) -> Frozen:
+    """Convert ``node`` and all its children into immutable records.
+
+    The records hold no reference to the ``Element`` tree, so it can be
+    garbage collected once the nodes are no longer used. Values that don't
+    convert raise, rather than freezing, and being cached, as ``None``.
+    """
+    cls = frozen_type(type(node))
+    return cls(
+        *[getattr(node, name) for name in cls._fields],
+        *[tuple(map(freeze, getattr(node, name))) for name in cls._links],
+    )
@@ -0,0 +1,378 @@
+"""Generated from catalogue.xsd by battle_scribe_reader.codegen."""
+from __future__ import annotations
+
+from typing import List
+
+from battle_scribe_reader.fields import Attribute, Text, boolean
+from battle_scribe_reader.xml_linkable import XMLLinkable
+
+NS = "{http://www.battlescribe.net/schema/catalogueSchema}"
+
+
+class Catalogue(XMLLinkable):
+    profile_types: List[ProfileType]
+    cost_types: List[CostType]
+    category_entries: List[CategoryEntry]
+    force_entries: List[ForceEntry]
+    selection_entries: List[SelectionEntry]
+    entry_links: List[EntryLink]
+    rules: List[Rule]
+    info_links: List[InfoLink]
+    profiles: List[Profile]
+    shared_selection_entries: List[SharedSelectionEntry]
+    shared_selection_entry_groups: List[SharedSelectionEntryGroup]
+    shared_rules: List[SharedRule]
+    shared_profiles: List[SharedProfile]
+    catalogue_links: List[CatalogueLink]
+
+    id = Attribute("id")
+    name = Attribute("name")
+    book = Attribute("book")
+    revision = Attribute("revision", int)
+    battle_scribe_version = Attribute("battleScribeVersion")
+    author_name = Attribute("authorName")
+    author_contact = Attribute("authorContact")
+    author_url = Attribute("authorUrl")
+    library = Attribute("library", boolean)
+    game_system_id = Attribute("gameSystemId")
+    game_system_revision = Attribute("gameSystemRevision", int)
+
+
+class ProfileType(XMLLinkable):
+    PATH = f"{NS}profileTypes/{NS}profileType"
+
+    characteristic_types: List[CharacteristicType]
+
+    id = Attribute("id")
+    name = Attribute("name")
+
+
+class CostType(XMLLinkable):
+    PATH = f"{NS}costTypes/{NS}costType"
+
+    id = Attribute("id")
+    name = Attribute("name")
+    default_cost_limit = Attribute("defaultCostLimit", float)
+    hidden = Attribute("hidden", boolean)
+
+
+class CategoryEntry(XMLLinkable):
+    PATH = f"{NS}categoryEntries/{NS}categoryEntry"
+
+    profiles: List[Profile]
+    rules: List[Rule]
+    info_links: List[InfoLink]
+    modifiers: List[Modifier]
+    constraints: List[Constraint]
+
+    id = Attribute("id")
+    name = Attribute("name")
+    hidden = Attribute("hidden", boolean)
+
+
+class ForceEntry(XMLLinkable):
+    PATH = f"{NS}forceEntries/{NS}forceEntry"
+
+    profiles: List[Profile]
+    rules: List[Rule]
+    info_links: List[InfoLink]
+    modifiers: List[Modifier]
+    constraints: List[Constraint]
+    force_entries: List[ForceEntry]
+    category_links: List[CategoryLink]
+
+    id = Attribute("id")
+    name = Attribute("name")
+    hidden = Attribute("hidden", boolean)
+
+
+class SelectionEntry(XMLLinkable):
+    PATH = f"{NS}selectionEntries/{NS}selectionEntry"
+
+    profiles: List[Profile]
+    rules: List[Rule]
+    info_links: List[InfoLink]
+    modifiers: List[Modifier]
+    constraints: List[Constraint]
+    category_links: List[CategoryLink]
+    selection_entries: List[SelectionEntry]
+    selection_entry_groups: List[SelectionEntryGroup]
+    entry_links: List[EntryLink]
+    costs: List[Cost]
+
+    id = Attribute("id")
+    name = Attribute("name")
+    hidden = Attribute("hidden", boolean)
+    collective = Attribute("collective", boolean)
+    type = Attribute("type")
+    page = Attribute("page", int)
+
+
+class EntryLink(XMLLinkable):
+    PATH = f"{NS}entryLinks/{NS}entryLink"
+
+    profiles: List[Profile]
+    rules: List[Rule]
+    info_links: List[InfoLink]
+    modifiers: List[Modifier]
+    constraints: List[Constraint]
+    category_links: List[CategoryLink]
+
+    id = Attribute("id")
+    name = Attribute("name")
+    hidden = Attribute("hidden", boolean)
+    target_id = Attribute("targetId")
+    type = Attribute("type")
+    collective = Attribute("collective", boolean)
+
+
+class Rule(XMLLinkable):
+    PATH = f"{NS}rules/{NS}rule"
+
+    profiles: List[Profile]
+    rules: List[Rule]
+    info_links: List[InfoLink]
+    modifiers: List[Modifier]
+    constraints: List[Constraint]
+
+    id = Attribute("id")
+    name = Attribute("name")
+    hidden = Attribute("hidden", boolean)
+    description = Text(f"{NS}description")
+
+
+class InfoLink(XMLLinkable):
+    PATH = f"{NS}infoLinks/{NS}infoLink"
+
+    profiles: List[Profile]
+    rules: List[Rule]
+    info_links: List[InfoLink]
+    modifiers: List[Modifier]
+
+    id = Attribute("id")
+    name = Attribute("name")
+    hidden = Attribute("hidden", boolean)
+    target_id = Attribute("targetId")
+    type = Attribute("type")
+
+
+class Profile(XMLLinkable):
+    PATH = f"{NS}profiles/{NS}profile"
+
+    profiles: List[Profile]
+    rules: List[Rule]
+    info_links: List[InfoLink]
+    modifiers: List[Modifier]
+    characteristics: List[Characteristic]
+
+    id = Attribute("id")
+    name = Attribute("name")
+    hidden = Attribute("hidden", boolean)
+    profile_type_id = Attribute("profileTypeId")
+    profile_type_name = Attribute("profileTypeName")
+
+
+class SharedSelectionEntry(XMLLinkable):
+    PATH = f"{NS}sharedSelectionEntries/{NS}selectionEntry"
+
+    profiles: List[Profile]
+    rules: List[Rule]
+    info_links: List[InfoLink]
+    modifiers: List[Modifier]
+    constraints: List[Constraint]
+    category_links: List[CategoryLink]
+    selection_entries: List[SelectionEntry]
+    selection_entry_groups: List[SelectionEntryGroup]
+    entry_links: List[EntryLink]
+    costs: List[Cost]
+
+    id = Attribute("id")
+    name = Attribute("name")
+    hidden = Attribute("hidden", boolean)
+    collective = Attribute("collective", boolean)
+    type = Attribute("type")
+    page = Attribute("page", int)
+
+
+class SharedSelectionEntryGroup(XMLLinkable):
+    PATH = f"{NS}sharedSelectionEntryGroups/{NS}selectionEntryGroup"
+
+    profiles: List[Profile]
+    rules: List[Rule]
+    info_links: List[InfoLink]
+    modifiers: List[Modifier]
+    constraints: List[Constraint]
+    category_links: List[CategoryLink]
+    selection_entries: List[SelectionEntry]
+    selection_entry_groups: List[SelectionEntryGroup]
+    entry_links: List[EntryLink]
+
+    id = Attribute("id")
+    name = Attribute("name")
+    hidden = Attribute("hidden", boolean)
+    collective = Attribute("collective", boolean)
+    default_selection_entry_id = Attribute("defaultSelectionEntryId")
+
+
+class SharedRule(XMLLinkable):
+    PATH = f"{NS}sharedRules/{NS}rule"
+
+    profiles: List[Profile]
+    rules: List[Rule]
+    info_links: List[InfoLink]
+    modifiers: List[Modifier]
+    constraints: List[Constraint]
+
+    id = Attribute("id")
+    name = Attribute("name")
+    hidden = Attribute("hidden", boolean)
+    description = Text(f"{NS}description")
+
+
+class SharedProfile(XMLLinkable):
+    PATH = f"{NS}sharedProfiles/{NS}profile"
+
+    profiles: List[Profile]
+    rules: List[Rule]
+    info_links: List[InfoLink]
+    modifiers: List[Modifier]
+    characteristics: List[Characteristic]
+
+    id = Attribute("id")
+    name = Attribute("name")
+    hidden = Attribute("hidden", boolean)
+    profile_type_id = Attribute("profileTypeId")
+    profile_type_name = Attribute("profileTypeName")
+
+
+class CatalogueLink(XMLLinkable):
+    PATH = f"{NS}catalogueLinks/{NS}catalogueLink"
+
+    id = Attribute("id")
+    name = Attribute("name")
+    target_id = Attribute("targetId")
+    type = Attribute("type")
+    import_root_entries = Attribute("importRootEntries", boolean)
+
+
+class CharacteristicType(XMLLinkable):
+    PATH = f"{NS}characteristicTypes/{NS}characteristicType"
+
+    id = Attribute("id")
+    name = Attribute("name")
+
+
+class Modifier(XMLLinkable):
+    PATH = f"{NS}modifiers/{NS}modifier"
+
+    repeats: List[Repeat]
+    conditions: List[Condition]
+    condition_groups: List[ConditionGroup]
+
+    type = Attribute("type")
+    field = Attribute("field")
+    value = Attribute("value")
+
+
+class Constraint(XMLLinkable):
+    PATH = f"{NS}constraints/{NS}constraint"
+
+    field = Attribute("field")
+    scope = Attribute("scope")
+    value = Attribute("value", float)
+    percent_value = Attribute("percentValue", boolean)
+    shared = Attribute("shared", boolean)
+    include_child_selections = Attribute("includeChildSelections", boolean)
+    include_child_forces = Attribute("includeChildForces", boolean)
+    id = Attribute("id")
+    type = Attribute("type")
+
+
+class CategoryLink(XMLLinkable):
+    PATH = f"{NS}categoryLinks/{NS}categoryLink"
+
+    profiles: List[Profile]
+    rules: List[Rule]
+    info_links: List[InfoLink]
+    modifiers: List[Modifier]
+    constraints: List[Constraint]
+
+    id = Attribute("id")
+    name = Attribute("name")
+    hidden = Attribute("hidden", boolean)
+    target_id = Attribute("targetId")
+    primary = Attribute("primary", boolean)
+
+
+class SelectionEntryGroup(XMLLinkable):
+    PATH = f"{NS}selectionEntryGroups/{NS}selectionEntryGroup"
+
+    profiles: List[Profile]
+    rules: List[Rule]
+    info_links: List[InfoLink]
+    modifiers: List[Modifier]
+    constraints: List[Constraint]
+    category_links: List[CategoryLink]
+    selection_entries: List[SelectionEntry]
+    selection_entry_groups: List[SelectionEntryGroup]
+    entry_links: List[EntryLink]
+
+    id = Attribute("id")
+    name = Attribute("name")
+    hidden = Attribute("hidden", boolean)
+    collective = Attribute("collective", boolean)
+    default_selection_entry_id = Attribute("defaultSelectionEntryId")
+
+
+class Cost(XMLLinkable):
+    PATH = f"{NS}costs/{NS}cost"
+
+    name = Attribute("name")
+    cost_type_id = Attribute("costTypeId")
+    value = Attribute("value", float)
+
+
+class Characteristic(XMLLinkable):
+    PATH = f"{NS}characteristics/{NS}characteristic"
+
+    name = Attribute("name")
+    characteristic_type_id = Attribute("characteristicTypeId")
+    value = Attribute("value")
+
+
+class Repeat(XMLLinkable):
+    PATH = f"{NS}repeats/{NS}repeat"
+
+    field = Attribute("field")
+    scope = Attribute("scope")
+    value = Attribute("value", float)
+    percent_value = Attribute("percentValue", boolean)
+    shared = Attribute("shared", boolean)
+    include_child_selections = Attribute("includeChildSelections", boolean)
+    include_child_forces = Attribute("includeChildForces", boolean)
+    child_id = Attribute("childId")
+    repeats = Attribute("repeats", int)
+    round_up = Attribute("roundUp", boolean)
+
+
+class Condition(XMLLinkable):
+    PATH = f"{NS}conditions/{NS}condition"
+
+    field = Attribute("field")
+    scope = Attribute("scope")
+    value = Attribute("value", float)
+    percent_value = Attribute("percentValue", boolean)
+    shared = Attribute("shared", boolean)
+    include_child_selections = Attribute("includeChildSelections", boolean)
+    include_child_forces = Attribute("includeChildForces", boolean)
+    child_id = Attribute("childId")
+    type = Attribute("type")
+
+
+class ConditionGroup(XMLLinkable):
+    PATH = f"{NS}conditionGroups/{NS}conditionGroup"
+
+    conditions: List[Condition]
+    condition_groups: List[ConditionGroup]
+
+    type = Attribute("type")
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .linkable import Linkable, walk
+
+__all__ = ["Index", "Tags"]
+
+
+def _xml_id(node: Linkable) -> Optional[str]:
+    return node.xml.get("id")
+
+
+def _xml_tag(node: Linkable) -> str:
+    return node.xml.tag.rpartition("}")[2]
+
+
+def _xml_attribute(node: Linkable, name: str) -> Optional[str]:
+    return node.xml.get(name)
+
+
+class Index:
+    """Map the ids in a document to their nodes.
+
+    The index is built in a single walk over the document, so resolving
+    every link in a document is linear rather than a walk per link.
+    """
+
+    ids: Dict[str, Linkable]
+
+    def __init__(
+        self,
+        root: Linkable,
+        key: Callable[[Linkable], Optional[str]] = _xml_id,
+    ) -> None:
+        self.ids = {}
+        for node in walk(root):
+            id = key(node)
+            if id is not None and id not in self.ids:
+                self.ids[id] = node
+
+    def __contains__(self, id: str) -> bool:
+        return id in self.ids
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def resolve(self, id: str) -> Optional[Linkable]:
+        return self.ids.get(id)
+
+
+class Tags:
+    """Map the tags in a document to their nodes, in document order.
+
+    Nodes also know their parent and position, and the nodes of a tag are
+    grouped by the value of an attribute the first time it's looked up.
+    """
+
+    nodes: List[Linkable]
+    tags: Dict[str, List[Linkable]]
+    parents: Dict[int, Linkable]
+    positions: Dict[int, int]
+    _values: Dict[Tuple[str, str], Dict[Optional[str], List[Linkable]]]
+
+    def __init__(
+        self,
+        root: Linkable,
+        tag: Callable[[Linkable], str] = _xml_tag,
+        attribute: Callable[[Linkable, str], Optional[str]] = _xml_attribute,
+    ) -> None:
+        self.tag = tag
+        self.attribute = attribute
+        self.nodes = []
+        self.tags = {}
+        self.parents = {}
+        self.positions = {}
+        self._values = {}
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            self.positions[id(node)] = len(self.nodes)
+            self.nodes.append(node)
+            self.tags.setdefault(tag(node), []).append(node)
+            for children in reversed(list(node.get_lists().values())):
+                for child in reversed(children):
+                    self.parents[id(child)] = node
+                    stack.append(child)
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def parent(self, node: Linkable) -> Optional[Linkable]:
+        return self.parents.get(id(node))
+
+    def get(self, tag: str) -> List[Linkable]:
+        """Get the nodes with ``tag``, or every node for ``*``."""
+        if tag == "*":
+            return self.nodes
+        return self.tags.get(tag, [])
+
+    def values(self, tag: str, name: str) -> Dict[Optional[str], List[Linkable]]:
+        """Group the nodes with ``tag`` by their attribute ``name``."""
+        values = self._values.get((tag, name))
+        if values is None:
+            values = self._values[tag, name] = {}
+            for node in self.get(tag):
+                values.setdefault(self.attribute(node, name), []).append(node)
+        return values
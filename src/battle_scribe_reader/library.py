@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import os
+from collections import deque
+from typing import Deque, Dict, Iterable, List, NamedTuple, Optional, Set
+
+from .repository import find
+from .source import parse, read_header
+from .tree import BS, Root, XMLLinkable
+
+__all__ = ["Header", "Library"]
+
+_GAME_SYSTEM = (".gst", ".gstz")
+
+
+class Header(NamedTuple):
+    path: str
+    id: str
+    name: Optional[str]
+    revision: Optional[str]
+    game_system_id: Optional[str]
+
+    @property
+    def game_system(self) -> bool:
+        return self.path.lower().endswith(_GAME_SYSTEM)
+
+
+class Library:
+    """A game system and its catalogues, parsed the first time they're needed.
+
+    Only each file's root element is read up front. A file is parsed when
+    it's asked for, or when an id is resolved through it. Ids that aren't in
+    a document are looked for in its game system, then in the catalogues it
+    links to, and in theirs in turn. Every catalogue of a system shares the
+    one parsed game system.
+    """
+
+    headers: Dict[str, Header]
+    _roots: Dict[str, Root]
+
+    def __init__(self, paths: Iterable[str]) -> None:
+        self.headers = {}
+        self._roots = {}
+        for path in paths:
+            attrib = read_header(path)
+            id = attrib.get("id")
+            if id is None or id in self.headers:
+                continue
+            self.headers[id] = Header(
+                path,
+                id,
+                attrib.get("name"),
+                attrib.get("revision"),
+                attrib.get("gameSystemId"),
+            )
+
+    @classmethod
+    def open(cls, directory: str) -> Library:
+        """Make a library of the catalogues and game systems in ``directory``."""
+        return cls(find(directory))
+
+    def __contains__(self, id: str) -> bool:
+        return id in self.headers
+
+    def __len__(self) -> int:
+        return len(self.headers)
+
+    @property
+    def loaded(self) -> List[str]:
+        """The ids of the files that have been parsed so far."""
+        return list(self._roots)
+
+    def get(self, id: str) -> Optional[Root]:
+        """Get the catalogue or game system ``id``, parsing it on first use."""
+        root = self._roots.get(id)
+        if root is None:
+            header = self.headers.get(id)
+            if header is None:
+                return None
+            root = self._roots[id] = Root(parse(header.path), self)
+        return root
+
+    def find(self, name: str) -> Optional[Root]:
+        """Get a catalogue or game system by its name, or file name."""
+        for header in self.headers.values():
+            file = os.path.splitext(os.path.basename(header.path))[0]
+            if name in (header.name, file):
+                return self.get(header.id)
+        return None
+
+    def dependencies(self, root: Root) -> List[str]:
+        """Get the ids of the files ``root`` links to, game system first."""
+        ids = [root.game_system_id] if root.game_system_id else []
+        for link in root.xml.iterfind(f"{BS}catalogueLinks/{BS}catalogueLink"):
+            ids.append(link.get("targetId"))
+        return [id for id in ids if id in self.headers]
+
+    def resolve(self, id: str, origin: Root) -> Optional[XMLLinkable]:
+        """Find ``id`` in the files ``origin`` depends on.
+
+        Files are searched breadth first, and only parsed when the ones
+        before them don't have the id.
+        """
+        seen: Set[str] = {origin.id or ""}
+        queue: Deque[Root] = deque([origin])
+        while queue:
+            for dependency in self.dependencies(queue.popleft()):
+                if dependency in seen:
+                    continue
+                seen.add(dependency)
+                root = self.get(dependency)
+                node = root.index.resolve(id)
+                if node is not None:
+                    return node
+                queue.append(root)
+        return None
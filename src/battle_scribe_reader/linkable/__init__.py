@@ -1,3 +1,3 @@
-from .linkable import Linkable
+from .linkable import Link, Linkable, walk
 
-__all__ = ["Linkable"]
+__all__ = ["Link", "Linkable", "walk"]
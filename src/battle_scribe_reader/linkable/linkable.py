@@ -2,13 +2,23 @@ from __future__ import annotations
 
 import functools
 import importlib
-from typing import Any, Dict, Optional, Tuple, Type, TypeVar, get_type_hints
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    get_type_hints,
+)
 
 from ..typed import Typed, typed
 
-__all__ = ["Linkable"]
+__all__ = ["Linkable", "Link", "walk"]
 
 T = TypeVar("T")
+Schema = Dict[str, Tuple[Type, Typed, Optional[Type]]]
 
 
 class Import:
@@ -22,8 +32,39 @@ class Import:
         return cls.module_globals(obj.__module__)
 
 
+class Link:
+    """Build a linked attribute on first access and cache it on the instance.
+
+    As this is a non-data descriptor the cached value in the instance's
+    ``__dict__`` shadows it, so only the first access goes through here.
+    """
+
+    name: str
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: Optional[Linkable], owner: Type[Linkable]) -> Any:
+        raw, t, link = owner._link_schema().get(self.name, (None, None, None))
+        if link is None:
+            raise AttributeError(self.name)
+        if instance is None:
+            return self
+        value = instance.__dict__[self.name] = link._build_link(
+            instance, self.name, raw, t, link
+        )
+        return value
+
+    def __repr__(self) -> str:
+        return f"Link({self.name!r})"
+
+
 class Linkable:
-    __attrs: Optional[Dict[str, Tuple[Type, Typed, Optional[Type]]]] = None
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        for name in cls.__dict__.get("__annotations__", {}):
+            if name not in cls.__dict__:
+                setattr(cls, name, Link(name))
 
     @staticmethod
     def _build_link(
@@ -31,38 +72,44 @@ class Linkable:
     ) -> T:
         return raw()
 
-    def __build_attrs(self):
-        # To prevent infinite recursion with __getattr__
-        self.__attrs = ...
-        globalns = Import.class_globals(type(self))
-        self.__attrs: Dict[str, Tuple[Type, Typed, Optional[Type]]] = {}
-        type_hints = get_type_hints(self, globalns=globalns)
-        for k, v in type_hints.items():
-            t = typed(v)
-            l = next(
-                (
-                    i.type
-                    for i in [t] + t.arguments + t.parameters
-                    if issubclass(i.type, Linkable)
-                ),
-                None,
-            )
-            self.__attrs[k] = v, t, l
+    @classmethod
+    def _link_schema(cls) -> Schema:
+        schema = cls.__dict__.get("_Linkable__schema")
+        if schema is None:
+            schema = {}
+            # As locals, so bases from other modules still resolve their own
+            # annotations in their module's globals.
+            localns = Import.class_globals(cls)
+            for k, v in get_type_hints(cls, localns=localns).items():
+                t = typed(v)
+                l = next(
+                    (
+                        i.type
+                        for i in [t] + t.arguments + t.parameters
+                        if isinstance(i.type, type) and issubclass(i.type, Linkable)
+                    ),
+                    None,
+                )
+                schema[k] = v, t, l
+            cls.__schema = schema
+            cls.__links = tuple(k for k, (_, _, l) in schema.items() if l is not None)
+        return schema
+
+    @classmethod
+    def _link_names(cls) -> Tuple[str, ...]:
+        if "_Linkable__links" not in cls.__dict__:
+            cls._link_schema()
+        return cls.__links
 
     def get_lists(self):
-        if self.__attrs is None:
-            self.__build_attrs()
-        return {
-            key: getattr(self, key)
-            for key, (_, _, link) in self.__attrs.items()
-            if link is not None
-        }
-
-    def __getattr__(self, item):
-        if self.__attrs is None:
-            self.__build_attrs()
-
-        raw, t, link = self.__attrs.get(item, (None, None, None))
-        if link is not None:
-            setattr(self, item, link._build_link(self, item, raw, t, link))
-        return super().__getattribute__(item)
+        return {key: getattr(self, key) for key in self._link_names()}
+
+
+def walk(root: Linkable) -> Iterator[Linkable]:
+    """Iterate over ``root`` and all its linked children in document order."""
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        yield node
+        for children in reversed(list(node.get_lists().values())):
+            stack.extend(reversed(children))
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import math
+import operator
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from .linkable import Linkable
+
+__all__ = [
+    "Compiled",
+    "Context",
+    "Engine",
+    "Query",
+    "compile_condition",
+    "compile_modifier",
+]
+
+Predicate = Callable[["Context"], bool]
+
+_COMPARE: Dict[str, Callable[[float, float], bool]] = {
+    "lessThan": operator.lt,
+    "greaterThan": operator.gt,
+    "equalTo": operator.eq,
+    "notEqualTo": operator.ne,
+    "atLeast": operator.ge,
+    "atMost": operator.le,
+}
+_INSTANCE = {"instanceOf": True, "notInstanceOf": False}
+_GROUPS = {"and": all, "or": any}
+
+
+class Query(NamedTuple):
+    """What a condition or repeat counts, converted once when compiling."""
+
+    scope: str
+    child_id: Optional[str]
+    field: str
+    include_child_selections: bool
+    include_child_forces: bool
+    shared: bool
+    percent: bool
+
+
+class Context(ABC):
+    """The roster state that compiled modifiers are evaluated against.
+
+    Queries are hashable so implementations can memoize their answers.
+    """
+
+    @abstractmethod
+    def count(self, query: Query) -> float:
+        """Get the value of ``query.field`` for ``query.child_id`` in scope."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def instance_of(self, query: Query) -> bool:
+        """Check if ``query.scope`` is an instance of ``query.child_id``."""
+        raise NotImplementedError
+
+
+class Compiled(NamedTuple):
+    field: str
+    apply: Callable[[Context, Any], Any]
+
+
+def _query(node: Linkable) -> Query:
+    return Query(
+        node.scope,
+        node.child_id,
+        node.field,
+        bool(node.include_child_selections),
+        bool(node.include_child_forces),
+        # Queries are shared unless they say otherwise.
+        node.shared is not False,
+        bool(node.percent_value),
+    )
+
+
+def _literal(value: Optional[str]) -> Any:
+    if value in ("true", "false"):
+        return value == "true"
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return value
+
+
+def _all(predicates: List[Predicate]) -> Optional[Predicate]:
+    if not predicates:
+        return None
+    if len(predicates) == 1:
+        return predicates[0]
+    return lambda context: all(p(context) for p in predicates)
+
+
+def compile_condition(node: Linkable) -> Predicate:
+    """Compile a ``Condition`` into a predicate over a :class:`Context`."""
+    query = _query(node)
+    if node.type in _INSTANCE:
+        expected = _INSTANCE[node.type]
+        return lambda context: context.instance_of(query) is expected
+    compare = _COMPARE.get(node.type)
+    if compare is None:
+        raise ValueError(f"unknown condition type {node.type!r}")
+    value = float(node.value)
+    return lambda context: compare(context.count(query), value)
+
+
+def _compile_group(node: Linkable) -> Predicate:
+    combine = _GROUPS.get(node.type)
+    if combine is None:
+        raise ValueError(f"unknown condition group type {node.type!r}")
+    predicates = [compile_condition(c) for c in node.conditions]
+    predicates += [_compile_group(g) for g in node.condition_groups]
+    return lambda context: combine(p(context) for p in predicates)
+
+
+def _compile_repeat(node: Linkable) -> Callable[[Context], int]:
+    query = _query(node)
+    value = float(node.value)
+    repeats = node.repeats or 1
+    round_ = math.ceil if node.round_up else math.floor
+    if not value:
+        return lambda context: 0
+    return lambda context: int(round_(context.count(query) / value)) * repeats
+
+
+def _operation(type: str, text: Optional[str]) -> Callable[[Any, int], Any]:
+    value = _literal(text)
+    if type == "set":
+        return lambda current, times: value
+    if type == "increment":
+        return lambda current, times: (current or 0) + value * times
+    if type == "decrement":
+        return lambda current, times: (current or 0) - value * times
+    if type == "multiply":
+        return lambda current, times: (current or 0) * value ** times
+    if type == "append":
+        return lambda current, times: " ".join(
+            part for part in [current, *[text] * times] if part
+        )
+    if type == "add":
+        return lambda current, times: frozenset(current or ()) | {text}
+    if type == "remove":
+        return lambda current, times: frozenset(current or ()) - {text}
+    raise ValueError(f"unknown modifier type {type!r}")
+
+
+def compile_modifier(node: Linkable) -> Compiled:
+    """Compile a ``Modifier`` and its conditions and repeats once.
+
+    The result's ``apply(context, value)`` returns ``value`` modified, when
+    all the conditions and condition groups hold. With repeats the change is
+    made once per repeat, and not at all if nothing repeats.
+    """
+    operation = _operation(node.type, node.value)
+    predicate = _all(
+        [compile_condition(c) for c in node.conditions]
+        + [_compile_group(g) for g in node.condition_groups]
+    )
+    repeats = [_compile_repeat(r) for r in node.repeats]
+
+    def apply(context: Context, value: Any) -> Any:
+        if predicate is not None and not predicate(context):
+            return value
+        times = sum(r(context) for r in repeats) if repeats else 1
+        if not times:
+            return value
+        return operation(value, times)
+
+    return Compiled(node.field, apply)
+
+
+class Engine:
+    """Compile each modifier once, and apply them many times.
+
+    Compiled modifiers are kept for the lifetime of the engine, along with
+    the nodes they were compiled from.
+    """
+
+    _compiled: Dict[int, Tuple[Linkable, Compiled]]
+    _fields: Dict[int, Tuple[Linkable, Dict[str, List[Compiled]]]]
+
+    def __init__(self) -> None:
+        self._compiled = {}
+        self._fields = {}
+
+    def compile(self, modifier: Linkable) -> Compiled:
+        cached = self._compiled.get(id(modifier))
+        if cached is None:
+            cached = self._compiled[id(modifier)] = modifier, compile_modifier(modifier)
+        return cached[1]
+
+    def fields(self, node: Linkable) -> Dict[str, List[Compiled]]:
+        """Get the compiled modifiers of ``node`` grouped by field."""
+        cached = self._fields.get(id(node))
+        if cached is None:
+            fields: Dict[str, List[Compiled]] = {}
+            for modifier in node.modifiers:
+                compiled = self.compile(modifier)
+                fields.setdefault(compiled.field, []).append(compiled)
+            cached = self._fields[id(node)] = node, fields
+        return cached[1]
+
+    def apply(self, node: Linkable, field: str, value: Any, context: Context) -> Any:
+        """Apply the modifiers of ``node`` on ``field``, in document order."""
+        for compiled in self.fields(node).get(field, ()):
+            value = compiled.apply(context, value)
+        return value
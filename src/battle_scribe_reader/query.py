@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import functools
+import re
+from typing import Callable, Dict, List, NamedTuple, Optional, Set, Tuple
+
+from .index import Tags
+from .linkable import Linkable
+
+__all__ = ["Selector", "Step", "compile"]
+
+_TOKEN = re.compile(
+    r"""
+    \s*(?P<combinator>[>,])\s*
+    | (?P<space>\s+)
+    | (?P<tag>[\w-]+|\*)
+    | \[\s*(?P<name>[\w:-]+)\s*
+      (?:(?P<op>[!^$*]?=)\s*(?P<value>"[^"]*"|'[^']*'|[^\]\s]*)\s*)?\]
+    """,
+    re.VERBOSE,
+)
+_OPERATORS: Dict[str, Callable[[Optional[str], str], bool]] = {
+    "": lambda actual, value: actual is not None,
+    "=": lambda actual, value: actual == value,
+    "!=": lambda actual, value: actual != value,
+    "^=": lambda actual, value: actual is not None and actual.startswith(value),
+    "$=": lambda actual, value: actual is not None and actual.endswith(value),
+    "*=": lambda actual, value: actual is not None and value in actual,
+}
+
+
+class Test(NamedTuple):
+    name: str
+    op: str
+    value: str
+
+
+class Step(NamedTuple):
+    """A tag and its attribute tests, and how it relates to the step before.
+
+    ``child`` is true for ``>``, and false for any ancestor.
+    """
+
+    tag: str
+    tests: Tuple[Test, ...]
+    child: bool
+
+
+class Selector:
+    """A compiled selector, run against the :class:`~.index.Tags` of a root.
+
+    Each step's candidates are looked up in the tag index, or by an
+    attribute's value when the step tests one for equality. A candidate
+    matches if its parent, or for a descendant step any ancestor, matched
+    the step before.
+    """
+
+    source: str
+    alternatives: Tuple[Tuple[Step, ...], ...]
+
+    def __init__(self, source: str, alternatives: Tuple[Tuple[Step, ...], ...]):
+        self.source = source
+        self.alternatives = alternatives
+
+    def __repr__(self) -> str:
+        return f"Selector({self.source!r})"
+
+    def __call__(self, tags: Tags) -> List[Linkable]:
+        found: Dict[int, Linkable] = {}
+        for steps in self.alternatives:
+            for node in self._select(tags, steps):
+                found[id(node)] = node
+        if len(self.alternatives) == 1:
+            return list(found.values())
+        return sorted(found.values(), key=lambda node: tags.positions[id(node)])
+
+    def _select(self, tags: Tags, steps: Tuple[Step, ...]) -> List[Linkable]:
+        matched: Optional[Set[int]] = None
+        for step in steps:
+            nodes = [
+                node
+                for node in self._candidates(tags, step)
+                if self._match(tags, node, step)
+                and (matched is None or self._below(tags, node, matched, step.child))
+            ]
+            matched = {id(node) for node in nodes}
+        return nodes
+
+    @staticmethod
+    def _candidates(tags: Tags, step: Step) -> List[Linkable]:
+        best = tags.get(step.tag)
+        for test in step.tests:
+            if test.op == "=":
+                nodes = tags.values(step.tag, test.name).get(test.value, [])
+                if len(nodes) < len(best):
+                    best = nodes
+        return best
+
+    @staticmethod
+    def _match(tags: Tags, node: Linkable, step: Step) -> bool:
+        attribute = tags.attribute
+        return all(
+            _OPERATORS[test.op](attribute(node, test.name), test.value)
+            for test in step.tests
+        )
+
+    @staticmethod
+    def _below(tags: Tags, node: Linkable, matched: Set[int], child: bool) -> bool:
+        parent = tags.parent(node)
+        while parent is not None:
+            if id(parent) in matched:
+                return True
+            if child:
+                return False
+            parent = tags.parent(parent)
+        return False
+
+
+def _unquote(value: str) -> str:
+    if value[:1] in "'\"" and value[:1] == value[-1:] and len(value) > 1:
+        return value[1:-1]
+    return value
+
+
+def _parse(selector: str) -> Tuple[Tuple[Step, ...], ...]:
+    alternatives: List[Tuple[Step, ...]] = []
+    steps: List[Step] = []
+    tag: Optional[str] = None
+    tests: List[Test] = []
+    child = False
+    pos = 0
+    end = len(selector)
+
+    def finish() -> None:
+        nonlocal tag, tests, child
+        if tag is None and not tests:
+            raise ValueError(f"bad selector {selector!r} at {pos}")
+        steps.append(Step(tag or "*", tuple(tests), child))
+        tag, tests, child = None, [], False
+
+    while pos < end:
+        match = _TOKEN.match(selector, pos)
+        if match is None:
+            raise ValueError(f"bad selector {selector!r} at {pos}")
+        if match["tag"] is not None:
+            if tag is not None or tests:
+                raise ValueError(f"bad selector {selector!r} at {pos}")
+            tag = match["tag"]
+        elif match["name"] is not None:
+            value = _unquote(match["value"] or "")
+            tests.append(Test(match["name"], match["op"] or "", value))
+        else:
+            finish()
+            if match["combinator"] == ",":
+                alternatives.append(tuple(steps))
+                steps = []
+            elif match["combinator"] == ">":
+                child = True
+        pos = match.end()
+    finish()
+    alternatives.append(tuple(steps))
+    return tuple(alternatives)
+
+
+@functools.lru_cache(maxsize=256)
+def compile(selector: str) -> Selector:
+    """Compile a CSS like selector over tag names and XML attributes.
+
+    Steps are a tag, or ``*``, with any of ``[name]``, ``[name=value]``,
+    ``[name!=value]``, ``[name^=value]``, ``[name$=value]`` and
+    ``[name*=value]``. Steps are separated by a space for any descendant,
+    or ``>`` for a child, and alternatives by ``,``.
+    """
+    return Selector(selector, _parse(selector.strip()))
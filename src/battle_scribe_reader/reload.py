@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+from xml.etree.ElementTree import Element, ParseError
+
+from .fields import field_names
+from .linkable import walk
+from .source import file_digest, parse
+from .tree import Root, XMLLinkable, split_path
+
+__all__ = ["Changes", "Reloader", "Watcher"]
+
+
+class Changes(NamedTuple):
+    """The keys of the top level nodes a reload added, removed or changed.
+
+    Keys are ids, or ``#`` and the content hash for nodes without one.
+    """
+
+    added: List[str]
+    removed: List[str]
+    changed: List[str]
+    kept: int
+
+
+def _hash(element: Element) -> str:
+    # Elements are hashed in preorder with their number of children, which
+    # fixes the structure, ignoring the whitespace between them.
+    parts: List[str] = []
+    extend = parts.extend
+    for node in element.iter():
+        attrib = node.attrib
+        extend((node.tag, str(len(attrib)), *attrib, *attrib.values()))
+        extend(((node.text or "").strip(), str(len(node))))
+    return hashlib.sha1("\0".join(parts).encode("utf-8")).hexdigest()
+
+
+def _stat(path: str) -> Tuple[int, int]:
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+class Reloader:
+    """Keep a :class:`~.tree.Root` up to date with the file it was read from.
+
+    Files are checked by modification time and size, and only reloaded when
+    their content hash has changed too. A reload matches the new top level
+    nodes to the old ones by id and content hash. Unchanged nodes keep their
+    wrappers, with everything already built below them, and their elements
+    are moved into the new document. Only changed nodes are wrapped again,
+    and only their ids are updated in the index. Wrappers of changed and
+    removed nodes are left holding the old content.
+    """
+
+    root: Root
+    path: str
+    _hashes: Dict[int, str]
+
+    def __init__(self, root: Root, path: str) -> None:
+        self.root = root
+        self.path = path
+        self._stat = _stat(path)
+        self._digest = file_digest(path)
+        self._hashes = {}
+
+    @classmethod
+    def load(cls, path: str) -> Reloader:
+        return cls(Root.load(path), path)
+
+    def _check(self) -> Optional[Tuple[Tuple[int, int], str]]:
+        stat = _stat(self.path)
+        if stat == self._stat:
+            return None
+        digest = file_digest(self.path)
+        if digest == self._digest:
+            self._stat = stat
+            return None
+        return stat, digest
+
+    def changed(self) -> bool:
+        """Check if the file's content changed since it was last read."""
+        return self._check() is not None
+
+    def reload(self, force: bool = False) -> Optional[Changes]:
+        """Update the root if its file changed, returning what changed.
+
+        The file is only marked as read once it has parsed, so a file that
+        fails to parse is read again on the next call.
+        """
+        check = self._check()
+        if check is None:
+            if not force:
+                return None
+            check = self._stat, self._digest
+        changes = self.update(parse(self.path))
+        self._stat, self._digest = check
+        return changes
+
+    def _key(self, element: Element) -> Tuple[str, str]:
+        digest = self._hashes.get(id(element))
+        if digest is None:
+            digest = self._hashes[id(element)] = _hash(element)
+        return element.get("id") or f"#{digest}", digest
+
+    def update(self, xml: Element) -> Changes:
+        """Make the root hold the document ``xml``, reusing unchanged nodes."""
+        root = self.root
+        added: List[str] = []
+        removed: List[str] = []
+        changed: List[str] = []
+        kept = 0
+        stale: List[XMLLinkable] = []
+        fresh: List[XMLLinkable] = []
+        hashes: Dict[int, str] = {}
+        for name in root._link_names():
+            link = root._link_schema()[name][2]
+            container_tag, tag = split_path(link.PATH)
+            built = name in root.__dict__
+            old: Dict[str, Tuple[str, Optional[XMLLinkable]]] = {}
+            if built:
+                for node in root.__dict__[name]:
+                    key, digest = self._key(node.xml)
+                    old[key] = digest, node
+            else:
+                for element in root.xml.iterfind(link.PATH):
+                    key, digest = self._key(element)
+                    old[key] = digest, None
+            container = xml.find(container_tag)
+            elements = () if container is None else list(container)
+            nodes: List[XMLLinkable] = []
+            for position, element in enumerate(elements):
+                if element.tag != tag:
+                    continue
+                key, digest = self._key(element)
+                previous = old.pop(key, None)
+                if previous is None:
+                    added.append(key)
+                elif previous[0] != digest:
+                    changed.append(key)
+                else:
+                    kept += 1
+                if not built:
+                    hashes[id(element)] = digest
+                    continue
+                if previous is not None and previous[0] == digest:
+                    node = previous[1]
+                    node.xml.tail = element.tail
+                    container[position] = node.xml
+                    hashes[id(node.xml)] = digest
+                else:
+                    node = link(element, root)
+                    hashes[id(element)] = digest
+                    fresh.append(node)
+                    if previous is not None:
+                        stale.append(previous[1])
+                nodes.append(node)
+            for key, (_, node) in old.items():
+                removed.append(key)
+                if node is not None:
+                    stale.append(node)
+            if built:
+                root.__dict__[name] = nodes
+        self._swap(xml, stale, fresh)
+        self._hashes = hashes
+        return Changes(added, removed, changed, kept)
+
+    def _swap(
+        self, xml: Element, stale: Sequence[XMLLinkable], fresh: Sequence[XMLLinkable]
+    ) -> None:
+        root = self.root
+        root.xml = xml
+        for name in field_names(type(root)):
+            root.__dict__.pop(name, None)
+        root.__dict__.pop("_tags", None)
+        index = root.__dict__.get("_index")
+        if index is None:
+            return
+        ids = index.ids
+        for top in stale:
+            for node in walk(top):
+                id = node.xml.get("id")
+                if id is not None and ids.get(id) is node:
+                    del ids[id]
+        for top in fresh:
+            for node in walk(top):
+                id = node.xml.get("id")
+                if id is not None and id not in ids:
+                    ids[id] = node
+
+
+class Watcher:
+    """Poll reloaders in a background thread, every ``interval`` seconds.
+
+    ``callback(reloader, changes)`` is called after each reload. Files that
+    fail to parse, such as ones still being written, are tried again on the
+    next poll.
+    """
+
+    def __init__(
+        self,
+        reloaders: Sequence[Reloader],
+        interval: float = 1.0,
+        callback: Optional[Callable[[Reloader, Changes], None]] = None,
+    ) -> None:
+        self.reloaders = list(reloaders)
+        self.interval = interval
+        self.callback = callback
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> Watcher:
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def poll(self) -> None:
+        """Reload every changed file once."""
+        for reloader in self.reloaders:
+            try:
+                changes = reloader.reload()
+            except (ParseError, OSError):
+                continue
+            if changes is not None and self.callback is not None:
+                self.callback(reloader, changes)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.poll()
+
+    def __enter__(self) -> Watcher:
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
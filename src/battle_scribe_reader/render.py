@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from typing import IO, Iterable, Optional, Type, Union
+
+from .linkable import Linkable
+
+__all__ = ["render"]
+
+SPACE = "  "
+
+
+def render(
+    node: Linkable,
+    stream: IO[str],
+    depth: Optional[int] = None,
+    types: Optional[Iterable[Union[str, Type]]] = None,
+) -> None:
+    """Write ``node`` and its children to ``stream``, one line at a time.
+
+    Children are indented under their parent, and nothing deeper than
+    ``depth`` levels below ``node`` is written. When ``types`` is given only
+    nodes with those types, or type names, are written, but their children
+    are still visited.
+    """
+    names = None
+    if types is not None:
+        names = {t if isinstance(t, str) else t.__name__ for t in types}
+    write = stream.write
+    stack = [(node, 0)]
+    while stack:
+        node, level = stack.pop()
+        if names is None or type(node).__name__ in names:
+            prefix = SPACE * level
+            for line in node._header().splitlines(True):
+                write(prefix + line if line.strip() else line)
+            write("\n")
+        if depth is None or level < depth:
+            for children in reversed(list(node.get_lists().values())):
+                stack.extend((child, level + 1) for child in reversed(children))
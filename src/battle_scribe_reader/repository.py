@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from typing import List, NamedTuple, Optional, Tuple
+
+from .cache import dumps, loads
+from .frozen import FrozenRoot
+from .tree import Root
+
+__all__ = ["EXTENSIONS", "Loaded", "find", "load_repository"]
+
+EXTENSIONS = (".cat", ".catz", ".gst", ".gstz")
+
+
+class Loaded(NamedTuple):
+    path: str
+    root: Optional[FrozenRoot]
+    error: Optional[BaseException]
+
+
+def find(directory: str) -> List[str]:
+    """Get the catalogues and game systems in ``directory``."""
+    return sorted(
+        os.path.join(directory, name)
+        for name in os.listdir(directory)
+        if name.lower().endswith(EXTENSIONS)
+    )
+
+
+def _load(path: str) -> Tuple[Optional[bytes], Optional[BaseException]]:
+    try:
+        return dumps(Root.load(path).freeze()), None
+    except Exception as e:
+        return None, e
+
+
+def _result(path: str, future: Future) -> Loaded:
+    try:
+        data, error = future.result()
+    except Exception as e:
+        return Loaded(path, None, e)
+    return Loaded(path, None if data is None else loads(data), error)
+
+
+def load_repository(
+    directory: str, workers: Optional[int] = None, ordered: bool = True
+) -> List[Loaded]:
+    """Load every catalogue and game system in ``directory`` in parallel.
+
+    Files are parsed across ``workers`` processes, and sent back frozen in
+    the cache's compact format. Results are in path order, or the order
+    they finish when ``ordered`` is false. A file that fails to load has its
+    exception in ``error`` rather than stopping the others.
+    """
+    paths = find(directory)
+    if not paths:
+        return []
+    with ProcessPoolExecutor(workers) as pool:
+        futures = {pool.submit(_load, path): path for path in paths}
+        done = futures if ordered else as_completed(futures)
+        return [_result(futures[future], future) for future in done]
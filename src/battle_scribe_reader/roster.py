@@ -0,0 +1,382 @@
+from __future__ import annotations
+
+from typing import Callable, Dict, Iterator, List, Optional
+from xml.etree.ElementTree import Element
+
+from .linkable import Linkable
+from .modifiers import Context, Query
+from .source import parse
+
+__all__ = [
+    "ROSTER",
+    "Force",
+    "Node",
+    "Roster",
+    "RosterContext",
+    "Selection",
+    "find_scope",
+]
+
+ROSTER = "{http://www.battlescribe.net/schema/rosterSchema}"
+
+
+def _costs(xml: Element) -> Dict[str, float]:
+    costs: Dict[str, float] = {}
+    for cost in xml.iterfind(f"{ROSTER}costs/{ROSTER}cost"):
+        type_id = cost.get("typeId") or cost.get("costTypeId") or cost.get("name")
+        costs[type_id] = costs.get(type_id, 0.0) + float(cost.get("value") or 0)
+    return costs
+
+
+def _add(totals: Dict[str, float], delta: Dict[str, float], sign: int = 1) -> None:
+    for key, value in delta.items():
+        totals[key] = totals.get(key, 0) + sign * value
+
+
+class Node:
+    """A part of a roster that keeps totals for itself and below.
+
+    ``totals`` are the costs per cost type, and ``counts`` the number of
+    selections per entry id. Changes are pushed up the parent chain as
+    deltas, so an edit only touches the changed node's ancestors.
+    """
+
+    parent: Optional[Node]
+    children: List[Node]
+    totals: Dict[str, float]
+    counts: Dict[str, int]
+
+    def __init__(self) -> None:
+        self.parent = None
+        self.children = []
+        self.totals = {}
+        self.counts = {}
+
+    def _own(self) -> Dict[str, float]:
+        return {}
+
+    def _propagate(
+        self, delta: Dict[str, float], counts: Dict[str, int], sign: int = 1
+    ) -> None:
+        node: Optional[Node] = self
+        while node is not None:
+            _add(node.totals, delta, sign)
+            _add(node.counts, counts, sign)
+            node = node.parent
+
+    def ancestors(self) -> Iterator[Node]:
+        """Iterate from this node up to the roster."""
+        node: Optional[Node] = self
+        while node is not None:
+            yield node
+            node = node.parent
+
+    def add(self, child: Node) -> Node:
+        """Add ``child``, and everything below it, to this node."""
+        if child.parent is not None:
+            raise ValueError("node is already in a roster")
+        child.parent = self
+        self.children.append(child)
+        self._propagate(child.totals, child.counts)
+        self._changed(self, child)
+        return child
+
+    def remove(self, child: Node) -> Node:
+        self.children.remove(child)
+        child.parent = None
+        self._propagate(child.totals, child.counts, -1)
+        self._changed(self, child)
+        return child
+
+    def _changed(self, origin: Node, node: Node) -> None:
+        if self.parent is not None:
+            self.parent._changed(origin, node)
+
+    def walk(self) -> Iterator[Node]:
+        stack: List[Node] = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children))
+
+    def _load_children(self, xml: Element, catalogue: Optional[Linkable]) -> None:
+        for child in xml.iterfind(f"{ROSTER}selections/{ROSTER}selection"):
+            self.add(Selection.from_xml(child, catalogue))
+        for child in xml.iterfind(f"{ROSTER}forces/{ROSTER}force"):
+            self.add(Force.from_xml(child, catalogue))
+
+
+class Selection(Node):
+    """A selection of ``number`` of a catalogue entry."""
+
+    id: Optional[str]
+    name: Optional[str]
+    entry_id: Optional[str]
+    type: Optional[str]
+    entry: Optional[Linkable]
+    unit_costs: Dict[str, float]
+    number: int
+
+    def __init__(
+        self,
+        entry_id: Optional[str],
+        number: int = 1,
+        unit_costs: Optional[Dict[str, float]] = None,
+        entry: Optional[Linkable] = None,
+        id: Optional[str] = None,
+        name: Optional[str] = None,
+        type: Optional[str] = None,
+    ) -> None:
+        super().__init__()
+        self.id = id
+        self.name = name if name is not None else getattr(entry, "name", None)
+        self.entry_id = entry_id
+        self.type = type if type is not None else getattr(entry, "type", None)
+        self.entry = entry
+        self.unit_costs = dict(unit_costs or {})
+        self.number = number
+        self.totals = self._own()
+        if self.entry_key is not None:
+            self.counts = {self.entry_key: number}
+
+    @classmethod
+    def from_entry(cls, entry: Linkable, number: int = 1) -> Selection:
+        """Make a selection of a catalogue entry, costed from its ``costs``."""
+        costs: Dict[str, float] = {}
+        for cost in getattr(entry, "costs", ()):
+            costs[cost.cost_type_id] = float(cost.value or 0)
+        return cls(entry.id, number, costs, entry)
+
+    @classmethod
+    def from_xml(cls, xml: Element, catalogue: Optional[Linkable]) -> Selection:
+        entry_id = xml.get("entryId")
+        entry = None
+        if catalogue is not None and entry_id:
+            entry = catalogue.resolve(entry_id.split("::")[-1])
+        number = int(xml.get("number") or 1)
+        costs = _costs(xml)
+        unit_costs = {k: v / number for k, v in costs.items()} if number else costs
+        selection = cls(
+            entry_id,
+            number,
+            unit_costs,
+            entry,
+            id=xml.get("id"),
+            name=xml.get("name"),
+            type=xml.get("type"),
+        )
+        selection._load_children(xml, catalogue)
+        return selection
+
+    def _own(self) -> Dict[str, float]:
+        return {k: v * self.number for k, v in self.unit_costs.items()}
+
+    @property
+    def entry_key(self) -> Optional[str]:
+        """The id of the selected entry, the last part of ``entry_id``."""
+        if not self.entry_id:
+            return None
+        return self.entry_id.rsplit("::", 1)[-1]
+
+    @property
+    def costs(self) -> Dict[str, float]:
+        """The costs of this selection alone, without its children."""
+        return self._own()
+
+    def set_number(self, number: int) -> None:
+        change = number - self.number
+        delta = {k: v * change for k, v in self.unit_costs.items()}
+        counts = {} if self.entry_key is None else {self.entry_key: change}
+        self.number = number
+        self._propagate(delta, counts)
+        self._changed(self, self)
+
+    def __repr__(self) -> str:
+        return f"Selection({self.name!r}, number={self.number})"
+
+
+class Force(Node):
+    id: Optional[str]
+    name: Optional[str]
+    entry_id: Optional[str]
+    catalogue_id: Optional[str]
+
+    def __init__(
+        self,
+        entry_id: Optional[str] = None,
+        catalogue_id: Optional[str] = None,
+        id: Optional[str] = None,
+        name: Optional[str] = None,
+    ) -> None:
+        super().__init__()
+        self.id = id
+        self.name = name
+        self.entry_id = entry_id
+        self.catalogue_id = catalogue_id
+
+    @classmethod
+    def from_xml(cls, xml: Element, catalogue: Optional[Linkable]) -> Force:
+        force = cls(
+            xml.get("entryId"),
+            xml.get("catalogueId"),
+            id=xml.get("id"),
+            name=xml.get("name"),
+        )
+        force._load_children(xml, catalogue)
+        return force
+
+    def __repr__(self) -> str:
+        return f"Force({self.name!r})"
+
+
+class Roster(Node):
+    """A roster, with its forces and selections linked to a catalogue.
+
+    ``catalogue`` is anything with a ``resolve(id)`` method, such as a
+    :class:`~battle_scribe_reader.tree.Root`.
+    """
+
+    id: Optional[str]
+    name: Optional[str]
+    game_system_id: Optional[str]
+    listeners: List[Callable[[Node, Node], None]]
+
+    def __init__(
+        self,
+        id: Optional[str] = None,
+        name: Optional[str] = None,
+        game_system_id: Optional[str] = None,
+    ) -> None:
+        super().__init__()
+        self.id = id
+        self.name = name
+        self.game_system_id = game_system_id
+        self.listeners = []
+
+    def _changed(self, origin: Node, node: Node) -> None:
+        """Tell the listeners ``node`` changed, altering ``origin``'s totals."""
+        for listener in self.listeners:
+            listener(origin, node)
+
+    @classmethod
+    def load(cls, path: str, catalogue: Optional[Linkable] = None) -> Roster:
+        """Load a, possibly zipped, roster file."""
+        return cls.from_xml(parse(path), catalogue)
+
+    @classmethod
+    def from_xml(cls, xml: Element, catalogue: Optional[Linkable] = None) -> Roster:
+        roster = cls(xml.get("id"), xml.get("name"), xml.get("gameSystemId"))
+        roster._load_children(xml, catalogue)
+        return roster
+
+    def __repr__(self) -> str:
+        return f"Roster({self.name!r})"
+
+
+def find_scope(parent: Optional[Node], scope: str) -> Optional[Node]:
+    """Find the node ``scope`` names, for an entry selected in ``parent``.
+
+    ``parent`` is the scope itself, and otherwise the closest force, the
+    roster, or the closest selection of the entry, or link, with that id.
+    """
+    if scope == "parent" or parent is None:
+        return parent
+    for node in parent.ancestors():
+        if scope == "force" and isinstance(node, Force):
+            return node
+        if scope in ("roster", "primary-catalogue") and node.parent is None:
+            return node
+        if isinstance(node, Selection) and node.entry_id:
+            if scope in node.entry_id.split("::"):
+                return node
+    return None
+
+
+_TYPES = {"model", "unit", "upgrade"}
+
+
+def _matches(selection: Selection, child_id: Optional[str]) -> bool:
+    if child_id is None or child_id == "any":
+        return True
+    if child_id in _TYPES:
+        return selection.type == child_id
+    if selection.entry_key == child_id:
+        return True
+    links = getattr(selection.entry, "category_links", ())
+    return any(link.target_id == child_id for link in links)
+
+
+def _selections(scope: Node, children: bool, forces: bool) -> Iterator[Selection]:
+    # The scope's own selection only counts with its children, like counts.
+    if children and isinstance(scope, Selection):
+        yield scope
+    stack = list(reversed(scope.children))
+    while stack:
+        node = stack.pop()
+        if isinstance(node, Selection):
+            yield node
+            if children:
+                stack.extend(reversed(node.children))
+        elif forces or not isinstance(node.parent, Force):
+            stack.extend(reversed(node.children))
+
+
+class RosterContext(Context):
+    """Answer the queries of the modifiers on ``selection``'s entry.
+
+    Scopes are found from the selection up, ``self`` being the selection,
+    see :func:`find_scope`. ``childId`` is an entry id, a category id, one
+    of ``model``, ``unit`` and ``upgrade``, or ``any``. Counts of an entry
+    including child selections come from the scope's ``counts``, others
+    from its selections. Unshared queries aren't supported.
+    """
+
+    selection: Selection
+
+    def __init__(self, selection: Selection) -> None:
+        self.selection = selection
+
+    def scope(self, query: Query) -> Optional[Node]:
+        if query.scope == "self":
+            return self.selection
+        return find_scope(self.selection.parent, query.scope)
+
+    def count(self, query: Query) -> float:
+        if not query.shared:
+            raise ValueError(f"unshared query of {query.child_id!r}")
+        scope = self.scope(query)
+        if scope is None:
+            return 0.0
+        value = self._tally(scope, query, query.child_id)
+        if not query.percent:
+            return value
+        total = self._tally(scope, query, None)
+        return 100.0 * value / total if total else 0.0
+
+    def _tally(self, scope: Node, query: Query, child_id: Optional[str]) -> float:
+        selections = query.field == "selections"
+        if (
+            selections
+            and query.include_child_selections
+            and isinstance(scope, Selection)
+            and child_id in scope.counts
+        ):
+            return float(scope.counts[child_id])
+        total = 0.0
+        for selection in _selections(
+            scope, query.include_child_selections, query.include_child_forces
+        ):
+            if _matches(selection, child_id):
+                if selections:
+                    total += selection.number
+                else:
+                    total += selection.costs.get(query.field, 0.0)
+        return total
+
+    def instance_of(self, query: Query) -> bool:
+        scope = self.scope(query)
+        if isinstance(scope, Selection):
+            return _matches(scope, query.child_id)
+        if isinstance(scope, Force):
+            return scope.entry_id == query.child_id
+        return False
@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import math
+import marshal
+import re
+from array import array
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from .linkable import Linkable, walk
+from .source import write_atomic
+
+__all__ = ["Hit", "SearchIndex", "tokenize"]
+
+MAGIC = b"BSRI\x01"
+_WORD = re.compile(r"\w+")
+_QUERY = re.compile(r'"([^"]*)"|(\S+)')
+_DOCUMENTS = {
+    "Rule",
+    "SharedRule",
+    "Profile",
+    "SharedProfile",
+    "SelectionEntry",
+    "SharedSelectionEntry",
+}
+# Positions skipped between fields, so phrases can't span two of them.
+_GAP = 16
+_K1 = 1.2
+_B = 0.75
+
+Postings = Dict[int, Tuple[int, ...]]
+# A term's documents, the offsets of each one's positions, and positions,
+# packed as unsigned ints so loading an index makes a few objects per term.
+Packed = Tuple[bytes, bytes, bytes]
+
+
+class Hit(NamedTuple):
+    id: str
+    type: str
+    name: Optional[str]
+    score: float
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Split text into lower case words."""
+    return _WORD.findall(text.lower()) if text else []
+
+
+def _pack(postings: Dict[int, List[int]]) -> Packed:
+    docs, offsets, positions = array("I"), array("I", [0]), array("I")
+    for doc, found in postings.items():
+        docs.append(doc)
+        positions.extend(found)
+        offsets.append(len(positions))
+    return docs.tobytes(), offsets.tobytes(), positions.tobytes()
+
+
+def _unpack(packed: Packed) -> Postings:
+    docs, offsets, positions = (array("I", data) for data in packed)
+    return {
+        doc: tuple(positions[offsets[i] : offsets[i + 1]])
+        for i, doc in enumerate(docs)
+    }
+
+
+def _fields(node: Any) -> Iterable[Optional[str]]:
+    yield node.name
+    yield getattr(node, "description", None)
+    for characteristic in getattr(node, "characteristics", ()):
+        yield f"{characteristic.name} {characteristic.value}"
+
+
+class SearchIndex:
+    """An inverted index of the names and text of a catalogue's nodes.
+
+    Rules, profiles and selection entries are indexed by name, along with
+    rule descriptions and profile characteristics. Each term maps to the
+    documents it's in and its positions there, which answers phrases as
+    well as terms. Results are ranked with BM25.
+
+    Postings stay packed until a query first uses their term.
+    """
+
+    documents: List[Tuple[str, str, Optional[str]]]
+    lengths: List[int]
+    packed: Dict[str, Packed]
+    _postings: Dict[str, Postings]
+
+    def __init__(
+        self,
+        documents: List[Tuple[str, str, Optional[str]]],
+        lengths: List[int],
+        packed: Dict[str, Packed],
+    ) -> None:
+        self.documents = documents
+        self.lengths = lengths
+        self.packed = packed
+        self.average = sum(lengths) / len(lengths) if lengths else 0.0
+        self._postings = {}
+
+    def postings(self, term: str) -> Postings:
+        """Get the documents ``term`` is in, with its positions in each."""
+        postings = self._postings.get(term)
+        if postings is None:
+            packed = self.packed.get(term)
+            postings = {} if packed is None else _unpack(packed)
+            self._postings[term] = postings
+        return postings
+
+    @classmethod
+    def build(cls, root: Linkable) -> SearchIndex:
+        """Index the documents in ``root``, a wrapped or a frozen tree."""
+        documents: List[Tuple[str, str, Optional[str]]] = []
+        lengths: List[int] = []
+        postings: Dict[str, Dict[int, List[int]]] = {}
+        seen: Set[str] = set()
+        for node in walk(root):
+            kind = type(node).__name__
+            id = getattr(node, "id", None)
+            if kind not in _DOCUMENTS or id is None or id in seen:
+                continue
+            seen.add(id)
+            doc = len(documents)
+            documents.append((id, kind, node.name))
+            position = 0
+            for text in _fields(node):
+                for term in tokenize(text):
+                    postings.setdefault(term, {}).setdefault(doc, []).append(position)
+                    position += 1
+                position += _GAP
+            lengths.append(position)
+        packed = {term: _pack(docs) for term, docs in postings.items()}
+        return cls(documents, lengths, packed)
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def dumps(self) -> bytes:
+        return MAGIC + marshal.dumps((self.documents, self.lengths, self.packed))
+
+    @classmethod
+    def loads(cls, data: bytes) -> SearchIndex:
+        if data[: len(MAGIC)] != MAGIC:
+            raise ValueError("not a search index")
+        documents, lengths, packed = marshal.loads(data[len(MAGIC) :])
+        return cls(documents, lengths, packed)
+
+    def save(self, path: str) -> None:
+        """Write the index to ``path``, replacing it atomically."""
+        write_atomic(path, self.dumps())
+
+    @classmethod
+    def load(cls, path: str) -> SearchIndex:
+        with open(path, "rb") as f:
+            return cls.loads(f.read())
+
+    def _phrase(self, terms: List[str]) -> Set[int]:
+        postings = [self.postings(term) for term in terms]
+        if not postings or not all(postings):
+            return set()
+        found = set(postings[0])
+        for docs in postings[1:]:
+            found.intersection_update(docs)
+        matched = set()
+        for doc in found:
+            starts = set(postings[0][doc])
+            for offset, docs in enumerate(postings[1:], 1):
+                starts.intersection_update(p - offset for p in docs[doc])
+            if starts:
+                matched.add(doc)
+        return matched
+
+    def _score(self, term: str, docs: Iterable[int]) -> Dict[int, float]:
+        postings = self.postings(term)
+        n = len(postings)
+        idf = math.log(1 + (len(self.documents) - n + 0.5) / (n + 0.5))
+        scores = {}
+        for doc in docs:
+            frequency = len(postings.get(doc, ()))
+            if frequency:
+                norm = 1 - _B + _B * self.lengths[doc] / (self.average or 1)
+                scores[doc] = idf * frequency * (_K1 + 1) / (frequency + _K1 * norm)
+        return scores
+
+    def search(self, query: str, limit: Optional[int] = 10) -> List[Hit]:
+        """Find the documents best matching ``query``.
+
+        Words match any document they're in, and ``"quoted phrases"`` must
+        be in a document, in order, for it to match.
+        """
+        terms: List[str] = []
+        candidates: Optional[Set[int]] = None
+        for phrase, word in _QUERY.findall(query):
+            words = tokenize(phrase or word)
+            terms.extend(words)
+            if phrase:
+                matched = self._phrase(words)
+                candidates = matched if candidates is None else candidates & matched
+        if candidates is None:
+            candidates = set()
+            for term in terms:
+                candidates.update(self.postings(term))
+        scores: Dict[int, float] = {}
+        for term in set(terms):
+            for doc, score in self._score(term, candidates).items():
+                scores[doc] = scores.get(doc, 0.0) + score
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return [Hit(*self.documents[doc], score) for doc, score in ranked[:limit]]
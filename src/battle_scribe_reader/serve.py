@@ -0,0 +1,319 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from .fields import field_values
+from .linkable import Linkable
+from .repository import find
+from .source import read_header
+from .tree import Root
+
+__all__ = ["Metrics", "NotFound", "Roots", "make_server", "serve"]
+
+
+class NotFound(KeyError):
+    """A document or node that was asked for doesn't exist."""
+
+
+class Roots:
+    """A bounded, least recently used, cache of loaded documents.
+
+    Documents are found by id, name or file name, from their headers. A
+    document requested by several threads at once is only loaded once.
+    """
+
+    def __init__(
+        self,
+        paths: Iterable[str],
+        size: int = 8,
+        loader: Callable[[str], Root] = Root.load,
+    ) -> None:
+        self.size = size
+        self.loader = loader
+        self.hits = 0
+        self.misses = 0
+        self.headers: Dict[str, Dict[str, str]] = {}
+        self._keys: Dict[str, str] = {}
+        for path in paths:
+            header = read_header(path)
+            id = header.get("id") or path
+            self.headers[id] = {"path": path, **header}
+            file = os.path.splitext(os.path.basename(path))[0]
+            for key in (id, header.get("name"), file):
+                if key:
+                    self._keys.setdefault(key, id)
+        self._roots: OrderedDict[str, Root] = OrderedDict()
+        self._pending: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Root:
+        """Get a document, loading it on a miss. Raises :class:`NotFound`."""
+        id = self._keys.get(key)
+        if id is None:
+            raise NotFound(key)
+        with self._lock:
+            root = self._roots.get(id)
+            if root is not None:
+                self._roots.move_to_end(id)
+                self.hits += 1
+                return root
+            future = self._pending.get(id)
+            owner = future is None
+            if owner:
+                self.misses += 1
+                future = self._pending[id] = Future()
+        if not owner:
+            return future.result()
+        try:
+            root = self.loader(self.headers[id]["path"])
+            root.index
+        except BaseException as e:
+            with self._lock:
+                del self._pending[id]
+            future.set_exception(e)
+            raise
+        with self._lock:
+            del self._pending[id]
+            self._roots[id] = root
+            while len(self._roots) > self.size:
+                self._roots.popitem(last=False)
+        future.set_result(root)
+        return root
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._roots),
+                "capacity": self.size,
+                "loaded": list(self._roots),
+            }
+
+
+class Metrics:
+    """Request counts, errors and latencies per endpoint."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, Dict[str, float]] = {}
+
+    def record(self, endpoint: str, seconds: float, error: bool) -> None:
+        with self._lock:
+            stats = self._endpoints.setdefault(
+                endpoint, {"count": 0, "errors": 0, "total": 0.0, "max": 0.0}
+            )
+            stats["count"] += 1
+            stats["errors"] += error
+            stats["total"] += seconds
+            stats["max"] = max(stats["max"], seconds)
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {
+                endpoint: {**stats, "mean": stats["total"] / stats["count"]}
+                for endpoint, stats in self._endpoints.items()
+            }
+
+
+def _node(node: Linkable, depth: int = 1) -> Dict[str, Any]:
+    values = field_values(node)
+    for name, children in node.get_lists().items():
+        if not children:
+            continue
+        if depth > 0:
+            values[name] = [_node(child, depth - 1) for child in children]
+        else:
+            values[name] = [field_values(child) for child in children]
+    return values
+
+
+def _entry(node: Linkable) -> Dict[str, Any]:
+    return {key: getattr(node, key, None) for key in ("id", "name", "type", "hidden")}
+
+
+def _profile(node: Linkable) -> Dict[str, Any]:
+    return {
+        "id": node.id,
+        "name": node.name,
+        "type": node.profile_type_name,
+        "characteristics": {c.name: c.value for c in node.characteristics},
+    }
+
+
+class Handler(BaseHTTPRequestHandler):
+    """Answer ``GET`` requests with JSON, see :func:`make_server`."""
+
+    server: Server
+
+    def do_GET(self) -> None:
+        start = time.perf_counter()
+        url = urlsplit(self.path)
+        endpoint = url.path.rstrip("/") or "/"
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        route = ROUTES.get(endpoint)
+        status, body = 404, {"error": f"unknown endpoint {endpoint}"}
+        if route is not None:
+            try:
+                status, body = 200, route(self.server, query)
+            except NotFound as e:
+                status, body = 404, {"error": f"not found: {e.args[0]}"}
+            except ValueError as e:
+                status, body = 400, {"error": str(e)}
+            except Exception as e:
+                self.log_error("%s failed: %r", self.path, e)
+                status, body = 500, {"error": f"internal error: {type(e).__name__}"}
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+        elapsed = time.perf_counter() - start
+        name = endpoint if route is not None else "unknown"
+        self.server.metrics.record(name, elapsed, status >= 400)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+
+class Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+        self, address: Tuple[str, int], roots: Roots, quiet: bool = False
+    ) -> None:
+        super().__init__(address, Handler)
+        self.roots = roots
+        self.metrics = Metrics()
+        self.quiet = quiet
+
+
+def _require(query: Dict[str, str], name: str) -> str:
+    value = query.get(name)
+    if not value:
+        raise ValueError(f"missing parameter {name!r}")
+    return value
+
+
+def _root(server: Server, query: Dict[str, str]) -> Root:
+    return server.roots.get(_require(query, "catalogue"))
+
+
+def _catalogues(server: Server, query: Dict[str, str]) -> Any:
+    return list(server.roots.headers.values())
+
+
+def _entries(server: Server, query: Dict[str, str]) -> Any:
+    # Filtered here rather than in the selector, the values are user input.
+    root = _root(server, query)
+    entries = root.query("selectionEntry")
+    if "type" in query:
+        entries = [node for node in entries if node.type == query["type"]]
+    if "name" in query:
+        entries = [node for node in entries if query["name"] in (node.name or "")]
+    return [_entry(node) for node in entries]
+
+
+def _profiles(server: Server, query: Dict[str, str]) -> Any:
+    root = _root(server, query)
+    profiles = root.query("profile")
+    if "type" in query:
+        profiles = [
+            node for node in profiles if node.profile_type_name == query["type"]
+        ]
+    return [_profile(node) for node in profiles]
+
+
+def _rules(server: Server, query: Dict[str, str]) -> Any:
+    root = _root(server, query)
+    text = query.get("q", "").lower()
+    return [
+        {"id": rule.id, "name": rule.name, "description": rule.description}
+        for rule in root.query("rule")
+        if text in (rule.name or "").lower()
+        or text in (rule.description or "").lower()
+    ]
+
+
+def _resolve(server: Server, query: Dict[str, str]) -> Any:
+    root = _root(server, query)
+    id = _require(query, "id")
+    node = root.resolve(id)
+    if node is None:
+        raise NotFound(id)
+    body = _node(node, int(query.get("depth", 1)))
+    target_id = getattr(node, "target_id", None)
+    if target_id is not None:
+        target = root.resolve(target_id)
+        body["target"] = None if target is None else _node(target, 0)
+    return body
+
+
+def _query(server: Server, query: Dict[str, str]) -> Any:
+    root = _root(server, query)
+    return [field_values(node) for node in root.query(_require(query, "selector"))]
+
+
+def _metrics(server: Server, query: Dict[str, str]) -> Any:
+    return {"cache": server.roots.stats(), "endpoints": server.metrics.stats()}
+
+
+ROUTES: Dict[str, Callable[[Server, Dict[str, str]], Any]] = {
+    "/catalogues": _catalogues,
+    "/entries": _entries,
+    "/profiles": _profiles,
+    "/rules": _rules,
+    "/resolve": _resolve,
+    "/query": _query,
+    "/metrics": _metrics,
+}
+
+
+def make_server(
+    paths: List[str],
+    host: str = "127.0.0.1",
+    port: int = 8080,
+    size: int = 8,
+    quiet: bool = False,
+) -> Server:
+    """Make a JSON server for the catalogues and game systems in ``paths``.
+
+    Directories are searched for catalogues. Endpoints take the catalogue's
+    id, name or file name as ``catalogue``:
+
+    - ``/catalogues`` the headers of every file.
+    - ``/entries`` selection entries, by ``type`` or part of their ``name``.
+    - ``/profiles`` profiles and their characteristics, by ``type``.
+    - ``/rules`` rules, with ``q`` in their name or description.
+    - ``/resolve`` the node with ``id``, and the target of links.
+    - ``/query`` the nodes matching ``selector``, see :meth:`.Root.query`.
+    - ``/metrics`` cache hits and misses, and latencies per endpoint.
+    """
+    files: List[str] = []
+    for path in paths:
+        files.extend(find(path) if os.path.isdir(path) else [path])
+    return Server((host, port), Roots(files, size), quiet)
+
+
+def serve(
+    paths: List[str], host: str = "127.0.0.1", port: int = 8080, size: int = 8
+) -> None:
+    """Serve ``paths`` until interrupted, see :func:`make_server`."""
+    server = make_server(paths, host, port, size)
+    print(f"Serving on http://{host}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import os
+import xml.etree.ElementTree
+import zipfile
+from typing import IO, Dict, Iterator
+from xml.etree.ElementTree import Element
+
+from .backends import get_backend
+
+__all__ = [
+    "ZIPPED",
+    "file_digest",
+    "open_source",
+    "parse",
+    "normalize",
+    "read_header",
+    "write_atomic",
+]
+
+CATALOGUE = "{http://www.battlescribe.net/schema/catalogueSchema}"
+GAME_SYSTEM = "{http://www.battlescribe.net/schema/gameSystemSchema}"
+ZIPPED = {".catz": ".cat", ".gstz": ".gst", ".rosz": ".ros"}
+_CHUNK = 2 ** 20
+
+
+def _member(archive: zipfile.ZipFile, extension: str) -> str:
+    names = [name for name in archive.namelist() if not name.endswith("/")]
+    matches = [name for name in names if name.lower().endswith(extension)]
+    if len(matches) == 1:
+        return matches[0]
+    if len(names) == 1:
+        return names[0]
+    raise ValueError(f"can't find the {extension} file in {archive.filename}")
+
+
+@contextlib.contextmanager
+def open_source(path: str) -> Iterator[IO[bytes]]:
+    """Open a BattleScribe file for reading as bytes.
+
+    Zipped files (``.catz``, ``.gstz`` and ``.rosz``) are decompressed as
+    they're read from the archive member, nothing is extracted.
+    """
+    extension = ZIPPED.get(os.path.splitext(path)[1].lower())
+    if extension is None:
+        with open(path, "rb") as f:
+            yield f
+    else:
+        with zipfile.ZipFile(path) as archive:
+            with archive.open(_member(archive, extension)) as f:
+                yield f
+
+
+def normalize(root: Element) -> Element:
+    """Move game system elements into the catalogue namespace.
+
+    Game systems share the catalogue's layout, so this lets the wrappers'
+    paths work on both.
+    """
+    if root.tag.startswith(GAME_SYSTEM):
+        size = len(GAME_SYSTEM)
+        for element in root.iter():
+            if element.tag.startswith(GAME_SYSTEM):
+                element.tag = CATALOGUE + element.tag[size:]
+    return root
+
+
+def parse(path: str, backend: str = "etree") -> Element:
+    """Parse a, possibly zipped, BattleScribe file into its root element.
+
+    ``backend`` names the parser, see :data:`.backends.BACKENDS`.
+    """
+    parse = get_backend(backend)
+    with open_source(path) as f:
+        return normalize(parse(f))
+
+
+def read_header(path: str) -> Dict[str, str]:
+    """Get the root element's attributes without parsing the rest of a file."""
+    with open_source(path) as f:
+        for _, element in xml.etree.ElementTree.iterparse(f, events=("start",)):
+            return dict(element.attrib)
+    return {}
+
+
+def file_digest(path: str) -> str:
+    """Get the SHA-256 of a file's bytes, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def write_atomic(path: str, data: bytes) -> None:
+    """Write ``data`` to ``path``, so readers see the old or new file whole."""
+    temp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temp, "wb") as f:
+            f.write(data)
+        os.replace(temp, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(temp)
+        raise
@@ -0,0 +1,132 @@
+"""Profile characteristics as NumPy arrays, one table per profile type.
+
+NumPy is optional, install it with ``battle_scribe_reader[stats]``.
+"""
+from __future__ import annotations
+
+import re
+from typing import IO, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy
+from numpy import ma
+
+from .export import FIXED, rows
+from .tree import ProfileType
+
+__all__ = ["StatTable", "load_stats", "parse_column"]
+
+_NUMBER = re.compile(r'\s*([-+]?\d+(\.\d*)?)\s*("|\'\')?\s*\Z')
+
+_UNPARSED = object()
+
+Source = Union[str, IO[bytes]]
+
+
+def _number(value: Optional[str]) -> Union[int, float, None]:
+    match = _NUMBER.match(value) if value else None
+    if match is None:
+        return None
+    return float(match[1]) if match[2] else int(match[1])
+
+
+def parse_column(values: Iterable[Optional[str]]) -> ma.MaskedArray:
+    """Parse text into numbers, masking values that aren't plain numbers.
+
+    Distances such as ``6"`` are numbers, but rolls like ``2+`` and ``D6``
+    and placeholders like ``-`` are masked. Columns of whole numbers are
+    ints, otherwise floats. Each distinct value is only parsed once.
+    """
+    cache: Dict[Optional[str], Union[int, float, None]] = {}
+    numbers = []
+    for value in values:
+        number = cache.get(value, _UNPARSED)
+        if number is _UNPARSED:
+            number = cache[value] = _number(value)
+        numbers.append(number)
+    size = len(numbers)
+    mask = numpy.fromiter((n is None for n in numbers), bool, size)
+    floats = any(isinstance(n, float) for n in numbers)
+    dtype = numpy.float64 if floats else numpy.int64
+    data = numpy.fromiter((0 if n is None else n for n in numbers), dtype, size)
+    return ma.MaskedArray(data, mask)
+
+
+class StatTable:
+    """The profiles of one profile type, a column per characteristic.
+
+    ``ids``, ``names`` and ``owners``, the owning entry ids, share row
+    positions with the columns. ``text`` keeps each column's raw values.
+    """
+
+    name: str
+    ids: numpy.ndarray
+    names: numpy.ndarray
+    owners: numpy.ndarray
+    text: Dict[str, numpy.ndarray]
+    columns: Dict[str, ma.MaskedArray]
+
+    def __init__(
+        self, name: str, header: List[str], data: List[List[Optional[str]]]
+    ) -> None:
+        self.name = name
+        fixed = len(FIXED)
+        self.ids, self.names, self.owners = (
+            numpy.array(column, dtype=object) for column in data[:fixed]
+        )
+        self.text = {}
+        self.columns = {}
+        for key, column in zip(header[fixed:], data[fixed:]):
+            self.text[key] = numpy.array(column, dtype=object)
+            self.columns[key] = parse_column(column)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, column: str) -> ma.MaskedArray:
+        return self.columns[column]
+
+    def __repr__(self) -> str:
+        columns = ", ".join(self.columns)
+        return f"StatTable({self.name!r}, rows={len(self)}, columns=[{columns}])"
+
+    def select(self, where: Union[numpy.ndarray, ma.MaskedArray]) -> List[Tuple]:
+        """Get ``(owner, id, name)`` of the rows where ``where`` is true.
+
+        Rows where ``where`` is masked, as it compared a masked value, are
+        left out.
+        """
+        found = numpy.flatnonzero(ma.filled(where, False))
+        return list(zip(self.owners[found], self.ids[found], self.names[found]))
+
+
+def load_stats(
+    sources: Iterable[Source], profile_types: Iterable[ProfileType] = ()
+) -> Dict[str, StatTable]:
+    """Build a table per profile type name from the profiles in ``sources``.
+
+    Every source is streamed once, see :func:`.export.rows`, and the tables
+    of profile types with the same name are joined across sources.
+    """
+    headers: Dict[str, List[str]] = {}
+    columns: Dict[str, Dict[str, List[Optional[str]]]] = {}
+    counts: Dict[str, int] = {}
+    profile_types = list(profile_types)
+    for source in sources:
+        for table, row in rows(source, profile_types):
+            header = headers.setdefault(table.name, [])
+            data = columns.setdefault(table.name, {})
+            count = counts.get(table.name, 0)
+            for key, value in zip(table.columns, row):
+                column = data.get(key)
+                if column is None:
+                    header.append(key)
+                    column = data[key] = [None] * count
+                column.append(value)
+            counts[table.name] = count = count + 1
+            for column in data.values():
+                if len(column) < count:
+                    column.append(None)
+    return {
+        name: StatTable(name, header, [columns[name][key] for key in header])
+        for name, header in headers.items()
+    }
@@ -1,16 +1,33 @@
 from __future__ import annotations
 
+import re
 from textwrap import indent
-from typing import Dict, List, Optional, Type, TypeVar
-from xml.etree.ElementTree import Element
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+from xml.etree.ElementTree import Element, iterparse
+
+from . import generated
+from .fields import Attribute
+from .index import Index, Tags
+from .query import compile as compile_selector
+from .source import GAME_SYSTEM, open_source, parse
+from .xml_linkable import XMLLinkable
+
+if TYPE_CHECKING:
+    from .frozen import FrozenRoot
+    from .library import Library
 
-from .linkable import Linkable
-from .typed import Typed
-
-T = TypeVar("T")
 BS = "{http://www.battlescribe.net/schema/catalogueSchema}"
 _SPACE = "  "
-_BOOL: Dict[str, bool] = {"true": True, "false": False}
 """
 _VISIBLE = {
     True: chr(0x1D9FF) + chr(0x1DA14),
@@ -25,6 +42,7 @@ _PERCENT = "0%"
 _FORCES = "-F"
 _SELECTION = "-S"
 _ROUND = "v^"
+_PATH_SEP = re.compile(r"/(?![^{]*})")
 
 
 def get(values, value):
@@ -34,6 +52,11 @@ def get(values, value):
         return " "
 
 
+def split_path(path: str) -> Tuple[str, ...]:
+    """Split an ElementPath on ``/``, ignoring any inside ``{namespace}``."""
+    return tuple(_PATH_SEP.split(path))
+
+
 def bools(
     hidden=None,
     collective=None,
@@ -88,120 +111,114 @@ def _disp(
     return f"{disp}{o}{d}"
 
 
-class XMLLinkable(Linkable):
-    PATH: str
-    xml: Element
-
-    def __init__(self, xml: Element):
-        self.xml = xml
-
-    @staticmethod
-    def _build_link(
-        parent: Linkable, item: str, raw: Type, type: Typed, link: Type[T]
-    ) -> T:
-        if type.type is list:
-            return [link(i) for i in parent.xml.findall(link.PATH)]
-        else:
-            return link(parent.xml.find(link.PATH))
-
-    def __str__(self):
-        lists = [
-            (name, [str(i) for i in lst])
-            for name, lst in self.get_lists().items()
-            if lst
-        ]
-        return "".join(f"\n" + indent("\n".join(lst), _SPACE) for name, lst in lists)
-
-
-class Root(XMLLinkable):
-    profiles: List[Profile]
-    rules: List[Rule]
-    info_links: List[InfoLink]
-    cost_types: List[CostType]
-    profile_types: List[ProfileType]
-    category_entries: List[CategoryEntry]
-    force_entries: List[ForceEntry]
-    selection_entries: List[SelectionEntry]
-    entry_links: List[EntryLink]
-    shared_selection_entries: List[SharedSelectionEntry]
-    shared_selection_entries_groups: List[SharedSelectionEntryGroups]
-    shared_rules: List[SharedRules]
-    shared_profiles: List[SharedProfile]
-
-    @property
-    def id(self):
-        return self.xml.attrib["id"]
-
-    @property
-    def name(self):
-        return self.xml.attrib["name"]
-
-    @property
-    def book(self):
-        return self.xml.attrib["book"]
-
-    @property
-    def revision(self):
-        return self.xml.attrib["revision"]
-
-    @property
-    def battle_scribe_version(self):
-        return self.xml.attrib["battleScribeVersion"]
-
-    @property
-    def author_name(self):
-        return self.xml.attrib["authorName"]
-
-    @property
-    def author_url(self):
-        return self.xml.attrib["authorUrl"]
-
-    @property
-    def game_system_id(self):
-        return self.xml.attrib["gameSystemId"]
-
-    @property
-    def game_system_revision(self):
-        return self.xml.attrib["gameSystemRevision"]
-
-    @property
-    def xmlns(self):
-        return self.xml.attrib["xmlns"]
-
-    def __str__(self):
-        return f"{self.name} - {self.id}" + super().__str__()
-
-
-class Profile(XMLLinkable):
-    PATH = f"{BS}profiles/{BS}profile"
-
-    profiles: List[Profile]
-    rules: List[Rule]
-    info_links: List[InfoLink]
-    modifiers: List[Modifier]
-    characteristics: List[Characteristic]
-
-    @property
-    def id(self) -> str:
-        return self.xml.attrib["id"]
-
-    @property
-    def name(self) -> str:
-        return self.xml.attrib["name"]
-
-    @property
-    def hidden(self) -> bool:
-        return _BOOL[self.xml.attrib["hidden"]]
-
-    @property
-    def profile_type_id(self) -> str:
-        return self.xml.attrib["profileTypeId"]
-
-    @property
-    def profile_type_name(self) -> str:
-        return self.xml.attrib.get("profileTypeName")
-
-    def __str__(self):
+class Root(generated.Catalogue):
+    xmlns = Attribute("xmlns")
+
+    def __init__(self, xml: Element, library: Optional[Library] = None):
+        super().__init__(xml, self)
+        # Not ``library``, that's the document's own attribute.
+        self._library = library
+
+    @classmethod
+    def load(cls, path: str, backend: str = "etree") -> Root:
+        """Load a catalogue or game system, which may be zipped.
+
+        ``backend`` names the parser to use, see :mod:`.backends`.
+        """
+        return cls(parse(path, backend))
+
+    @property
+    def index(self) -> Index:
+        index = self.__dict__.get("_index")
+        if index is None:
+            index = self._index = Index(self)
+        return index
+
+    @property
+    def tags(self) -> Tags:
+        tags = self.__dict__.get("_tags")
+        if tags is None:
+            tags = self._tags = Tags(self)
+        return tags
+
+    def query(self, selector: str) -> List[XMLLinkable]:
+        """Get the nodes matching a selector, in document order.
+
+        For example ``selectionEntry[type=unit] profile[profileTypeName=Unit]``
+        gets the unit profiles of unit entries, see :func:`.query.compile`.
+        """
+        return compile_selector(selector)(self.tags)
+
+    def resolve(self, id: str) -> Optional[XMLLinkable]:
+        """Get the node with the id ``id``, building the index on first use.
+
+        Ids that aren't in this document are looked up in the files it
+        depends on, when it belongs to a :class:`Library`.
+        """
+        node = self.index.resolve(id)
+        if node is None and self._library is not None:
+            return self._library.resolve(id, self)
+        return node
+
+    def freeze(self) -> FrozenRoot:
+        """Convert the document into immutable records, see :func:`freeze`."""
+        from .frozen import freeze
+
+        return freeze(self)
+
+    @classmethod
+    def stream(cls, source: Union[str, IO[bytes]]) -> Iterator[XMLLinkable]:
+        """Yield the top level nodes of a document as they finish parsing.
+
+        A node's element is cleared, and removed from the document, when the
+        next node is requested. So only the node being handled is kept in
+        memory, no matter the size of the file. Zipped files are decompressed
+        as they're parsed.
+
+        The nodes have no root: the rest of the document isn't kept, so ids
+        can't be resolved and links' ``target`` and repeats' ``child`` are
+        ``None``. Resolve their ``target_id`` and ``child_id`` against a
+        loaded :class:`Root` instead.
+        """
+        if isinstance(source, str):
+            with open_source(source) as f:
+                yield from cls.stream(f)
+            return
+
+        paths: Dict[Tuple[str, ...], Type[XMLLinkable]] = {}
+        for name in cls._link_names():
+            link = cls._link_schema()[name][2]
+            paths[split_path(link.PATH)] = link
+
+        depth = 0
+        container: Optional[Element] = None
+        for event, element in iterparse(source, events=("start", "end")):
+            if event == "start":
+                depth += 1
+                if depth == 1 and element.tag.startswith(GAME_SYSTEM):
+                    paths = {
+                        tuple(tag.replace(BS, GAME_SYSTEM) for tag in path): link
+                        for path, link in paths.items()
+                    }
+                elif depth == 2:
+                    container = element
+                continue
+            depth -= 1
+            if depth == 2:
+                link = paths.get((container.tag, element.tag))
+                if link is not None:
+                    yield link(element, None)
+                element.clear()
+                container.remove(element)
+            elif depth == 1:
+                element.clear()
+
+    def _header(self) -> str:
+        return f"{self.name} - {self.id}"
+
+
+class Profile(generated.Profile):
+    def _header(self) -> str:
         return (
             _disp(
                 "Profile",
@@ -211,416 +228,135 @@ class Profile(XMLLinkable):
                 p_id=self.profile_type_id,
                 flags=bools(hidden=self.hidden),
             )
-            + super().__str__()
         )
 
 
-class Rule(XMLLinkable):
-    PATH = f"{BS}rules/{BS}rule"
-
-    profiles: List[Profile]
-    rules: List[Rule]
-    info_links: List[InfoLink]
-    modifiers: List[Modifier]
-    constraints: List[Constraint]
-
-    @property
-    def id(self) -> str:
-        return self.xml.attrib["id"]
-
-    @property
-    def name(self) -> str:
-        return self.xml.attrib["name"]
-
-    @property
-    def hidden(self) -> bool:
-        return _BOOL[self.xml.attrib["hidden"]]
-
-    @property
-    def description(self) -> str:
-        return self.xml.find(f"{BS}description").text
-
-    def __str__(self):
+class Rule(generated.Rule):
+    def _header(self) -> str:
         return (
             _disp("Rule", name=self.name, id=self.id, flags=bools(hidden=self.hidden))
-            + f"\n {indent(self.description, _SPACE)}"
-            + super().__str__()
+            + f"\n {indent(self.description or '', _SPACE)}"
         )
 
 
-class InfoLink(XMLLinkable):
-    PATH = f"{BS}infoLinks/{BS}infoLink"
-
-    profiles: List[Profile]
-    rules: List[Rule]
-    info_links: List[InfoLink]
-    modifiers: List[Modifier]
-
-    @property
-    def id(self) -> str:
-        return self.xml.attrib["id"]
-
-    @property
-    def name(self) -> str:
-        return self.xml.attrib.get("name")
-
-    @property
-    def hidden(self) -> bool:
-        return _BOOL[self.xml.attrib["hidden"]]
-
+class InfoLink(generated.InfoLink):
     @property
-    def target_id(self) -> str:
-        return self.xml.attrib["targetId"]
+    def target(self) -> Optional[XMLLinkable]:
+        return self._resolve(self.target_id)
 
-    @property
-    def type(self) -> str:
-        return self.xml.attrib["type"]
-
-    def __str__(self):
+    def _header(self) -> str:
         bs = bools(self.hidden)
         return (
             f"InfoLink[{bs}](type={self.type})\n"
-            f" {self.name} [{self.id} -> {self.target_id}]" + super().__str__()
+            f" {self.name} [{self.id} -> {self.target_id}]"
         )
 
 
-# TODO: Add
-class CostType(XMLLinkable):
-    PATH = f"{BS}costTypes/{BS}costType"
-
-
-class ProfileType(XMLLinkable):
-    PATH = f"{BS}profileTypes/{BS}profileType"
-
-    characteristic_types: List[CharacteristicType]
-
-    @property
-    def id(self) -> str:
-        return self.xml.attrib["id"]
-
-    @property
-    def name(self) -> str:
-        return self.xml.attrib["name"]
-
-    def __str__(self):
-        bs = bools()
-        return f"ProfileType[{bs}]()\n" f" {self.name} [{self.id}]" + super().__str__()
-
-
-class CategoryEntry(XMLLinkable):
-    PATH = f"{BS}categoryEntries/{BS}categoryEntry"
-
-    profiles: List[Profile]
-    rules: List[Rule]
-    info_links: List[InfoLink]
-    modifiers: List[Modifier]
-    constraints: List[Constraint]
-
-    @property
-    def id(self) -> str:
-        return self.xml.attrib["id"]
+class CostType(generated.CostType):
+    def _header(self) -> str:
+        bs = bools(self.hidden)
+        return (
+            f"CostType[{bs}](limit={self.default_cost_limit})\n"
+            f" {self.name} [{self.id}]"
+        )
 
-    @property
-    def name(self) -> str:
-        return self.xml.attrib["name"]
 
-    def __str__(self):
+class CatalogueLink(generated.CatalogueLink):
+    def _header(self) -> str:
         bs = bools()
         return (
-            f"CategoryEntry[{bs}]()\n" f" {self.name} [{self.id}]" + super().__str__()
+            f"CatalogueLink[{bs}](type={self.type})\n"
+            f" {self.name} [{self.id} -> {self.target_id}]"
         )
 
 
-class ForceEntry(XMLLinkable):
-    PATH = f"{BS}forceEntries/{BS}forceEntry"
-
-    profiles: List[Profile]
-    rules: List[Rule]
-    info_links: List[InfoLink]
-    modifiers: List[Modifier]
-    constraints: List[Constraint]
-    force_entries: List[ForceEntry]
-    category_link: List[CategoryLink]
-
-    @property
-    def id(self) -> str:
-        return self.xml.attrib["id"]
-
-    @property
-    def name(self) -> str:
-        return self.xml.attrib["name"]
+class ProfileType(generated.ProfileType):
+    def _header(self) -> str:
+        bs = bools()
+        return f"ProfileType[{bs}]()\n" f" {self.name} [{self.id}]"
 
-    @property
-    def hidden(self) -> bool:
-        return _BOOL[self.xml.attrib["hidden"]]
 
-    def __str__(self):
+class CategoryEntry(generated.CategoryEntry):
+    def _header(self) -> str:
         bs = bools(self.hidden)
-        return f"ForceEntry[{bs}]()\n" f" {self.name} [{self.id}]" + super().__str__()
-
-
-class SelectionEntry(XMLLinkable):
-    PATH = f"{BS}selectionEntries/{BS}selectionEntry"
-
-    profiles: List[Profile]
-    rules: List[Rule]
-    info_links: List[InfoLink]
-    modifiers: List[Modifier]
-    constraints: List[Constraint]
-    category_links: List[CategoryLink]
-    selection_entries: List[SelectionEntry]
-    selection_entry_groups: List[SelectionEntryGroup]
-    entry_links: List[EntryLink]
-    # cost: Link[Cost]
-
-    @property
-    def id(self) -> str:
-        return self.xml.attrib["id"]
-
-    @property
-    def name(self) -> str:
-        return self.xml.attrib["name"]
-
-    @property
-    def page(self) -> Optional[int]:
-        page = self.xml.attrib.get("page")
-        if not page:
-            return None
-        return int(page)
+        return (
+            f"CategoryEntry[{bs}]()\n" f" {self.name} [{self.id}]"
+        )
 
-    @property
-    def hidden(self) -> bool:
-        return _BOOL[self.xml.attrib["hidden"]]
 
-    @property
-    def collective(self) -> bool:
-        return _BOOL[self.xml.attrib["collective"]]
+class ForceEntry(generated.ForceEntry):
+    def _header(self) -> str:
+        bs = bools(self.hidden)
+        return f"ForceEntry[{bs}]()\n" f" {self.name} [{self.id}]"
 
-    @property
-    def type(self) -> str:
-        return self.xml.attrib["type"]
 
-    def __str__(self):
+class SelectionEntry(generated.SelectionEntry):
+    def _header(self) -> str:
         bs = bools(self.hidden, collective=self.collective)
         return (
             f"SelectionEntry[{bs}](type={self.type}, page={self.page})\n"
-            f" {self.name} [{self.id}]" + super().__str__()
+            f" {self.name} [{self.id}]"
         )
 
 
-class EntryLink(XMLLinkable):
-    PATH = f"{BS}entryLinks/{BS}entryLink"
-
-    profiles: List[Profile]
-    rules: List[Rule]
-    info_links: List[InfoLink]
-    modifiers: List[Modifier]
-    constraints: List[Constraint]
-    category_link: List[CategoryLink]
-
-    @property
-    def id(self) -> str:
-        return self.xml.attrib["id"]
-
-    @property
-    def name(self) -> str:
-        return self.xml.attrib["name"]
-
-    @property
-    def hidden(self) -> bool:
-        return _BOOL[self.xml.attrib["hidden"]]
-
-    @property
-    def target_id(self) -> str:
-        return self.xml.attrib["targetId"]
-
+class EntryLink(generated.EntryLink):
     @property
-    def type(self) -> str:
-        return self.xml.attrib["type"]
+    def target(self) -> Optional[XMLLinkable]:
+        return self._resolve(self.target_id)
 
-    def __str__(self):
+    def _header(self) -> str:
         bs = bools(self.hidden)
         return (
             f"EntryLink[{bs}](type={self.type})\n"
-            f" {self.name} [{self.id} -> {self.target_id}]" + super().__str__()
+            f" {self.name} [{self.id} -> {self.target_id}]"
         )
 
 
-class SharedSelectionEntry(XMLLinkable):
-    PATH = f"{BS}sharedSelectionEntries/{BS}selectionEntry"
-
-    profiles: List[Profile]
-    rules: List[Rule]
-    info_links: List[InfoLink]
-    modifiers: List[Modifier]
-    constraints: List[Constraint]
-    category_link: List[CategoryLink]
-    selection_entries: List[SelectionEntry]
-    selection_entry_groups: List[SelectionEntryGroup]
-    entry_links: List[EntryLink]
-    costs: List[Cost]
-
-    @property
-    def id(self) -> str:
-        return self.xml.attrib["id"]
-
-    @property
-    def name(self) -> str:
-        return self.xml.attrib["name"]
-
-    @property
-    def page(self) -> Optional[int]:
-        page = self.xml.attrib.get("page")
-        if not page:
-            return None
-        return int(page)
-
-    @property
-    def hidden(self) -> bool:
-        return _BOOL[self.xml.attrib["hidden"]]
-
-    @property
-    def collective(self) -> bool:
-        return _BOOL[self.xml.attrib["collective"]]
-
-    @property
-    def type(self) -> str:
-        return self.xml.attrib["type"]
-
-    def __str__(self):
+class SharedSelectionEntry(generated.SharedSelectionEntry):
+    def _header(self) -> str:
         bs = bools(self.hidden)
         return (
             f"SharedSelectionEntry[{bs}](type={self.type}, page={self.page})\n"
-            f" {self.name} [{self.id}]" + super().__str__()
+            f" {self.name} [{self.id}]"
         )
 
 
-class SharedSelectionEntryGroups(XMLLinkable):
-    PATH = f"{BS}sharedSelectionEntryGroups/{BS}selectionEntryGroup"
-
-    profiles: List[Profile]
-    rules: List[Rule]
-    info_links: List[InfoLink]
-    modifiers: List[Modifier]
-    constraints: List[Constraint]
-    category_link: List[CategoryLink]
-    selection_entries: List[SelectionEntry]
-    selection_entry_groups: List[SelectionEntryGroup]
-    entry_links: List[EntryLink]
-
-    @property
-    def id(self) -> str:
-        return self.xml.attrib["id"]
-
-    @property
-    def name(self) -> str:
-        return self.xml.attrib["name"]
-
-    @property
-    def hidden(self) -> bool:
-        return _BOOL[self.xml.attrib["hidden"]]
-
-    @property
-    def collective(self) -> bool:
-        return _BOOL[self.xml.attrib["collective"]]
-
-    @property
-    def default_selection_entry_id(self) -> Optional[str]:
-        return self.xml.attrib.get("defaultSelectionEntryId")
-
-    def __str__(self):
+class SharedSelectionEntryGroup(generated.SharedSelectionEntryGroup):
+    def _header(self) -> str:
         bs = bools(self.hidden, collective=self.collective)
         return (
             f"SharedSelectionEntryGroups[{bs}](default={self.default_selection_entry_id})\n"
-            f" {self.name} [{self.id}]" + super().__str__()
+            f" {self.name} [{self.id}]"
         )
 
 
-# TODO: Fix
-class SharedRules(XMLLinkable):
-    PATH = f"{BS}sharedRules/{BS}sharedRule"
-
-
-class SharedProfile(XMLLinkable):
-    PATH = f"{BS}sharedProfiles/{BS}profile"
+# The name it had before the classes were generated from the schema.
+SharedSelectionEntryGroups = SharedSelectionEntryGroup
 
-    profiles: List[Profile]
-    rules: List[Rule]
-    info_links: List[InfoLink]
-    modifiers: List[Modifier]
-    characteristics: List[Characteristic]
 
-    @property
-    def id(self) -> str:
-        return self.xml.attrib["id"]
-
-    @property
-    def name(self) -> str:
-        return self.xml.attrib["name"]
-
-    @property
-    def hidden(self) -> bool:
-        return _BOOL[self.xml.attrib["hidden"]]
-
-    @property
-    def profile_type_id(self) -> str:
-        return self.xml.attrib["profileTypeId"]
+class SharedRule(generated.SharedRule):
+    def _header(self) -> str:
+        bs = bools(hidden=self.hidden)
+        return (
+            _disp("SharedRule", name=self.name, id=self.id, flags=bs)
+            + f"\n {indent(self.description or '', _SPACE)}"
+        )
 
-    @property
-    def profile_type_name(self) -> str:
-        return self.xml.attrib.get("profileTypeName")
 
-    def __str__(self):
+class SharedProfile(generated.SharedProfile):
+    def _header(self) -> str:
         bs = bools(self.hidden)
         return (
             f"SharedProfile[{bs}]() {self.profile_type_name} [{self.profile_type_id}]\n"
-            f" {self.name} [{self.id}]" + super().__str__()
+            f" {self.name} [{self.id}]"
         )
 
 
 # Base
 
 
-class Constraint(XMLLinkable):
-    PATH = f"{BS}constraints/{BS}constraint"
-
-    @property
-    def field(self) -> str:
-        return self.xml.attrib["field"]
-
-    @property
-    def scope(self) -> str:
-        return self.xml.attrib["scope"]
-
-    @property
-    def value(self) -> str:
-        return self.xml.attrib["value"]
-
-    @property
-    def percent_value(self) -> bool:
-        return _BOOL[self.xml.attrib["percentValue"]]
-
-    @property
-    def shared(self) -> bool:
-        return _BOOL[self.xml.attrib["shared"]]
-
-    @property
-    def include_child_selections(self) -> bool:
-        return _BOOL[self.xml.attrib["includeChildSelections"]]
-
-    @property
-    def include_child_forces(self) -> bool:
-        return _BOOL[self.xml.attrib["includeChildForces"]]
-
-    @property
-    def id(self) -> str:
-        return self.xml.attrib["id"]
-
-    @property
-    def type(self) -> str:
-        return self.xml.attrib["type"]
-
-    def __str__(self) -> str:
+class Constraint(generated.Constraint):
+    def _header(self) -> str:
         bs = bools(
             share=self.shared,
             forces=self.include_child_forces,
@@ -629,82 +365,26 @@ class Constraint(XMLLinkable):
         )
         return (
             f"Constraint[{bs}](scope={self.scope}, type={self.type})\n"
-            f" {self.field} = {self.value} [{self.id}]" + super().__str__()
+            f" {self.field} = {self.value} [{self.id}]"
         )
 
 
-class Modifier(XMLLinkable):
-    PATH = f"{BS}modifiers/{BS}modifier"
-
-    repeats: List[Repeat]
-    conditions: List[Condition]
-    condition_groups: List[ConditionGroup]
-
-    @property
-    def field(self) -> str:
-        return self.xml.attrib["field"]
-
-    @property
-    def value(self) -> str:
-        return self.xml.attrib["value"]
-
-    @property
-    def type(self) -> str:
-        return self.xml.attrib["type"]
-
-    def __str__(self):
+class Modifier(generated.Modifier):
+    def _header(self) -> str:
         bs = bools()
         return (
             f"Modifier[{bs}](type={self.type})\n"
-            f" {self.value} = {self.field}" + super().__str__()
+            f" {self.value} = {self.field}"
         )
 
 
-class Repeat(XMLLinkable):
-    PATH = f"{BS}repeats/{BS}repeat"
-
-    @property
-    def field(self) -> str:
-        return self.xml.attrib["field"]
-
-    @property
-    def scope(self) -> str:
-        return self.xml.attrib["scope"]
-
-    @property
-    def value(self) -> str:
-        return self.xml.attrib["value"]
-
-    @property
-    def percent_value(self) -> bool:
-        return _BOOL[self.xml.attrib["percentValue"]]
-
-    @property
-    def shared(self) -> bool:
-        return _BOOL[self.xml.attrib["shared"]]
-
-    @property
-    def include_child_selections(self) -> bool:
-        return _BOOL[self.xml.attrib["includeChildSelections"]]
-
-    @property
-    def include_child_forces(self) -> bool:
-        return _BOOL[self.xml.attrib["includeChildForces"]]
-
-    @property
-    def child_id(self) -> str:
-        return self.xml.attrib["childId"]
-
+class Repeat(generated.Repeat):
     @property
-    def repeats(self):
-        return self.xml.attrib["repeats"]
-
-    @property
-    def round_up(self):
-        return self.xml.attrib["roundUp"]
+    def child(self) -> Optional[XMLLinkable]:
+        return self._resolve(self.child_id)
 
     # TODO: Add missing values
-    def __str__(self):
+    def _header(self) -> str:
         bs = bools(
             share=self.shared,
             forces=self.include_child_forces,
@@ -714,50 +394,16 @@ class Repeat(XMLLinkable):
         )
         return (
             f"Repeat[{bs}](scope={self.scope}, repeats={self.repeats})\n"
-            f" {self.field} = {self.value} [{self.child_id}]" + super().__str__()
+            f" {self.field} = {self.value} [{self.child_id}]"
         )
 
 
-class Condition(XMLLinkable):
-    PATH = f"{BS}conditions/{BS}condition"
-
-    @property
-    def field(self) -> str:
-        return self.xml.attrib["field"]
-
-    @property
-    def scope(self) -> str:
-        return self.xml.attrib["scope"]
-
-    @property
-    def value(self) -> str:
-        return self.xml.attrib["value"]
-
-    @property
-    def percent_value(self) -> bool:
-        return _BOOL[self.xml.attrib["percentValue"]]
-
-    @property
-    def shared(self) -> bool:
-        return _BOOL[self.xml.attrib["shared"]]
-
-    @property
-    def include_child_selections(self) -> bool:
-        return _BOOL[self.xml.attrib["includeChildSelections"]]
-
-    @property
-    def include_child_forces(self) -> bool:
-        return _BOOL[self.xml.attrib["includeChildForces"]]
-
-    @property
-    def child_id(self) -> str:
-        return self.xml.attrib["childId"]
-
+class Condition(generated.Condition):
     @property
-    def type(self) -> str:
-        return self.xml.attrib["type"]
+    def child(self) -> Optional[XMLLinkable]:
+        return self._resolve(self.child_id)
 
-    def __str__(self):
+    def _header(self) -> str:
         bs = bools(
             share=self.shared,
             forces=self.include_child_forces,
@@ -766,166 +412,63 @@ class Condition(XMLLinkable):
         )
         return (
             f"Condition[{bs}](scope={self.scope}, type={self.type})\n"
-            f" {self.field} = {self.value} [{self.child_id}]" + super().__str__()
+            f" {self.field} = {self.value} [{self.child_id}]"
         )
 
 
-class ConditionGroup(XMLLinkable):
-    PATH = f"{BS}conditionGroups/{BS}conditionGroup"
-
-    conditions: List[Condition]
-    condition_groups: List[ConditionGroup]
-
-    @property
-    def type(self) -> str:
-        return self.xml.attrib["type"]
-
-    def __str__(self):
+class ConditionGroup(generated.ConditionGroup):
+    def _header(self) -> str:
         bs = bools()
-        return f"ConditionGroup[{bs}](type={self.type})" + super().__str__()
+        return f"ConditionGroup[{bs}](type={self.type})"
 
 
 # Other
 
 
-class CharacteristicType(XMLLinkable):
-    PATH = f"{BS}characteristicTypes/{BS}characteristicType"
-
-    @property
-    def id(self) -> str:
-        return self.xml.attrib["id"]
-
-    @property
-    def name(self) -> str:
-        return self.xml.attrib["name"]
-
-    def __str__(self):
+class CharacteristicType(generated.CharacteristicType):
+    def _header(self) -> str:
         bs = bools()
         return (
             f"CharacteristicType[{bs}]()\n"
-            f" {self.name} [{self.id}]" + super().__str__()
+            f" {self.name} [{self.id}]"
         )
 
 
-class CategoryLink(XMLLinkable):
-    PATH = f"{BS}categoryLinks/{BS}categoryLink"
-
-    profiles: List[Profile]
-    rules: List[Rule]
-    info_links: List[InfoLink]
-    modifiers: List[Modifier]
-    constraints: List[Constraint]
-
-    @property
-    def id(self) -> str:
-        return self.xml.attrib["id"]
-
+class CategoryLink(generated.CategoryLink):
     @property
-    def name(self) -> str:
-        return self.xml.attrib.get("name")
+    def target(self) -> Optional[XMLLinkable]:
+        return self._resolve(self.target_id)
 
-    @property
-    def hidden(self) -> bool:
-        return _BOOL[self.xml.attrib["hidden"]]
-
-    @property
-    def target_id(self) -> str:
-        return self.xml.attrib["targetId"]
-
-    @property
-    def primary(self) -> str:
-        return self.xml.attrib["primary"]
-
-    def __str__(self):
+    def _header(self) -> str:
         bs = bools(hidden=self.hidden)
         return (
             f"CategoryLink[{bs}](primary={self.primary})\n"
-            f" {self.name} [{self.id} -> {self.target_id}]" + super().__str__()
+            f" {self.name} [{self.id} -> {self.target_id}]"
         )
 
 
-class Characteristic(XMLLinkable):
-    PATH = f"{BS}characteristics/{BS}characteristic"
-
-    @property
-    def name(self) -> str:
-        return self.xml.attrib["name"]
-
-    @property
-    def characteristic_type_id(self) -> str:
-        return self.xml.attrib["characteristicTypeId"]
-
-    @property
-    def value(self) -> str:
-        return self.xml.attrib.get("value")
-
-    def __str__(self):
+class Characteristic(generated.Characteristic):
+    def _header(self) -> str:
         bs = bools()
         return (
             f"Characteristic[{bs}](characteristic={self.characteristic_type_id})\n"
-            f" {self.name} = {self.value}" + super().__str__()
+            f" {self.name} = {self.value}"
         )
 
 
-class SelectionEntryGroup(XMLLinkable):
-    PATH = f"{BS}selectionEntryGroups/{BS}selectionEntryGroup"
-
-    profiles: List[Profile]
-    rules: List[Rule]
-    info_links: List[InfoLink]
-    modifiers: List[Modifier]
-    constraints: List[Constraint]
-    category_link: List[CategoryLink]
-    selection_entries: List[SelectionEntry]
-    selection_entry_groups: List[SelectionEntryGroup]
-    entry_links: List[EntryLink]
-
-    @property
-    def id(self) -> str:
-        return self.xml.attrib["id"]
-
-    @property
-    def name(self) -> str:
-        return self.xml.attrib.get("name")
-
-    @property
-    def hidden(self) -> bool:
-        return _BOOL[self.xml.attrib["hidden"]]
-
-    @property
-    def collective(self):
-        return self.xml.attrib["collective"]
-
-    @property
-    def default_selection_entry_id(self):
-        return self.xml.attrib.get("defaultSelectionEntryId")
-
-    def __str__(self):
+class SelectionEntryGroup(generated.SelectionEntryGroup):
+    def _header(self) -> str:
         bs = bools()
         return (
             f"SelectionEntryGroup[{bs}](default={self.default_selection_entry_id})\n"
-            f" {self.name} [{self.id}]" + super().__str__()
+            f" {self.name} [{self.id}]"
         )
 
 
-class Cost(XMLLinkable):
-    PATH = f"{BS}costs/{BS}cost"
-
-    @property
-    def name(self) -> str:
-        return self.xml.attrib.get("name")
-
-    @property
-    def value(self) -> str:
-        return self.xml.attrib["value"]
-
-    @property
-    def cost_type_id(self) -> str:
-        return self.xml.attrib["costTypeId"]
-
-    def __str__(self):
+class Cost(generated.Cost):
+    def _header(self) -> str:
         bs = bools()
         return (
             f"Cost[{bs}](cost={self.cost_type_id})\n"
-            f" {self.name} = {self.value}" + super().__str__()
+            f" {self.name} = {self.value}"
         )
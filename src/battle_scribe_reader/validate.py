@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+from .linkable import Linkable
+from .roster import Force, Node, Roster, Selection, find_scope
+
+__all__ = ["Check", "Validator", "Violation"]
+
+_SELECTIONS = "selections"
+_UNLIMITED = -1.0
+
+
+class Violation(NamedTuple):
+    constraint: Linkable
+    scope: Node
+    value: float
+    limit: float
+
+
+class Check:
+    """One constraint checked in one scope, shared by all its selections.
+
+    ``key`` is the constrained entry's id for ``selections`` constraints,
+    and ``None`` for cost constraints, which depend on every selection.
+    Percentage constraints, and ones counted per link rather than shared,
+    aren't supported and raise ``ValueError``.
+    """
+
+    constraint: Linkable
+    scope: Node
+    key: Optional[str]
+    owners: Set[int]
+
+    def __init__(self, constraint: Linkable, scope: Node, key: Optional[str]):
+        if constraint.percent_value:
+            raise ValueError(f"percentage constraint {constraint.id!r}")
+        if constraint.shared is False:
+            raise ValueError(f"unshared constraint {constraint.id!r}")
+        self.constraint = constraint
+        self.scope = scope
+        self.key = key
+        self.owners = set()
+        self.limit = float(constraint.value or 0)
+
+    def value(self) -> float:
+        constraint = self.constraint
+        if self.key is None:
+            return self.scope.totals.get(constraint.field, 0.0)
+        if constraint.include_child_selections:
+            return self.scope.counts.get(self.key, 0)
+        return sum(
+            child.number
+            for child in self.scope.children
+            if isinstance(child, Selection) and child.entry_key == self.key
+        )
+
+    def run(self) -> Optional[Violation]:
+        value = self.value()
+        type = self.constraint.type
+        if type == "min" and value < self.limit:
+            return Violation(self.constraint, self.scope, value, self.limit)
+        if type == "max" and self.limit != _UNLIMITED and value > self.limit:
+            return Violation(self.constraint, self.scope, value, self.limit)
+        return None
+
+
+def _scope(selection: Selection, scope: str) -> Optional[Node]:
+    if scope == "self":
+        return selection
+    return find_scope(selection.parent, scope)
+
+
+class Validator:
+    """Check a roster against the constraints of its selected entries.
+
+    Checks are indexed on their scope and the entry they count, so after an
+    edit only the checks in the scopes above the edit, counting the edited
+    entry, are run again. Constraints are checked wherever their entry, or
+    the entry link leading to it, is selected, and wherever its parent entry
+    is selected, so a minimum is broken when nothing is selected.
+
+    Percentage and unshared constraints aren't checked, they're kept in
+    ``unsupported`` by id.
+    """
+
+    roster: Roster
+    violations: Dict[Tuple[int, str], Violation]
+    unsupported: Dict[str, Linkable]
+    _checks: Dict[Tuple[int, str], Check]
+    _index: Dict[Tuple[int, Optional[str]], Set[Tuple[int, str]]]
+
+    def __init__(self, roster: Roster, catalogue: Linkable) -> None:
+        self.roster = roster
+        self.catalogue = catalogue
+        self.violations = {}
+        self.unsupported = {}
+        self._checks = {}
+        self._index = {}
+        self._added(roster)
+        roster.listeners.append(self._changed)
+
+    def close(self) -> None:
+        """Stop following changes to the roster."""
+        self.roster.listeners.remove(self._changed)
+
+    def constraints(self, selection: Selection) -> List[Linkable]:
+        """Get the constraints of the entry, and links, a selection is of."""
+        constraints: List[Linkable] = []
+        for id in (selection.entry_id or "").split("::"):
+            node = self.catalogue.resolve(id) if id else None
+            if node is not None:
+                constraints.extend(getattr(node, "constraints", ()))
+        return constraints
+
+    def _offered(
+        self, entry: Optional[Linkable]
+    ) -> Iterator[Tuple[str, List[Linkable]]]:
+        # The entries selectable in ``entry``, also through groups, with the
+        # constraints of their links and themselves.
+        for child in getattr(entry, "selection_entries", ()):
+            yield child.id, list(getattr(child, "constraints", ()))
+        for link in getattr(entry, "entry_links", ()):
+            target = self.catalogue.resolve(link.target_id)
+            if link.type == "selectionEntryGroup":
+                yield from self._offered(target)
+                continue
+            constraints = list(getattr(link, "constraints", ()))
+            constraints.extend(getattr(target, "constraints", ()))
+            yield link.target_id, constraints
+        for group in getattr(entry, "selection_entry_groups", ()):
+            yield from self._offered(group)
+
+    def _added(self, root: Node) -> None:
+        for node in root.walk():
+            if isinstance(node, Selection):
+                for constraint in self.constraints(node):
+                    scope = _scope(node, constraint.scope)
+                    self._add(node, constraint, scope, node.entry_key)
+                entry = node.entry
+            elif isinstance(node, Force):
+                entry = self.catalogue
+            else:
+                continue
+            for key, constraints in self._offered(entry):
+                for constraint in constraints:
+                    scope = find_scope(node, constraint.scope)
+                    self._add(node, constraint, scope, key)
+
+    def _add(
+        self,
+        owner: Node,
+        constraint: Linkable,
+        scope: Optional[Node],
+        key: Optional[str],
+    ) -> None:
+        if scope is None:
+            return
+        if constraint.field != _SELECTIONS:
+            key = None
+        name = (id(scope), constraint.id or str(id(constraint)))
+        check = self._checks.get(name)
+        if check is None:
+            try:
+                check = Check(constraint, scope, key)
+            except ValueError:
+                self.unsupported[name[1]] = constraint
+                return
+            self._checks[name] = check
+            self._index.setdefault((id(scope), key), set()).add(name)
+        check.owners.add(id(owner))
+        self._run(name)
+
+    def _removed(self, root: Node) -> None:
+        removed = {id(node) for node in root.walk()}
+        for name, check in list(self._checks.items()):
+            check.owners -= removed
+            if not check.owners or id(check.scope) in removed:
+                del self._checks[name]
+                self._index[(id(check.scope), check.key)].discard(name)
+                self.violations.pop(name, None)
+
+    def _run(self, name: Tuple[int, str]) -> None:
+        violation = self._checks[name].run()
+        if violation is None:
+            self.violations.pop(name, None)
+        else:
+            self.violations[name] = violation
+
+    def _affected(self, origin: Node, keys: Iterable[Optional[str]]) -> None:
+        for node in origin.ancestors():
+            for key in keys:
+                for name in self._index.get((id(node), key), ()):
+                    self._run(name)
+
+    def _changed(self, origin: Node, node: Node) -> None:
+        if node.parent is None and node is not origin:
+            self._removed(node)
+        elif node is not origin:
+            self._added(node)
+        keys: Set[Optional[str]] = {None}
+        keys.update(n.entry_key for n in node.walk() if isinstance(n, Selection))
+        self._affected(origin, keys)
+
+    def validate(self) -> List[Violation]:
+        """Run every check again, rather than only the affected ones."""
+        for name in self._checks:
+            self._run(name)
+        return list(self.violations.values())
+
+    def errors(self) -> List[Violation]:
+        """Get the current violations, kept up to date after each edit."""
+        return list(self.violations.values())
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import io
+from typing import TYPE_CHECKING, Optional, Type, TypeVar
+from xml.etree.ElementTree import Element
+
+from .linkable import Linkable
+from .render import render
+from .typed import Typed
+
+if TYPE_CHECKING:
+    from .tree import Root
+
+__all__ = ["XMLLinkable"]
+
+T = TypeVar("T")
+
+
+class XMLLinkable(Linkable):
+    PATH: str
+    xml: Element
+
+    def __init__(self, xml: Element, root: Optional[Root] = None):
+        self.xml = xml
+        self.root = root
+
+    @staticmethod
+    def _build_link(
+        parent: Linkable, item: str, raw: Type, type: Typed, link: Type[T]
+    ) -> T:
+        if type.type is list:
+            return [link(i, parent.root) for i in parent.xml.findall(link.PATH)]
+        else:
+            return link(parent.xml.find(link.PATH), parent.root)
+
+    def _resolve(self, id: str) -> Optional[XMLLinkable]:
+        if self.root is None:
+            return None
+        return self.root.resolve(id)
+
+    def _header(self) -> str:
+        return ""
+
+    def __str__(self):
+        stream = io.StringIO()
+        render(self, stream)
+        return stream.getvalue()[:-1]
@@ -0,0 +1,29 @@
+import os
+
+import pytest
+
+from battle_scribe_reader.roster import Roster
+from battle_scribe_reader.tree import Root
+
+
+@pytest.fixture
+def data_dir():
+    """The directory of test documents."""
+    return os.path.join(os.path.dirname(__file__), "data")
+
+
+@pytest.fixture
+def sample_path(data_dir):
+    return os.path.join(data_dir, "sample.cat")
+
+
+@pytest.fixture
+def catalogue(sample_path):
+    """A freshly loaded ``sample.cat``."""
+    return Root.load(sample_path)
+
+
+@pytest.fixture
+def roster(data_dir, catalogue):
+    """``sample.ros``, against :func:`catalogue`."""
+    return Roster.load(os.path.join(data_dir, "sample.ros"), catalogue)
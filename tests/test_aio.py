@@ -0,0 +1,86 @@
+import asyncio
+import os
+import threading
+import time
+
+import pytest
+
+from battle_scribe_reader.aio import AsyncLoader
+from battle_scribe_reader.tree import Root
+
+
+class Counting:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = []
+        self.running = 0
+        self.most = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, path):
+        with self.lock:
+            self.calls.append(os.path.basename(path))
+            self.running += 1
+            self.most = max(self.most, self.running)
+        time.sleep(self.delay)
+        with self.lock:
+            self.running -= 1
+        return path
+
+
+def test_load(sample_path):
+    async def main():
+        loader = AsyncLoader()
+        root = await loader.load(sample_path)
+        assert isinstance(root, Root)
+        assert "_index" in root.__dict__
+        assert loader.pending == []
+
+    asyncio.run(main())
+
+
+def test_dedupe(sample_path):
+    async def main():
+        counting = Counting(0.05)
+        loader = AsyncLoader(loader=counting)
+        results = await asyncio.gather(*(loader.load(sample_path) for _ in range(50)))
+        assert counting.calls == ["sample.cat"]
+        assert len(set(results)) == 1
+        await loader.load(sample_path)
+        assert len(counting.calls) == 2
+
+    asyncio.run(main())
+
+
+def test_limit(data_dir):
+    async def main():
+        counting = Counting(0.05)
+        loader = AsyncLoader(limit=2, loader=counting)
+        paths = [os.path.join(data_dir, f"{i}.cat") for i in range(6)]
+        assert await loader.load_many(paths) == paths
+        assert counting.most == 2
+
+    asyncio.run(main())
+
+
+def test_cancel():
+    async def main():
+        counting = Counting(0.05)
+        loader = AsyncLoader(limit=1, loader=counting)
+        first = asyncio.ensure_future(loader.load("a.cat"))
+        waiters = [asyncio.ensure_future(loader.load("b.cat")) for _ in range(2)]
+        await asyncio.sleep(0.01)
+
+        waiters[0].cancel()
+        await asyncio.sleep(0)
+        assert loader.pending == [os.path.abspath("a.cat"), os.path.abspath("b.cat")]
+        waiters[1].cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiters[1]
+        await asyncio.sleep(0.01)
+        assert loader.pending == [os.path.abspath("a.cat")]
+
+        assert await first == os.path.abspath("a.cat")
+        assert counting.calls == ["a.cat"]
+
+    asyncio.run(main())
@@ -0,0 +1,55 @@
+import io
+import os
+import xml.etree.ElementTree
+
+import pytest
+
+from battle_scribe_reader.backends import Node, available, get_backend
+from battle_scribe_reader.bench.backends import bench_backends
+from battle_scribe_reader.tree import BS, Root
+
+
+@pytest.mark.parametrize("backend", available())
+def test_same_tree(backend, sample_path, data_dir):
+    # type: (str) -> None
+    assert str(Root.load(sample_path, backend)) == str(Root.load(sample_path))
+    system = Root.load(os.path.join(data_dir, "sample.gst"), backend)
+    assert [p.name for p in system.shared_profiles] == ["Frag Grenade"]
+
+
+def test_expat_node(sample_path):
+    # type: () -> None
+    with open(sample_path, "rb") as f:
+        node = get_backend("expat")(f)
+    element = xml.etree.ElementTree.parse(sample_path).getroot()
+    assert isinstance(node, Node)
+    assert [n.tag for n in node.iter()] == [e.tag for e in element.iter()]
+    assert node.get("id") == "cat-1" and node.get("missing", "-") == "-"
+    assert node.text is None
+    rule = node.find(f"{BS}sharedRules/{BS}rule")
+    assert rule.findtext(f"{BS}description").startswith("Friendly units")
+    assert len(node.findall(f"{BS}sharedRules/*")) == 2
+    assert node.find(f"{BS}missing/{BS}rule") is None
+    assert node[0] is not node[1] and node[0] != node[1]
+    with pytest.raises(SyntaxError):
+        node.findall(f".//{BS}rule")
+
+
+def test_get_backend():
+    # type: () -> None
+    with pytest.raises(ValueError):
+        get_backend("missing")
+    assert get_backend("etree")(io.BytesIO(b"<a> <b/></a>")).tag == "a"
+
+
+def test_lxml(sample_path):
+    # type: () -> None
+    pytest.importorskip("lxml")
+    assert str(Root.load(sample_path, "lxml")) == str(Root.load(sample_path))
+
+
+def test_bench_backends(sample_path):
+    # type: () -> None
+    results = bench_backends(sample_path, repeat=1, backends=["etree", "expat"])
+    assert set(results) == {"etree", "expat"}
+    assert all(result["memory"] > 0 for result in results.values())
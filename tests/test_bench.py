@@ -0,0 +1,29 @@
+import io
+
+from battle_scribe_reader.bench import STAGES, generate, run
+from battle_scribe_reader.linkable import walk
+from battle_scribe_reader.tree import Root
+
+
+def test_generate(tmp_path):
+    path = str(tmp_path / "synthetic.cat")
+    with open(path, "w") as f:
+        generate(f, entries=4, depth=1, children=2)
+    root = Root.load(path)
+    assert len(root.selection_entries) == 2
+    assert len(root.shared_selection_entries) == 2
+    assert len(root.entry_links) == 2
+    assert all(link.target is not None for link in root.entry_links)
+    links = [node for node in walk(root) if hasattr(node, "target_id")]
+    assert links and all(link.target is not None for link in links)
+
+    result = run(path, repeat=1)
+    assert set(result["stages"]) == set(STAGES)
+    assert result["nodes"] == sum(1 for _ in walk(root))
+
+
+def test_generate_deterministic():
+    first, second = io.StringIO(), io.StringIO()
+    generate(first, entries=3, seed=1)
+    generate(second, entries=3, seed=1)
+    assert first.getvalue() == second.getvalue()
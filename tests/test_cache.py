@@ -0,0 +1,82 @@
+import marshal
+import os
+import shutil
+
+from battle_scribe_reader import cache as cache_module
+from battle_scribe_reader.cache import MAGIC, SUFFIX, Cache, dumps, loads
+
+
+def entries(cache):
+    return sorted(n for n in os.listdir(cache.directory) if n.endswith(SUFFIX))
+
+
+def test_round_trip(tmp_path, sample_path):
+    cache = Cache(str(tmp_path))
+    first = cache.load(sample_path)
+    assert len(entries(cache)) == 1
+    second = cache.load(sample_path)
+    assert first is not second
+    assert loads(dumps(first)).resolve("se-marine").name == "Marine"
+    assert dumps(second) == dumps(first)
+
+
+def test_invalidated_on_change(tmp_path, sample_path):
+    path = str(tmp_path / "sample.cat")
+    shutil.copy(sample_path, path)
+    cache = Cache(str(tmp_path / "cache"))
+    cache.load(path)
+    before = entries(cache)
+    with open(path) as f:
+        text = f.read().replace('name="Captain"', 'name="Chaplain"', 1)
+    with open(path, "w") as f:
+        f.write(text)
+    assert cache.load(path).selection_entries[0].name == "Chaplain"
+    after = entries(cache)
+    assert len(after) == 1 and after != before
+
+
+def test_evict(tmp_path, sample_path):
+    cache = Cache(str(tmp_path), max_size=0)
+    assert cache.load(sample_path).name == "Sample"
+    assert entries(cache) == []
+
+
+def test_key_on_layout(tmp_path, monkeypatch, sample_path):
+    cache = Cache(str(tmp_path))
+    key = cache.key(sample_path)
+    monkeypatch.setattr(cache_module, "_layout", lambda: "renamed")
+    assert cache.key(sample_path) != key
+
+
+def test_unknown_type(tmp_path, sample_path):
+    cache = Cache(str(tmp_path))
+    cached = cache._path(sample_path)
+    with open(cached, "wb") as f:
+        f.write(MAGIC + marshal.dumps(("SharedRules", (), ())))
+    assert cache.load(sample_path).resolve("rule-leader").name == "Leader"
+    with open(cached, "rb") as f:
+        assert loads(f.read()).name == "Sample"
+
+
+def test_removed_by_another_process(tmp_path, monkeypatch, sample_path):
+    cache = Cache(str(tmp_path))
+    cached = cache._path(sample_path)
+    cache.load(sample_path)
+
+    def loads_then_remove(data):
+        root = loads(data)
+        os.remove(cached)
+        return root
+
+    monkeypatch.setattr(cache_module, "loads", loads_then_remove)
+    assert cache.load(sample_path).name == "Sample"
+    monkeypatch.undo()
+
+    cache.load(sample_path)
+    listed = cache._entries()
+    monkeypatch.setattr(Cache, "_entries", lambda self: listed)
+    cache.clear()
+    cache.max_size = 0
+    cache.evict()
+    cache.clear()
+    cache._invalidate(sample_path)
@@ -0,0 +1,56 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import battle_scribe_reader
+from battle_scribe_reader.__main__ import main
+
+
+def test_import_is_light():
+    # type: () -> None
+    code = (
+        "import sys, battle_scribe_reader.__main__;"
+        "print(' '.join(m for m in sys.modules if m.startswith(('xml', 'battle'))))"
+    )
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.path.dirname(os.path.dirname(battle_scribe_reader.__file__))
+    output = subprocess.run(
+        [sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True
+    ).stdout.split()
+    assert sorted(output) == ["battle_scribe_reader", "battle_scribe_reader.__main__"]
+
+
+def test_dump(capsys, sample_path):
+    # type: (pytest.CaptureFixture[str]) -> None
+    main(["dump", sample_path, "--depth", "1", "--type", "SelectionEntry"])
+    assert capsys.readouterr().out.split("\n")[1] == "   Captain [se-captain]"
+
+
+def test_query(capsys, sample_path):
+    # type: (pytest.CaptureFixture[str]) -> None
+    main(["query", sample_path, "selectionEntry[type=model]"])
+    assert capsys.readouterr().out.splitlines() == [
+        "SelectionEntry\tse-captain\tCaptain",
+        "SelectionEntry\tse-marine\tMarine",
+    ]
+
+
+def test_resolve(capsys, sample_path, data_dir):
+    # type: (pytest.CaptureFixture[str]) -> None
+    linked = os.path.join(data_dir, "linked.cat")
+    main(["resolve", linked, "il-frag", "--library", data_dir])
+    output = capsys.readouterr().out
+    assert "Frag Grenade [il-frag -> sp-frag]" in output
+    assert "-> SharedProfile" in output
+    with pytest.raises(SystemExit):
+        main(["resolve", sample_path, "missing"])
+
+
+def test_stats(capsys, sample_path):
+    # type: (pytest.CaptureFixture[str]) -> None
+    pytest.importorskip("numpy")
+    where = ["--where", "T>=4", "--where", "Save=3+"]
+    main(["stats", sample_path, "--type", "Unit", *where])
+    assert capsys.readouterr().out.splitlines()[0] == "se-captain\tp-captain\tCaptain"
@@ -0,0 +1,102 @@
+import importlib
+import os
+import types
+
+import pytest
+
+from battle_scribe_reader import generated, tree
+from battle_scribe_reader.codegen import SCHEMA, generate, missing, read_schema
+from battle_scribe_reader.fields import Attribute, boolean, field_names
+from battle_scribe_reader.linkable import walk
+from battle_scribe_reader.source import parse
+
+
+@pytest.fixture
+def schema():
+    return read_schema(SCHEMA)
+
+
+def test_read_schema(schema):
+    assert schema.roots == {"catalogue": "catalogue"}
+    entry = schema.types["selectionEntry"]
+    attributes = {a.name: a.type for a in entry.attributes}
+    # Inherited through two extensions, with the enumeration reduced.
+    assert attributes["hidden"] == "boolean"
+    assert attributes["type"] == "string"
+    assert attributes["page"] == "int"
+    assert [c.path for c in entry.children][-1] == ("costs", "cost")
+    condition = {a.name: a.type for a in schema.types["condition"].attributes}
+    assert condition["value"] == "decimal"
+    assert schema.types["rule"].texts == ("description",)
+
+
+def test_generate(tmp_path, monkeypatch, schema, sample_path):
+    (tmp_path / "generated_catalogue.py").write_text(generate(schema))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    generated = importlib.import_module("generated_catalogue")
+
+    root = generated.Catalogue(parse(sample_path))
+    assert root.revision == 3
+    assert [r.name for r in root.shared_rules] == ["Leader", "Bolter Drill"]
+    assert root.shared_rules[0].description.startswith("Friendly units")
+    assert root.selection_entries[0].costs[0].value == 80.0
+    assert type(root.shared_selection_entries[0]).__name__ == "SharedSelectionEntry"
+    assert generated.SelectionEntry._link_names() == (
+        tree.SelectionEntry._link_names()
+    )
+
+    # Every field reads the same, and converts to the same type, as the tree.
+    hand = tree.Root.load(sample_path)
+    for node in walk(root):
+        if node is root or node.xml.get("id") is None:
+            continue
+        other = hand.resolve(node.xml.get("id"))
+        for name in field_names(type(node)):
+            assert getattr(node, name) == getattr(other, name), name
+
+
+def test_generated_is_current(schema):
+    # Regenerate with ``python -m battle_scribe_reader.codegen -o ...``.
+    with open(generated.__file__, encoding="utf-8") as f:
+        assert generate(schema, os.path.basename(SCHEMA)) == f.read()
+    assert issubclass(tree.Root, generated.Catalogue)
+    assert issubclass(tree.SelectionEntry, generated.SelectionEntry)
+
+
+def test_generate_imports(tmp_path):
+    xsd = tmp_path / "plain.xsd"
+    xsd.write_text(
+        '<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema"'
+        ' targetNamespace="urn:plain">'
+        '<xs:element name="plain"><xs:complexType>'
+        '<xs:attribute name="id" type="xs:string"/>'
+        "</xs:complexType></xs:element>"
+        "</xs:schema>"
+    )
+    source = generate(read_schema(str(xsd)))
+    assert "from battle_scribe_reader.fields import Attribute\n" in source
+    assert "typing" not in source
+
+
+def test_missing(schema):
+    class CostType(tree.XMLLinkable):
+        PATH = f"{tree.BS}costTypes/{tree.BS}costType"
+
+        id = Attribute("id")
+        limit = Attribute("defaultCostLimit")
+        hidden = Attribute("hidden", boolean)
+
+    module = types.ModuleType("partial")
+    module.CostType = CostType
+    problems = missing(schema, module, {})
+    assert "catalogue: no class" in problems
+    assert "CostType: no field for 'name'" in problems
+    assert "CostType.limit: named default_cost_limit" in problems
+    assert "CostType.limit: converts to text, not float" in problems
+    assert not any(problem.startswith("CostType.hidden") for problem in problems)
+
+
+def test_shared_rules(sample_path):
+    root = tree.Root.load(sample_path)
+    assert [r.name for r in root.shared_rules] == ["Leader", "Bolter Drill"]
+    assert root.resolve("rule-leader").description.startswith("Friendly units")
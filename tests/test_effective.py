@@ -0,0 +1,67 @@
+from xml.etree.ElementTree import fromstring
+
+import pytest
+
+from battle_scribe_reader.effective import Expander
+from battle_scribe_reader.tree import Root
+
+
+def ids(nodes):
+    return [node.id for node in nodes]
+
+
+def test_expand(sample_path):
+    root = Root.load(sample_path)
+    expander = Expander(root)
+    captain, squad = expander.entries()
+
+    assert (squad.id, squad.entry.id, squad.name) == ("el-squad", "sse-squad", "Squad")
+    assert ids(squad.constraints) == ["c-squad-max"]
+    marine, bolter = squad.children
+    assert [m.field for m in marine.modifiers] == ["pts"]
+    assert ids(marine.constraints) == ["c-marine-min", "c-marine-max"]
+
+    [captain_bolter] = captain.children
+    assert ids(captain_bolter.constraints) == ["c-bolter-max"]
+    assert bolter.constraints == ()
+    assert ids(captain_bolter.profiles) == ids(bolter.profiles) == ["p-bolter"]
+    assert captain_bolter.children is bolter.children
+    assert expander.get("el-3").children is bolter.children
+
+    paths = [path for path, _ in squad.walk()]
+    assert paths == [
+        ("el-squad",),
+        ("el-squad", "se-marine"),
+        ("el-squad", "el-2"),
+    ]
+
+
+def test_memoized(sample_path):
+    root = Root.load(sample_path)
+    expander = Expander(root)
+    expander.entries()
+    count = len(expander)
+    assert expander.get("sse-squad") is expander.get("sse-squad")
+    assert expander.get("sseg-weapons").children[0].entry is root.resolve("sse-bolter")
+    assert len(expander) == count + 1
+
+
+def test_frozen(sample_path):
+    root = Root.load(sample_path)
+    captain, squad = Expander(root.freeze()).entries()
+    assert ids(captain.children[0].constraints) == ["c-bolter-max"]
+
+
+def test_cycle():
+    xml = fromstring(
+        '<catalogue xmlns="http://www.battlescribe.net/schema/catalogueSchema">'
+        "<entryLinks><entryLink id='l-a' targetId='a'/></entryLinks>"
+        "<sharedSelectionEntries>"
+        "<selectionEntry id='a'><entryLinks><entryLink id='l-b' targetId='b'/>"
+        "</entryLinks></selectionEntry>"
+        "<selectionEntry id='b'><entryLinks><entryLink id='l-c' targetId='a'/>"
+        "</entryLinks></selectionEntry>"
+        "</sharedSelectionEntries></catalogue>"
+    )
+    with pytest.raises(ValueError, match="a -> b -> a"):
+        Expander(Root(xml)).entries()
@@ -0,0 +1,38 @@
+import csv
+import os
+
+from battle_scribe_reader.export import (
+    ColumnarWriter,
+    DelimitedWriter,
+    export,
+    read_columnar,
+)
+
+
+def test_delimited(tmp_path, sample_path):
+    writer = DelimitedWriter(str(tmp_path), "\t")
+    assert export(sample_path, writer) == 3
+    assert sorted(os.listdir(tmp_path)) == ["Unit.tsv", "Weapon.tsv"]
+    with open(tmp_path / "Unit.tsv", newline="") as f:
+        assert list(csv.reader(f, delimiter="\t")) == [
+            ["id", "name", "owner", "M", "T", "W", "Save"],
+            ["p-captain", "Captain", "se-captain", '6"', "4", "5", "3+"],
+            ["sp-dreadnought", "Dreadnought", "", '6"', "7", "8", "3+"],
+        ]
+    with open(tmp_path / "Weapon.tsv", newline="") as f:
+        assert next(csv.reader(f, delimiter="\t")) == [
+            "id",
+            "name",
+            "owner",
+            "Range",
+            "S",
+        ]
+
+
+def test_columnar(tmp_path, sample_path):
+    path = str(tmp_path / "profiles.bst")
+    export(sample_path, ColumnarWriter(path))
+    tables = read_columnar(path)
+    assert tables["Unit"]["T"] == ("4", "7")
+    assert tables["Unit"]["owner"] == ("se-captain", None)
+    assert tables["Weapon"]["id"] == ("p-bolter",)
@@ -0,0 +1,45 @@
+import xml.etree.ElementTree
+
+import pytest
+
+from battle_scribe_reader.fields import Attribute, Field, Text, boolean, field_values
+
+
+class Node:
+    flag = Attribute("flag", boolean)
+    page = Attribute("page", int)
+    name = Attribute("name")
+    text = Text("text")
+
+    def __init__(self, source):
+        self.xml = xml.etree.ElementTree.fromstring(source)
+
+
+def test_convert_and_cache():
+    node = Node('<node flag="true" page="3" name=""><text>Hi</text></node>')
+    assert (node.flag, node.page, node.name, node.text) == (True, 3, "", "Hi")
+    assert vars(node)["page"] == 3
+    node.xml.set("page", "4")
+    assert node.page == 3
+
+
+def test_field_values():
+    node = Node('<node flag="false" page="3"><text>Hi</text></node>')
+    assert field_values(node) == {
+        "type": "Node",
+        "flag": False,
+        "page": 3,
+        "name": None,
+        "text": "Hi",
+    }
+
+
+def test_missing():
+    node = Node('<node page=""/>')
+    assert (node.flag, node.page, node.name, node.text) == (None, None, None, None)
+    assert isinstance(Node.page, Attribute)
+
+
+def test_abstract():
+    with pytest.raises(TypeError):
+        Field()
@@ -0,0 +1,42 @@
+import gc
+import weakref
+import xml.etree.ElementTree
+
+import pytest
+
+from battle_scribe_reader.frozen import Frozen, frozen_type
+from battle_scribe_reader.tree import Root, SelectionEntry
+
+
+def test_freeze_fields(sample_path):
+    frozen = Root(xml.etree.ElementTree.parse(sample_path).getroot()).freeze()
+    captain = frozen.selection_entries[0]
+    assert type(captain) is frozen_type(SelectionEntry)
+    assert (captain.name, captain.page, captain.hidden) == ("Captain", 12, False)
+    assert captain.profiles[0].characteristics[1].value == "4"
+    assert frozen.resolve("sse-squad").selection_entries[0].name == "Marine"
+    assert not hasattr(captain, "__dict__")
+
+
+def test_freeze_immutable(sample_path):
+    frozen = Root(xml.etree.ElementTree.parse(sample_path).getroot()).freeze()
+    with pytest.raises(AttributeError):
+        frozen.name = "Other"
+    assert isinstance(frozen.profile_types, tuple)
+
+
+def test_freeze_releases_elements(sample_path):
+    element = xml.etree.ElementTree.parse(sample_path).getroot()
+    root = Root(element)
+    ref = weakref.ref(root)
+    frozen = root.freeze()
+    del root, element
+    gc.collect()
+    assert ref() is None
+    assert isinstance(frozen, Frozen)
+
+
+def test_freeze_bad_value(catalogue):
+    catalogue.resolve("se-captain").xml.set("page", "12a")
+    with pytest.raises(ValueError):
+        catalogue.freeze()
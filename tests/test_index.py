@@ -0,0 +1,24 @@
+from battle_scribe_reader.linkable import walk
+from battle_scribe_reader.tree import CategoryEntry, EntryLink, SharedSelectionEntry
+
+
+def test_resolve_targets(catalogue):
+    squad = catalogue.entry_links[0]
+    assert isinstance(squad.target, SharedSelectionEntry)
+    assert squad.target is catalogue.shared_selection_entries[0]
+    captain = catalogue.selection_entries[0]
+    assert isinstance(captain.category_links[0].target, CategoryEntry)
+    assert catalogue.resolve("missing") is None
+
+
+def test_condition_child(catalogue):
+    marine = catalogue.resolve("se-marine")
+    condition = marine.modifiers[0].conditions[0]
+    assert condition.child is catalogue.resolve("sse-bolter")
+
+
+def test_index_matches_walk(catalogue):
+    links = [node for node in walk(catalogue) if isinstance(node, EntryLink)]
+    assert {link.target.id for link in links} == {"sse-squad", "sse-bolter"}
+    ids = {node.xml.get("id") for node in walk(catalogue)} - {None}
+    assert len(catalogue.index) == len(ids)
@@ -0,0 +1,58 @@
+from xml.etree.ElementTree import Element
+
+from battle_scribe_reader.cache import dumps, loads
+from battle_scribe_reader.library import Library
+from battle_scribe_reader.reload import Reloader
+from battle_scribe_reader.tree import BS, Root
+
+
+def test_headers(data_dir):
+    library = Library.open(data_dir)
+    assert sorted(library.headers) == ["cat-1", "cat-2", "gs-1"]
+    assert library.headers["gs-1"].game_system
+    assert library.headers["cat-2"].game_system_id == "gs-1"
+    assert library.loaded == []
+
+
+def test_lazy_resolve(data_dir):
+    library = Library.open(data_dir)
+    linked = library.find("Linked")
+    assert library.loaded == ["cat-2"]
+    assert library.dependencies(linked) == ["gs-1", "cat-1"]
+
+    [sergeant] = linked.selection_entries
+    profile = sergeant.info_links[0].target
+    assert profile.name == "Frag Grenade"
+    assert library.loaded == ["cat-2", "gs-1"]
+
+    bolter = sergeant.entry_links[0].target
+    assert bolter.root is library.get("cat-1")
+    assert library.loaded == ["cat-2", "gs-1", "cat-1"]
+    assert linked.resolve("missing") is None
+
+
+def test_shared_game_system(data_dir):
+    library = Library.open(data_dir)
+    sample = library.get("cat-1")
+    system = sample.resolve("sp-frag").root
+    assert library.get("cat-2").resolve("pts").root is system
+    assert sample.resolve("se-captain").root is sample
+
+
+def test_library_attribute(data_dir):
+    library = Library.open(data_dir)
+    assert library.get("cat-1").library is None
+    root = Root(Element(f"{BS}catalogue", {"library": "true"}), library)
+    assert root.library is True
+
+
+def test_reload_keeps_library(data_dir):
+    library = Library.open(data_dir)
+    linked = library.get("cat-2")
+    Reloader(linked, library.headers["cat-2"].path).reload(force=True)
+    assert linked.resolve("sp-frag").name == "Frag Grenade"
+
+
+def test_freeze_leaves_library_out(data_dir):
+    frozen = Library.open(data_dir).get("cat-1").freeze()
+    assert str(loads(dumps(frozen))) == str(frozen)
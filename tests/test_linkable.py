@@ -0,0 +1,29 @@
+import inspect
+import xml.etree.ElementTree
+
+import pytest
+
+from battle_scribe_reader.linkable import Link, Linkable
+from battle_scribe_reader.tree import Profile, Root, SelectionEntry
+
+
+def test_links_are_descriptors():
+    assert not hasattr(Linkable, "__getattr__")
+    assert isinstance(inspect.getattr_static(SelectionEntry, "profiles"), Link)
+    assert SelectionEntry._link_schema() is SelectionEntry._link_schema()
+
+
+def test_links_cached_on_instance(sample_path):
+    root = Root(xml.etree.ElementTree.parse(sample_path).getroot())
+    entries = root.selection_entries
+    assert "selection_entries" in vars(root)
+    assert root.selection_entries is entries
+    assert [type(p) for p in entries[0].profiles] == [Profile]
+    assert sorted(root.get_lists()) == sorted(Root._link_names())
+
+
+def test_non_links_raise():
+    with pytest.raises(AttributeError):
+        Root.PATH
+    with pytest.raises(AttributeError):
+        Root.__new__(Root).xml
@@ -0,0 +1,73 @@
+from types import SimpleNamespace
+
+import pytest
+
+from battle_scribe_reader.frozen import frozen_type
+from battle_scribe_reader.modifiers import (
+    Context,
+    Engine,
+    compile_condition,
+    compile_modifier,
+)
+from battle_scribe_reader.tree import Condition, Modifier, Root
+
+
+class Counts(Context):
+    def __init__(self, counts):
+        self.counts = counts
+        self.queries = []
+
+    def count(self, query):
+        self.queries.append(query)
+        return self.counts.get(query.child_id, 0)
+
+    def instance_of(self, query):
+        return False
+
+
+def test_modifier_repeats(sample_path):
+    marine = Root.load(sample_path).resolve("se-marine")
+    engine = Engine()
+    assert engine.apply(marine, "pts", 15.0, Counts({})) == 15.0
+    assert engine.apply(marine, "pts", 15.0, Counts({"sse-bolter": 2})) == 25.0
+    assert engine.compile(marine.modifiers[0]) is engine.compile(marine.modifiers[0])
+    assert engine.apply(marine, "name", "Marine", Counts({})) == "Marine"
+
+
+def test_frozen_modifier(sample_path):
+    marine = Root.load(sample_path).freeze().resolve("se-marine")
+    context = Counts({"sse-bolter": 1})
+    assert Engine().apply(marine, "pts", 15.0, context) == 20.0
+    assert {q.scope for q in context.queries} == {"parent"}
+
+
+def test_condition_types(sample_path):
+    condition = Root.load(sample_path).resolve("se-marine").modifiers[0].conditions[0]
+    assert compile_condition(condition)(Counts({"sse-bolter": 1}))
+    assert not compile_condition(condition)(Counts({}))
+    fields = {k: getattr(condition, k) for k in frozen_type(Condition)._fields}
+    with pytest.raises(ValueError):
+        compile_condition(SimpleNamespace(**dict(fields, type="sometimes")))
+
+
+def test_append():
+    fields = {k: None for k in frozen_type(Modifier)._fields}
+    modifier = SimpleNamespace(
+        **dict(fields, type="append", field="name", value="(Veteran)"),
+        conditions=(),
+        condition_groups=(),
+        repeats=(),
+    )
+    apply = compile_modifier(modifier).apply
+    assert apply(Counts({}), "Marine") == "Marine (Veteran)"
+    assert apply(Counts({}), "") == "(Veteran)"
+    assert apply(Counts({}), None) == "(Veteran)"
+
+
+def test_context_abstract():
+    class Partial(Context):
+        def count(self, query):
+            return 0
+
+    with pytest.raises(TypeError):
+        Partial()
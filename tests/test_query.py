@@ -0,0 +1,46 @@
+import pytest
+
+from battle_scribe_reader.query import compile
+from battle_scribe_reader.tree import Profile, Root
+
+
+def ids(nodes):
+    return [node.id for node in nodes]
+
+
+def test_query(sample_path):
+    root = Root.load(sample_path)
+    [profile] = root.query("selectionEntry[type=model] profile[profileTypeName=Unit]")
+    assert isinstance(profile, Profile)
+    assert profile is root.selection_entries[0].profiles[0]
+
+    assert ids(root.query("selectionEntry")) == [
+        "se-captain",
+        "sse-squad",
+        "se-marine",
+        "sse-bolter",
+    ]
+    assert ids(root.query("selectionEntry > entryLink")) == ["el-1", "el-2"]
+    assert ids(root.query("catalogue > entryLink, selectionEntry > entryLink")) == [
+        "el-1",
+        "el-squad",
+        "el-2",
+    ]
+    assert ids(root.query("selectionEntry[type=unit] constraint[type]")) == [
+        "c-squad-max",
+        "c-marine-min",
+        "c-marine-max",
+    ]
+    assert ids(root.query("[id^=c-marine][type!=min]")) == ["c-marine-max"]
+    assert ids(root.query("entryLink[targetId='sse-bolter'] constraint")) == [
+        "c-bolter-max"
+    ]
+    assert root.query("profile[profileTypeName=Vehicle]") == []
+
+
+def test_compile_once():
+    assert compile("selectionEntry profile") is compile("selectionEntry profile")
+    with pytest.raises(ValueError):
+        compile("selectionEntry >")
+    with pytest.raises(ValueError):
+        compile("profile[name")
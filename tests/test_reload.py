@@ -0,0 +1,91 @@
+import os
+import shutil
+
+from battle_scribe_reader.reload import Reloader, Watcher
+
+
+def edit(path, *replacements):
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    for old, new in replacements:
+        assert old in text
+        text = text.replace(old, new)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+
+def test_reload(tmp_path, sample_path):
+    path = str(tmp_path / "sample.cat")
+    shutil.copy(sample_path, path)
+    reloader = Reloader.load(path)
+    root = reloader.root
+    captain = root.resolve("se-captain")
+    squad, bolter = root.shared_selection_entries
+    marine = root.resolve("se-marine")
+    assert reloader.reload() is None
+
+    edit(
+        path,
+        ('name="Sample"', 'name="Edited"'),
+        ('value="2.0"', 'value="3.0"'),
+        (
+            '<entryLinks>\n    <entryLink id="el-squad"',
+            '<entryLinks>\n    <entryLink id="el-new" targetId="sse-bolter"/>\n'
+            '    <entryLink id="el-squad"',
+        ),
+    )
+    changes = reloader.reload()
+    assert changes.added == ["el-new"]
+    assert changes.changed == ["sse-bolter"]
+    assert changes.removed == []
+
+    assert root.name == "Edited"
+    assert root.resolve("se-captain") is captain
+    assert root.shared_selection_entries[0] is squad
+    assert root.resolve("se-marine") is marine
+    new_bolter = root.resolve("sse-bolter")
+    assert new_bolter is not bolter
+    assert new_bolter.costs[0].value == 3.0
+    assert root.resolve("el-new").target is new_bolter
+    assert root.xml.find(".//*[@id='se-captain']") is captain.xml
+    assert [link.id for link in root.query("catalogue > entryLink")] == [
+        "el-new",
+        "el-squad",
+    ]
+
+
+def test_removed_and_unchanged(tmp_path, sample_path):
+    path = str(tmp_path / "sample.cat")
+    shutil.copy(sample_path, path)
+    reloader = Reloader.load(path)
+    root = reloader.root
+    root.index
+    os.utime(path, ns=(0, 0))
+    assert reloader.reload() is None
+
+    edit(path, ('<entryLink id="el-squad"', '<entryLink id="el-gone"'))
+    changes = reloader.reload()
+    assert (changes.added, changes.removed) == (["el-gone"], ["el-squad"])
+    assert root.resolve("el-squad") is None
+    assert root.resolve("el-gone").target is root.resolve("sse-squad")
+
+
+def test_watcher(tmp_path, sample_path):
+    path = str(tmp_path / "sample.cat")
+    shutil.copy(sample_path, path)
+    reloader = Reloader.load(path)
+    seen = []
+    watcher = Watcher([reloader], callback=lambda r, changes: seen.append(changes))
+
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("<broken")
+    watcher.poll()
+    assert seen == []
+
+    shutil.copy(sample_path, path)
+    edit(path, ('id="sse-bolter" name="Bolter"', 'id="sse-bolter" name="Boltgun"'))
+    watcher.poll()
+    [changes] = seen
+    assert changes.changed == ["sse-bolter"]
@@ -0,0 +1,34 @@
+import io
+import re
+
+from battle_scribe_reader.render import render
+from battle_scribe_reader.tree import Characteristic, Root
+
+
+def test_str_matches_render(sample_path):
+    root = Root.load(sample_path)
+    stream = io.StringIO()
+    render(root, stream)
+    assert stream.getvalue() == str(root) + "\n"
+    assert str(root.freeze()) == str(root)
+
+
+def test_depth(sample_path):
+    stream = io.StringIO()
+    render(Root.load(sample_path), stream, depth=1)
+    lines = stream.getvalue().splitlines()
+    assert lines[:3] == [
+        "Sample - cat-1",
+        "  ProfileType[    :  ]()",
+        "   Unit [pt-unit]",
+    ]
+    assert not any(re.match(r" {4}\w+\[", line) for line in lines)
+
+
+def test_types(sample_path):
+    stream = io.StringIO()
+    render(Root.load(sample_path), stream, types=[Characteristic, "Cost"])
+    lines = stream.getvalue().splitlines()
+    assert lines[0].strip() == "Characteristic[    :  ](characteristic=ct-m)"
+    assert lines[1].strip() == 'M = 6"'
+    assert len(lines) == 2 * (10 + 4)
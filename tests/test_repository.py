@@ -0,0 +1,26 @@
+import os
+import shutil
+
+from battle_scribe_reader.repository import find, load_repository
+
+
+def test_load_repository(tmp_path, sample_path):
+    for name in ("a.cat", "b.cat", "c.gst"):
+        shutil.copy(sample_path, str(tmp_path / name))
+    (tmp_path / "broken.cat").write_text("<catalogue>")
+    (tmp_path / "notes.txt").write_text("")
+    paths = find(str(tmp_path))
+    assert [os.path.basename(p) for p in paths] == [
+        "a.cat",
+        "b.cat",
+        "broken.cat",
+        "c.gst",
+    ]
+
+    results = load_repository(str(tmp_path), workers=2)
+    assert [r.path for r in results] == paths
+    assert [r.error is None for r in results] == [True, True, False, True]
+    assert results[0].root.resolve("se-captain").page == 12
+
+    unordered = load_repository(str(tmp_path), workers=2, ordered=False)
+    assert sorted(r.path for r in unordered) == paths
@@ -0,0 +1,78 @@
+import pytest
+
+from battle_scribe_reader.modifiers import Engine, Query
+from battle_scribe_reader.roster import Force, RosterContext, Selection
+
+
+def test_load(roster, catalogue):
+    assert roster.totals == {"pts": 161.0}
+    force = roster.children[0]
+    squad = force.children[1]
+    assert squad.entry is catalogue.resolve("sse-squad")
+    assert squad.totals == {"pts": 79.0}
+    assert squad.children[0].unit_costs == {"pts": 15.0}
+
+
+def test_incremental(roster, catalogue):
+    force = roster.children[0]
+    captain, squad = force.children
+    marines = squad.children[0]
+
+    marines.set_number(10)
+    assert (marines.totals, squad.totals) == ({"pts": 150.0}, {"pts": 154.0})
+    assert captain.totals == {"pts": 82.0}
+    assert roster.totals == {"pts": 236.0}
+
+    bolter = captain.add(Selection.from_entry(catalogue.resolve("sse-bolter"), 3))
+    assert captain.totals == {"pts": 88.0}
+    assert roster.totals == {"pts": 242.0}
+
+    force.remove(squad)
+    assert roster.totals == {"pts": 88.0}
+    captain.remove(bolter)
+    assert roster.totals == {"pts": 82.0}
+    with pytest.raises(ValueError):
+        force.add(captain)
+
+
+def query(scope, child_id, field="selections", children=False, **flags):
+    return Query(
+        scope,
+        child_id,
+        field,
+        children,
+        flags.get("forces", False),
+        flags.get("shared", True),
+        flags.get("percent", False),
+    )
+
+
+def test_context(roster, catalogue):
+    force = roster.children[0]
+    captain, squad = force.children
+    marines, bolters = squad.children
+    context = RosterContext(marines)
+    assert Engine().apply(marines.entry, "pts", 15.0, context) == 25.0
+    assert context.count(query("parent", "sse-bolter")) == 2
+    assert context.count(query("force", "sse-squad")) == 1
+    assert context.count(query("force", "se-marine")) == 0
+    assert context.count(query("force", "se-marine", children=True)) == 5
+    assert context.count(query("roster", "model", children=True)) == 6
+    assert context.count(query("force", "cat-hq")) == 1
+    assert context.count(query("sse-squad", "se-marine", children=True)) == 5
+    assert context.count(query("parent", None, "pts", True)) == 79.0
+    percent = context.count(query("parent", "se-marine", "pts", True, percent=True))
+    assert percent == pytest.approx(100 * 75 / 79)
+    assert context.count(query("missing", "se-marine")) == 0
+
+    assert context.instance_of(query("self", "se-marine"))
+    assert context.instance_of(query("parent", "sse-squad"))
+    assert context.instance_of(query("force", "force-1"))
+    assert not context.instance_of(query("parent", "se-captain"))
+    with pytest.raises(ValueError):
+        context.count(query("parent", "sse-bolter", shared=False))
+
+    child = force.add(Force("force-2"))
+    child.add(Selection.from_entry(catalogue.resolve("se-captain")))
+    assert context.count(query("roster", "se-captain", children=True)) == 1
+    assert context.count(query("roster", "se-captain", children=True, forces=True)) == 2
@@ -0,0 +1,56 @@
+from xml.etree.ElementTree import fromstring
+
+from battle_scribe_reader.search import SearchIndex
+from battle_scribe_reader.tree import Root
+
+RULES = fromstring(
+    '<catalogue xmlns="http://www.battlescribe.net/schema/catalogueSchema">'
+    "<selectionEntries><selectionEntry id='se-1' name='Chaplain'><rules>"
+    "<rule id='r-1' name='Litany of Hate'>"
+    "<description>Re-roll wound rolls when this unit fights.</description></rule>"
+    "<rule id='r-2' name='Spiritual Leader'>"
+    "<description>Friendly units within 6 inches use this unit's Leadership."
+    " Re-roll failed Morale tests.</description></rule>"
+    "<rule id='r-3' name='Zealot'>"
+    "<description>Re-roll hit rolls. Re-roll wound rolls. Re-roll wound rolls."
+    "</description></rule>"
+    "</rules></selectionEntry></selectionEntries></catalogue>"
+)
+
+
+def test_terms(sample_path):
+    index = SearchIndex.build(Root.load(sample_path))
+    assert [hit.id for hit in index.search("bolter")] == [
+        "sse-bolter",
+        "rule-bolter-drill",
+        "p-bolter",
+    ]
+    assert [hit.id for hit in index.search("captain")] == ["se-captain", "p-captain"]
+    [hit] = index.search("dreadnought")
+    assert (hit.id, hit.type, hit.name) == (
+        "sp-dreadnought",
+        "SharedProfile",
+        "Dreadnought",
+    )
+    [hit] = index.search("leader")
+    assert (hit.id, hit.type, hit.name) == ("rule-leader", "SharedRule", "Leader")
+    assert index.search("nothing") == []
+
+
+def test_ranking_and_phrases():
+    index = SearchIndex.build(Root(RULES))
+    assert [hit.id for hit in index.search("wound")] == ["r-3", "r-1"]
+    assert [hit.id for hit in index.search('"re-roll failed"')] == ["r-2"]
+    assert [hit.id for hit in index.search('"rolls re roll" hit')] == ["r-3"]
+    assert index.search('"failed re-roll"') == []
+    # Fields are kept apart, so phrases can't run from a name into the text.
+    assert index.search('"hate re-roll"') == []
+
+
+def test_save_load(tmp_path):
+    index = SearchIndex.build(Root(RULES))
+    path = str(tmp_path / "rules.bsi")
+    index.save(path)
+    loaded = SearchIndex.load(path)
+    assert loaded.search("re-roll") == index.search("re-roll")
+    assert len(loaded) == len(index) == 4
@@ -0,0 +1,115 @@
+import contextlib
+import json
+import os
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.error import HTTPError
+from urllib.parse import quote
+from urllib.request import urlopen
+
+import pytest
+
+from battle_scribe_reader import serve
+from battle_scribe_reader.serve import NotFound, Roots, make_server
+from battle_scribe_reader.tree import Root
+
+
+@contextlib.contextmanager
+def running(paths):
+    server = make_server(paths, port=0, size=1, quiet=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def server(data_dir):
+    with running([data_dir]) as server:
+        yield server
+
+
+def get(server, path):
+    with urlopen(f"http://127.0.0.1:{server.server_address[1]}{path}") as response:
+        return json.load(response)
+
+
+def test_endpoints(server):
+    assert {c["id"] for c in get(server, "/catalogues")} == {"cat-1", "cat-2", "gs-1"}
+    assert get(server, "/entries?catalogue=Sample&type=unit") == [
+        {"id": "sse-squad", "name": "Squad", "type": "unit", "hidden": False}
+    ]
+    [captain] = get(server, "/profiles?catalogue=cat-1&type=Unit")[:1]
+    assert captain["characteristics"]["Save"] == "3+"
+    link = get(server, "/resolve?catalogue=sample&id=el-1")
+    assert link["target"]["id"] == "sse-bolter"
+    assert link["constraints"][0]["id"] == "c-bolter-max"
+    links = get(server, "/query?catalogue=cat-1&selector=entryLink")
+    assert [link["id"] for link in links] == ["el-1", "el-squad", "el-2", "el-3"]
+
+    with pytest.raises(HTTPError) as error:
+        get(server, "/resolve?catalogue=cat-1&id=missing")
+    assert error.value.code == 404
+    with pytest.raises(HTTPError) as error:
+        get(server, "/entries")
+    assert error.value.code == 400
+
+    metrics = get(server, "/metrics")
+    assert metrics["cache"]["misses"] == 1
+    assert metrics["cache"]["hits"] >= 4
+    assert metrics["endpoints"]["/resolve"]["count"] == 2
+    assert metrics["endpoints"]["/resolve"]["errors"] == 1
+
+
+@pytest.mark.parametrize("name", ["Éclair", "Back\\slash", 'Say "hi"'])
+def test_filter_values(tmp_path, sample_path, name):
+    path = str(tmp_path / "sample.cat")
+    shutil.copy(sample_path, path)
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    value = name.replace("&", "&amp;").replace('"', "&quot;")
+    text = text.replace('name="Captain"', f'name="{value} Captain"', 1)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+    with running([path]) as server:
+        entries = get(server, f"/entries?catalogue=Sample&name={quote(name)}")
+        assert [entry["name"] for entry in entries] == [f"{name} Captain"]
+        entries = get(server, f"/entries?catalogue=Sample&type={quote(name)}")
+        assert entries == []
+
+
+def test_internal_error(server, monkeypatch):
+    def broken(server, query):
+        # A bug, not a missing node: it mustn't be answered with a 404.
+        return {}["missing"]
+
+    monkeypatch.setitem(serve.ROUTES, "/broken", broken)
+    with pytest.raises(HTTPError) as error:
+        get(server, "/broken")
+    assert error.value.code == 500
+    assert json.load(error.value) == {"error": "internal error: KeyError"}
+    assert get(server, "/metrics")["endpoints"]["/broken"]["errors"] == 1
+
+
+def test_lru(data_dir):
+    loads = []
+
+    def loader(path):
+        loads.append(os.path.basename(path))
+        return Root.load(path)
+
+    paths = [os.path.join(data_dir, name) for name in ("sample.cat", "linked.cat")]
+    roots = Roots(paths, 1, loader)
+    with ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(roots.get, ["cat-1"] * 16))
+    assert len({id(root) for root in results}) == 1
+    roots.get("linked")
+    roots.get("Sample")
+    assert loads == ["sample.cat", "linked.cat", "sample.cat"]
+    assert roots.stats()["loaded"] == ["cat-1"]
+    with pytest.raises(NotFound):
+        roots.get("missing")
@@ -0,0 +1,73 @@
+import hashlib
+import os
+import zipfile
+
+import pytest
+
+from battle_scribe_reader.source import (
+    CATALOGUE,
+    GAME_SYSTEM,
+    ZIPPED,
+    file_digest,
+    write_atomic,
+)
+from battle_scribe_reader.tree import Root
+
+
+def zipped(tmp_path, name, text, others=()):
+    path = str(tmp_path / name)
+    stem, ext = os.path.splitext(name)
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        for other, other_text in others:
+            archive.writestr(other, other_text)
+        archive.writestr(stem + ZIPPED[ext.lower()], text)
+    return path
+
+
+def test_load_catz(tmp_path, sample_path):
+    with open(sample_path) as f:
+        path = zipped(tmp_path, "sample.catz", f.read())
+    root = Root.load(path)
+    assert root.name == "Sample"
+    assert root.resolve("sse-bolter").name == "Bolter"
+    assert len(list(Root.stream(path))) == 12
+
+
+def test_load_catz_members(tmp_path, sample_path):
+    with open(sample_path) as f:
+        text = f.read()
+    path = zipped(tmp_path, "sample.catz", text, [("readme.txt", "Read me")])
+    assert Root.load(path).name == "Sample"
+    path = zipped(tmp_path, "two.catz", text, [("other.cat", text)])
+    with pytest.raises(ValueError):
+        Root.load(path)
+
+
+def test_game_system_namespace(tmp_path, sample_path):
+    with open(sample_path) as f:
+        text = f.read().replace(CATALOGUE[1:-1], GAME_SYSTEM[1:-1])
+    text = text.replace("<catalogue ", "<gameSystem ")
+    text = text.replace("</catalogue>", "</gameSystem>")
+    path = zipped(tmp_path, "sample.gstz", text)
+    assert [p.name for p in Root.load(path).shared_profiles] == ["Dreadnought"]
+    assert len(list(Root.stream(path))) == 12
+
+
+def test_stream_links(sample_path):
+    links = [
+        (node.target_id, node.target)
+        for node in Root.stream(sample_path)
+        if type(node).__name__ == "EntryLink"
+    ]
+    assert links == [("sse-squad", None)]
+    assert Root.load(sample_path).resolve("sse-squad").name == "Squad"
+
+
+def test_write_atomic(tmp_path):
+    path = str(tmp_path / "out.bin")
+    write_atomic(path, b"first")
+    write_atomic(path, b"second")
+    with open(path, "rb") as f:
+        assert f.read() == b"second"
+    assert os.listdir(tmp_path) == ["out.bin"]
+    assert file_digest(path) == hashlib.sha256(b"second").hexdigest()
@@ -0,0 +1,36 @@
+import os
+
+import pytest
+
+numpy = pytest.importorskip("numpy")
+
+from battle_scribe_reader.stats import load_stats, parse_column  # noqa: E402
+
+
+def test_parse_column():
+    column = parse_column(['6"', "3+", "D6", "-", None, "12"])
+    assert column.dtype == numpy.int64
+    assert column.mask.tolist() == [False, True, True, True, True, False]
+    assert column.compressed().tolist() == [6, 12]
+    assert parse_column(["1.5", "2"]).dtype == numpy.float64
+
+
+def test_load_stats(data_dir):
+    paths = [os.path.join(data_dir, name) for name in ("sample.cat", "sample.gst")]
+    stats = load_stats(paths)
+    assert sorted(stats) == ["Unit", "Weapon"]
+    units = stats["Unit"]
+    assert len(units) == 2
+    assert units["T"].tolist() == [4, 7]
+    assert units["Save"].mask.all()
+    assert units.text["Save"].tolist() == ["3+", "3+"]
+    assert units.select((units["T"] >= 5) & (units["W"] >= 4)) == [
+        (None, "sp-dreadnought", "Dreadnought")
+    ]
+    assert units.select(units["Save"] <= 3) == []
+
+    weapons = stats["Weapon"]
+    assert weapons.ids.tolist() == ["p-bolter", "sp-frag"]
+    assert weapons["Range"].tolist() == [24, 6]
+    assert weapons["S"].mask.tolist() == [False, True]
+    assert weapons.owners.tolist() == ["sse-bolter", None]
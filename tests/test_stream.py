@@ -0,0 +1,38 @@
+from battle_scribe_reader.tree import (
+    CategoryEntry,
+    EntryLink,
+    ForceEntry,
+    ProfileType,
+    Root,
+    SelectionEntry,
+    SharedProfile,
+    SharedRule,
+    SharedSelectionEntry,
+    SharedSelectionEntryGroups,
+)
+
+
+def test_stream_types(sample_path):
+    assert [type(node) for node in Root.stream(sample_path)] == [
+        ProfileType,
+        CategoryEntry,
+        CategoryEntry,
+        ForceEntry,
+        SelectionEntry,
+        EntryLink,
+        SharedSelectionEntry,
+        SharedSelectionEntry,
+        SharedSelectionEntryGroups,
+        SharedRule,
+        SharedRule,
+        SharedProfile,
+    ]
+
+
+def test_stream_clears_previous(sample_path):
+    nodes = []
+    for node in Root.stream(sample_path):
+        assert node.name
+        assert len(node.xml) or node.xml.attrib
+        nodes.append(node)
+    assert all(not node.xml.attrib and not len(node.xml) for node in nodes)
@@ -0,0 +1,74 @@
+import pytest
+
+from battle_scribe_reader.roster import Selection
+from battle_scribe_reader.validate import Validator
+
+
+@pytest.fixture
+def validator(roster, catalogue):
+    return Validator(roster, catalogue)
+
+
+def ids(validator):
+    return sorted(v.constraint.id for v in validator.errors())
+
+
+def test_valid(validator):
+    assert validator.errors() == []
+    assert validator.validate() == []
+
+
+def test_set_number(roster, validator):
+    squad = roster.children[0].children[1]
+    marines = squad.children[0]
+
+    marines.set_number(3)
+    [violation] = validator.errors()
+    assert violation.constraint.id == "c-marine-min"
+    assert (violation.scope, violation.value, violation.limit) == (squad, 3, 5.0)
+
+    marines.set_number(11)
+    assert ids(validator) == ["c-marine-max"]
+    marines.set_number(10)
+    assert validator.errors() == []
+
+
+def test_add_remove(roster, catalogue, validator):
+    captain = roster.children[0].children[0]
+    bolter = Selection(
+        "se-captain::el-1::sse-bolter", 1, {"pts": 2.0}, catalogue.resolve("sse-bolter")
+    )
+    captain.add(bolter)
+    assert ids(validator) == ["c-bolter-max"]
+    captain.remove(bolter)
+    assert validator.errors() == []
+
+
+def test_matches_full_validation(roster, catalogue, validator):
+    force = roster.children[0]
+    squad = force.children[1]
+    squad.children[0].set_number(12)
+    force.remove(squad)
+    force.add(squad)
+    assert ids(validator) == ["c-marine-max"]
+    assert ids(Validator(roster, catalogue)) == ids(validator)
+
+
+def test_remove_all(roster, catalogue, validator):
+    squad = roster.children[0].children[1]
+    marines = squad.children[0]
+    squad.remove(marines)
+    [violation] = validator.errors()
+    assert violation.constraint.id == "c-marine-min"
+    assert (violation.scope, violation.value, violation.limit) == (squad, 0, 5.0)
+    assert ids(Validator(roster, catalogue)) == ["c-marine-min"]
+    squad.add(marines)
+    assert validator.errors() == []
+
+
+def test_unsupported(roster, catalogue):
+    constraint = catalogue.resolve("sse-squad").constraints[0]
+    constraint.xml.set("percentValue", "true")
+    validator = Validator(roster, catalogue)
+    assert list(validator.unsupported) == ["c-squad-max"]
+    assert validator.errors() == []